@@ -1,10 +1,16 @@
 import datetime
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
 from typing import Literal
 
+import numpy as np
 from pydantic_settings import BaseSettings
 
+from altk_evolve.backend.search_cache import SemanticSearchCache
 from altk_evolve.hooks.manager import (
     MemoryPolicyViolation,
     dispatch_memory_post_read,
@@ -23,6 +29,12 @@ from altk_evolve.utils.utils import serialize_content
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("entities-db")
 
+# Concurrent per-namespace reads in the default get_entities_batch implementation.
+_BATCH_MAX_WORKERS = 16
+
+# Query embeddings kept per backend; an entry is one vector (~1.5 KB for MiniLM).
+_QUERY_EMBEDDING_CACHE_SIZE = 1024
+
 
 class BaseEntityBackend(ABC):
     def __init__(self, config: BaseSettings | None = None):
@@ -43,6 +55,10 @@ class BaseEntityBackend(ABC):
     def create_namespace(self, namespace_id: str | None = None) -> Namespace:
         pass
 
+    def create_namespaces(self, namespace_ids: list[str]) -> list[Namespace]:
+        """Create several namespaces. Backends with a batched registry insert override this."""
+        return [self.create_namespace(namespace_id) for namespace_id in namespace_ids]
+
     @abstractmethod
     def get_namespace_details(self, namespace_id: str) -> Namespace:
         pass
@@ -51,6 +67,10 @@ class BaseEntityBackend(ABC):
     def search_namespaces(self, limit: int = 10) -> list[Namespace]:
         pass
 
+    def search_namespaces_lite(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Return ``(namespace_id, num_entities)`` pairs; backends override this when counts are cheaper than full namespaces."""
+        return [(namespace.id, namespace.num_entities or 0) for namespace in self.search_namespaces(limit)]
+
     # ── hook-wrapped template methods ────────────────────────────────
     #
     # The public methods below are template methods: they fire the memory
@@ -60,7 +80,10 @@ class BaseEntityBackend(ABC):
     def delete_namespace(self, namespace_id: str):
         """Delete a namespace. Fires memory_pre_namespace_delete; do not override — override _delete_namespace_impl."""
         dispatch_memory_pre_namespace_delete(self, namespace_id)
-        self._delete_namespace_impl(namespace_id)
+        try:
+            self._delete_namespace_impl(namespace_id)
+        finally:
+            self.search_cache.invalidate(namespace_id)
 
     @abstractmethod
     def _delete_namespace_impl(self, namespace_id: str):
@@ -75,15 +98,124 @@ class BaseEntityBackend(ABC):
         read-before-merge) call ``_search_entities_impl`` directly and never
         fire the hook. Do not override — override _search_entities_impl.
         """
-        results = self._search_entities_impl(namespace_id, query, filters, limit)
+        results = self._cached_search_entities(namespace_id, query, filters, limit)
         return dispatch_memory_post_read(self, namespace_id, results, query=query, filters=filters)
 
+    @property
+    def search_cache(self) -> SemanticSearchCache:
+        cache = self.__dict__.get("_search_cache")
+        if cache is None:
+            cache = self.__dict__["_search_cache"] = SemanticSearchCache.from_settings()
+        return cache
+
+    def _embed_query(self, query: str) -> np.ndarray | None:
+        """Embed a search query. Backends without embeddings return None, which also disables the search cache."""
+        return None
+
+    def _query_embedding(self, query: str) -> np.ndarray | None:
+        """``_embed_query`` memoized in a small LRU keyed by the query text.
+
+        The cache lookup and the search share one encode, and a repeated query
+        skips the embedding model even after a write has emptied the search cache
+        (embeddings depend only on the text).
+        """
+        # setdefault is atomic, so concurrent first calls agree on one LRU and lock.
+        embeddings: OrderedDict[str, np.ndarray | None] = self.__dict__.setdefault("_query_embeddings", OrderedDict())
+        lock: threading.Lock = self.__dict__.setdefault("_query_embeddings_lock", threading.Lock())
+        with lock:
+            if query in embeddings:
+                embeddings.move_to_end(query)
+                return embeddings[query]
+        embedding = self._embed_query(query)
+        with lock:
+            embeddings[query] = embedding
+            while len(embeddings) > _QUERY_EMBEDDING_CACHE_SIZE:
+                embeddings.popitem(last=False)
+        return embedding
+
+    def _cached_search_entities(self, namespace_id: str, query: str | None, filters: dict | None, limit: int) -> list[RecordedEntity]:
+        cache = self.search_cache
+        if not cache.enabled or (query is None and not cache.listings):
+            return self._search_entities_impl(namespace_id, query, filters, limit)
+        cached = cache.get(namespace_id, query, filters, limit)
+        if cached is not None:
+            return cached
+        if query is None:
+            # Listings are deterministic between this process's writes, which invalidate the namespace.
+            results = self._search_entities_impl(namespace_id, query, filters, limit)
+            cache.put(namespace_id, query, filters, limit, results)
+            return results
+        embedding = self._query_embedding(query)
+        if embedding is None:
+            return self._search_entities_impl(namespace_id, query, filters, limit)
+        cached = cache.get(namespace_id, query, filters, limit, embedding=embedding)
+        if cached is not None:
+            return cached
+        results = self._search_entities_impl(namespace_id, query, filters, limit)
+        cache.put(namespace_id, query, filters, limit, results, embedding=embedding)
+        return results
+
     @abstractmethod
     def _search_entities_impl(
         self, namespace_id: str, query: str | None = None, filters: dict | None = None, limit: int = 10
     ) -> list[RecordedEntity]:
         pass
 
+    def iter_entities(
+        self, namespace_id: str, filters: dict | None = None, limit: int = 100, page_size: int = 100
+    ) -> Iterator[list[RecordedEntity]]:
+        """Yield up to ``limit`` entities in pages of at most ``page_size`` (public API read).
+
+        Each page fires memory_post_read, exactly like ``search_entities``.
+        Do not override — override _iter_entities_impl.
+        """
+        for page in self._iter_entities_impl(namespace_id, filters, limit, page_size):
+            yield dispatch_memory_post_read(self, namespace_id, page, query=None, filters=filters)
+
+    def _iter_entities_impl(self, namespace_id: str, filters: dict | None, limit: int, page_size: int) -> Iterator[list[RecordedEntity]]:
+        """Default implementation: one ``_search_entities_impl`` call, re-chunked into pages.
+
+        Backends with a native cursor/iterator should override this so large
+        listings are fetched incrementally instead of materialized up front.
+        """
+        results = self._search_entities_impl(namespace_id, query=None, filters=filters, limit=limit)
+        for start in range(0, len(results), max(1, page_size)):
+            yield results[start : start + page_size]
+
+    def get_entities_batch(self, namespace_ids: list[str], limit_per: int = 10) -> dict[str, list[RecordedEntity]]:
+        """Fetch up to ``limit_per`` entities from each namespace (public API read), keyed by namespace ID.
+
+        A namespace that cannot be read is logged and left out of the result.
+        Each namespace's entities fire memory_post_read, exactly like
+        ``search_entities``. Do not override — override _get_entities_batch_impl.
+        """
+        batch = self._get_entities_batch_impl(namespace_ids, limit_per)
+        return {
+            namespace_id: dispatch_memory_post_read(self, namespace_id, entities, query=None, filters=None)
+            for namespace_id, entities in batch.items()
+        }
+
+    def _get_entities_batch_impl(self, namespace_ids: list[str], limit_per: int) -> dict[str, list[RecordedEntity]]:
+        """Default implementation: one ``_search_entities_impl`` call per namespace, run concurrently.
+
+        Backends that can read several namespaces in one round-trip should override this.
+        """
+        if not namespace_ids:
+            return {}
+        fetched: dict[str, list[RecordedEntity]] = {}
+        with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(namespace_ids))) as executor:
+            futures = {
+                executor.submit(self._search_entities_impl, namespace_id, None, None, limit_per): namespace_id
+                for namespace_id in namespace_ids
+            }
+            for future in as_completed(futures):
+                namespace_id = futures[future]
+                try:
+                    fetched[namespace_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching entities for namespace {namespace_id}: {e}")
+        return {namespace_id: fetched[namespace_id] for namespace_id in namespace_ids if namespace_id in fetched}
+
     def delete_entity_by_id(self, namespace_id: str, entity_id: str):
         """Delete an entity (public API). Fires memory_pre_delete; do not override — override _delete_entity_by_id_impl.
 
@@ -95,7 +227,58 @@ class BaseEntityBackend(ABC):
         :class:`MemoryPolicyViolation` to the caller; the conflict-resolution
         executor instead skips the vetoed delete and continues the batch.
         """
-        self._guarded_delete(namespace_id, entity_id, source="api")
+        try:
+            self._guarded_delete(namespace_id, entity_id, source="api")
+        finally:
+            self.search_cache.invalidate(namespace_id)
+
+    def delete_entities_by_ids(self, namespace_id: str, entity_ids: list[str]) -> list[str]:
+        """Delete several entities with one backend call (public API). Returns the IDs submitted for deletion.
+
+        memory_pre_delete fires once per entity, with metadata from one batched
+        internal read. Unlike ``delete_entity_by_id``, a vetoed delete is logged
+        and skipped instead of aborting the batch, like conflict-resolution
+        DELETE verdicts. IDs that do not exist are ignored. Do not override —
+        override _delete_entities_by_ids_impl.
+        """
+        if not entity_ids:
+            return []
+        try:
+            allowed = list(entity_ids)
+            if hooks_active(HookType.MEMORY_PRE_DELETE):
+                stored = self._search_entities_impl(namespace_id, filters={"id": allowed}, limit=len(allowed))
+                stored_by_id = {entity.id: entity for entity in stored}
+                allowed = []
+                for entity_id in entity_ids:
+                    stored_entity = stored_by_id.get(entity_id)
+                    try:
+                        dispatch_memory_pre_delete(
+                            self, namespace_id, entity_id, metadata=stored_entity.metadata if stored_entity else None
+                        )
+                    except MemoryPolicyViolation as violation:
+                        logger.warning(
+                            "memory_pre_delete plugin %r vetoed delete of entity '%s' in namespace '%s': %s. Keeping it.",
+                            violation.plugin_name,
+                            entity_id,
+                            namespace_id,
+                            violation,
+                        )
+                        continue
+                    allowed.append(entity_id)
+            if allowed:
+                self._delete_entities_by_ids_impl(namespace_id, allowed)
+            return allowed
+        finally:
+            self.search_cache.invalidate(namespace_id)
+
+    def _delete_entities_by_ids_impl(self, namespace_id: str, entity_ids: list[str]) -> None:
+        """Default implementation: one ``_delete_entity_by_id_impl`` call per ID.
+
+        Backends that can delete a list of IDs in one call should override this
+        (and ignore IDs that do not exist).
+        """
+        for entity_id in entity_ids:
+            self._delete_entity_by_id_impl(namespace_id, entity_id)
 
     def _guarded_delete(
         self,
@@ -147,6 +330,14 @@ class BaseEntityBackend(ABC):
         """Insert a new entity and return its ID as a string."""
         pass
 
+    def _add_entities(self, namespace_id: str, entity_type: str, rows: list[tuple[str, dict]], timestamp: int) -> list[str]:
+        """Insert several new entities (``(content_str, metadata)`` rows) and return their IDs in order.
+
+        Defaults to one ``_add_entity`` per row; backends with a bulk insert
+        path (batched embedding + single write) should override this.
+        """
+        return [self._add_entity(namespace_id, entity_type, content_str, timestamp, metadata) for content_str, metadata in rows]
+
     @abstractmethod
     def _update_entity(self, namespace_id: str, entity_id: str, entity_type: str, content_str: str, timestamp: int, metadata: dict) -> None:
         """Update an existing entity in-place."""
@@ -188,7 +379,10 @@ class BaseEntityBackend(ABC):
         (which calls back into update_entity_metadata) from recursing here.
         """
         metadata_patch = dispatch_memory_pre_metadata_patch(self, namespace_id, entity_id, metadata_patch)
-        entity = self._update_entity_metadata_impl(namespace_id, entity_id, metadata_patch)
+        try:
+            entity = self._update_entity_metadata_impl(namespace_id, entity_id, metadata_patch)
+        finally:
+            self.search_cache.invalidate(namespace_id)
         transformed = dispatch_memory_post_read(self, namespace_id, [entity])
         return transformed[0] if transformed else entity
 
@@ -226,9 +420,10 @@ class BaseEntityBackend(ABC):
             logger.warning("No entities to update.")
             return []
 
-        entity_type = entities[0].type
-        if not all(entity.type == entity_type for entity in entities):
+        entity_types = {entity.type for entity in entities}
+        if len(entity_types) != 1:
             raise EvolveException("All entities must have the same type.")
+        (entity_type,) = entity_types
 
         # Fire memory_pre_write BEFORE conflict resolution so transform
         # plugins (normalization, PII redaction, ...) run before any entity
@@ -237,24 +432,22 @@ class BaseEntityBackend(ABC):
 
         now = datetime.datetime.now(datetime.UTC)
         timestamp = int(now.timestamp())
+        # Drop cached searches up front: even a write that fails midway may have changed the namespace.
+        self.search_cache.invalidate(namespace_id)
 
-        entities_with_temporary_ids: list[RecordedEntity] = []
-        for i, entity in enumerate(entities):
-            entity_data = entity.model_dump()
-            if entity_data.get("metadata") is None:
-                entity_data["metadata"] = {}
-            entities_with_temporary_ids.append(
-                RecordedEntity(
-                    **entity_data,
-                    created_at=datetime.datetime.now(datetime.UTC),
-                    id=f"Unprocessed_Entity_{i}",
-                )
-            )
+        # Read each entity's fields once into parallel lists, reused by the
+        # conflict-resolution search, the temporary records and the writes.
+        contents = [entity.content for entity in entities]
+        content_strs = [serialize_content(content) for content in contents]
+        metadatas = [entity.metadata or {} for entity in entities]
 
         if enable_conflict_resolution:
+            entities_with_temporary_ids = [
+                RecordedEntity(id=f"Unprocessed_Entity_{i}", type=entity_type, content=content, metadata=metadata, created_at=now)
+                for i, (content, metadata) in enumerate(zip(contents, metadatas))
+            ]
             old_entities: list[RecordedEntity] = []
-            for entity in entities:
-                query_str = serialize_content(entity.content)
+            for query_str in content_strs:
                 # Internal pre-read for conflict resolution — must not fire
                 # memory_post_read (public-API reads only).
                 old_entities.extend(
@@ -267,7 +460,38 @@ class BaseEntityBackend(ABC):
                 )
 
             stored_by_id = {entity.id: entity for entity in old_entities}
-            updates = resolve_conflicts(old_entities, entities_with_temporary_ids)
+            # An incoming entity whose content is byte-identical to a stored
+            # neighbour is already present: record NONE for it without asking
+            # the LLM, and only send the rest to conflict resolution.
+            stored_by_content = {serialize_content(entity.content): entity for entity in old_entities}
+            duplicates: list[EntityUpdate] = []
+            pending: list[RecordedEntity] = []
+            for new_entity, content_str in zip(entities_with_temporary_ids, content_strs):
+                stored = stored_by_content.get(content_str)
+                if stored is None:
+                    pending.append(new_entity)
+                else:
+                    duplicates.append(
+                        EntityUpdate(id=stored.id, type=entity_type, content=stored.content, event="NONE", metadata=stored.metadata)
+                    )
+
+            if not pending:
+                updates = []
+            elif len(pending) == 1 and not old_entities:
+                # Nothing stored of this type is near the lone incoming entity,
+                # so there is nothing to conflict with: ADD without an LLM call.
+                new_entity = pending[0]
+                updates = [
+                    EntityUpdate(
+                        id=new_entity.id,
+                        type=entity_type,
+                        content=new_entity.content,
+                        event="ADD",
+                        metadata=new_entity.metadata,
+                    )
+                ]
+            else:
+                updates = resolve_conflicts(old_entities, pending)
             for update in updates:
                 content_str = serialize_content(update.content)
                 metadata = update.metadata or {}
@@ -308,21 +532,19 @@ class BaseEntityBackend(ABC):
                             }
                     case "NONE":
                         pass
+            updates = duplicates + updates
         else:
-            updates = []
-            for entity in entities:
-                content_str = serialize_content(entity.content)
-                metadata = entity.metadata or {}
-                entity_id = self._add_entity(namespace_id, entity_type, content_str, timestamp, metadata)
-                updates.append(
-                    EntityUpdate(
-                        id=entity_id,
-                        type=entity_type,
-                        content=entity.content,
-                        event="ADD",
-                        metadata=metadata,
-                    )
+            entity_ids = self._add_entities(namespace_id, entity_type, list(zip(content_strs, metadatas)), timestamp)
+            updates = [
+                EntityUpdate(
+                    id=entity_id,
+                    type=entity_type,
+                    content=content,
+                    event="ADD",
+                    metadata=metadata,
                 )
+                for entity_id, content, metadata in zip(entity_ids, contents, metadatas)
+            ]
 
         self._post_update(namespace_id)
         return updates
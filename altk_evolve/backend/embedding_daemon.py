@@ -0,0 +1,285 @@
+"""
+Long-lived embedding server shared by short-lived processes.
+
+Every ``evolve`` CLI invocation is a fresh process, so a backend that builds
+its own ``SentenceTransformer`` reloads the model just to embed one string.
+With ``EVOLVE_EMBEDDING_DAEMON=true`` the backends instead use
+:class:`EmbeddingDaemonClient`, which talks to a daemon over a Unix domain
+socket and spawns it on first use. The model then stays loaded between
+invocations; the daemon exits after ``idle_timeout`` seconds without requests
+or when sent a ``stop`` request.
+
+Wire format (both directions): a 4-byte big-endian length, then a JSON
+header of that length. Encode responses are followed by the raw C-order
+float32 matrix described by the header's ``shape``.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import socket
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from altk_evolve.schema.exceptions import EvolveException
+
+logger = logging.getLogger("entities-db.embedding-daemon")
+
+_LENGTH = struct.Struct("!I")
+DEFAULT_SOCKET_DIR = Path.home() / ".cache" / "evolve"
+DEFAULT_IDLE_TIMEOUT = 900.0
+
+
+def default_socket_path(model_name: str) -> Path:
+    """One socket per model, so daemons for different models never answer for each other."""
+    digest = hashlib.sha1(model_name.encode("utf-8")).hexdigest()[:12]
+    return DEFAULT_SOCKET_DIR / f"embed-{digest}.sock"
+
+
+def _pack(header: dict[str, Any], payload: bytes = b"") -> bytes:
+    body = json.dumps(header).encode("utf-8")
+    return _LENGTH.pack(len(body)) + body + payload
+
+
+def _socket_is_live(socket_path: Path) -> bool:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+# ── server ───────────────────────────────────────────────────────────
+
+
+async def _read_header(reader: asyncio.StreamReader) -> dict[str, Any]:
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    return json.loads(await reader.readexactly(length))
+
+
+class _Daemon:
+    def __init__(self, model, idle_timeout: float | None):
+        self.model = model
+        self.idle_timeout = idle_timeout
+        self.lock = asyncio.Lock()
+        self.stopped = asyncio.Event()
+        self.last_activity = time.monotonic()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    request = await _read_header(reader)
+                except asyncio.IncompleteReadError:
+                    break
+                self.last_activity = time.monotonic()
+                op = request.get("op")
+                try:
+                    if op == "stop":
+                        writer.write(_pack({"stopped": True}))
+                        self.stopped.set()
+                    elif op == "dim":
+                        writer.write(_pack({"dim": self.model.get_sentence_embedding_dimension()}))
+                    else:
+                        texts = list(request.get("texts") or [])
+                        normalize = bool(request.get("normalize_embeddings", False))
+                        async with self.lock:
+                            embeddings = await loop.run_in_executor(
+                                None, lambda: self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=normalize)
+                            )
+                        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+                        writer.write(_pack({"shape": list(matrix.shape)}, matrix.tobytes()))
+                except Exception as exc:
+                    logger.exception("Embedding request failed")
+                    writer.write(_pack({"error": str(exc)}))
+                await writer.drain()
+                self.last_activity = time.monotonic()
+        finally:
+            writer.close()
+
+    async def wait_until_done(self) -> None:
+        """Return once a stop request arrives or the daemon has been idle for ``idle_timeout`` seconds."""
+        poll_interval = 1.0 if self.idle_timeout is None else min(1.0, self.idle_timeout)
+        while not self.stopped.is_set():
+            if self.idle_timeout is not None and time.monotonic() - self.last_activity >= self.idle_timeout:
+                logger.info(f"Embedding daemon idle for {self.idle_timeout:.0f}s; shutting down")
+                return
+            try:
+                await asyncio.wait_for(self.stopped.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def _serve(model, socket_path: Path, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT) -> None:
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    # The lock file serializes concurrent auto-spawns: only its holder may replace
+    # the socket, so a second daemon never unlinks the socket of a live first one.
+    lock_file = open(socket_path.with_name(socket_path.name + ".lock"), "w")
+    try:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info(f"Another embedding daemon owns {socket_path}; exiting")
+            return
+        if _socket_is_live(socket_path):
+            logger.info(f"Embedding daemon already listening on {socket_path}; exiting")
+            return
+        if socket_path.exists():
+            socket_path.unlink()
+
+        daemon = _Daemon(model, idle_timeout)
+        server = await asyncio.start_unix_server(daemon.handle_connection, path=str(socket_path))
+        os.chmod(socket_path, 0o600)
+        logger.info(f"Embedding daemon listening on {socket_path}")
+        try:
+            async with server:
+                await daemon.wait_until_done()
+        finally:
+            if socket_path.exists():
+                socket_path.unlink()
+    finally:
+        lock_file.close()
+
+
+def serve(model_name: str, socket_path: Path | None = None, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Load ``model_name`` once and serve encode requests until stopped or idle."""
+    # Deferred: importing sentence_transformers pulls in torch.
+    from sentence_transformers import SentenceTransformer
+
+    asyncio.run(_serve(SentenceTransformer(model_name), socket_path or default_socket_path(model_name), idle_timeout))
+
+
+# ── client ───────────────────────────────────────────────────────────
+
+
+class EmbeddingDaemonClient:
+    """Drop-in for the parts of ``SentenceTransformer`` the backends use, backed by the daemon."""
+
+    def __init__(self, model_name: str, socket_path: Path | None = None, spawn: bool = True, startup_timeout: float = 120.0):
+        self.model_name = model_name
+        self.socket_path = socket_path or default_socket_path(model_name)
+        self.spawn = spawn
+        self.startup_timeout = startup_timeout
+        self._dimension: int | None = None
+
+    @property
+    def log_path(self) -> Path:
+        return self.socket_path.with_suffix(".log")
+
+    def _spawn_daemon(self) -> subprocess.Popen:
+        logger.info(f"Starting embedding daemon for '{self.model_name}' at {self.socket_path} (log: {self.log_path})")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as log_file:
+            return subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "altk_evolve.cli.cli",
+                    "embeddings",
+                    "daemon",
+                    "--model",
+                    self.model_name,
+                    "--socket",
+                    str(self.socket_path),
+                ],
+                start_new_session=True,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=log_file,
+            )
+
+    def _connect(self) -> socket.socket:
+        process: subprocess.Popen | None = None
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(str(self.socket_path))
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError) as exc:
+                sock.close()
+                if not self.spawn:
+                    raise EvolveException(f"Embedding daemon is not running at {self.socket_path}") from exc
+                if process is None:
+                    process = self._spawn_daemon()
+                else:
+                    returncode = process.poll()
+                    # Exit code 0 means another daemon won the startup race; keep waiting for its socket.
+                    if returncode not in (None, 0):
+                        raise EvolveException(
+                            f"Embedding daemon exited with code {returncode} during startup; see {self.log_path}"
+                        ) from exc
+                if time.monotonic() > deadline:
+                    raise EvolveException(
+                        f"Embedding daemon did not start within {self.startup_timeout:.0f}s; see {self.log_path}"
+                    ) from exc
+                time.sleep(0.1)
+
+    @staticmethod
+    def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+        chunks = bytearray()
+        while len(chunks) < size:
+            chunk = sock.recv(size - len(chunks))
+            if not chunk:
+                raise EvolveException("Embedding daemon closed the connection")
+            chunks.extend(chunk)
+        return bytes(chunks)
+
+    def _request(self, header: dict[str, Any]) -> tuple[dict[str, Any], socket.socket]:
+        sock = self._connect()
+        try:
+            sock.sendall(_pack(header))
+            (length,) = _LENGTH.unpack(self._recv_exactly(sock, _LENGTH.size))
+            response = json.loads(self._recv_exactly(sock, length))
+        except Exception:
+            sock.close()
+            raise
+        if "error" in response:
+            sock.close()
+            raise EvolveException(f"Embedding daemon error: {response['error']}")
+        return response, sock
+
+    def stop(self) -> bool:
+        """Ask a running daemon to shut down. Returns False if none was running."""
+        if not _socket_is_live(self.socket_path):
+            return False
+        spawn, self.spawn = self.spawn, False
+        try:
+            _, sock = self._request({"op": "stop"})
+            sock.close()
+        finally:
+            self.spawn = spawn
+        return True
+
+    def get_sentence_embedding_dimension(self) -> int:
+        if self._dimension is None:
+            response, sock = self._request({"op": "dim"})
+            sock.close()
+            self._dimension = int(response["dim"])
+        return self._dimension
+
+    def encode(self, sentences: str | list[str], normalize_embeddings: bool = False, **kwargs) -> np.ndarray:
+        """Return float32 embeddings: 1-D for a single string, 2-D for a list (like ``SentenceTransformer.encode``)."""
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        response, sock = self._request({"op": "encode", "texts": texts, "normalize_embeddings": normalize_embeddings})
+        try:
+            shape = tuple(response["shape"])
+            payload = self._recv_exactly(sock, int(np.prod(shape)) * 4)
+        finally:
+            sock.close()
+        embeddings = np.frombuffer(payload, dtype=np.float32).reshape(shape)
+        return embeddings[0] if single else embeddings
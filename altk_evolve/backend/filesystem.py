@@ -156,6 +156,20 @@ class FilesystemEntityBackend(BaseEntityBackend):
                     break
         return namespaces
 
+    def search_namespaces_lite(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Return ``(namespace_id, num_entities)`` pairs without building ``Namespace`` models."""
+        counts = []
+        with self._lock:
+            for file_path in self.data_dir.glob("*.json"):
+                try:
+                    data = json.loads(file_path.read_text())
+                    counts.append((data["id"], len(data["entities"])))
+                except (json.JSONDecodeError, KeyError):
+                    continue
+                if len(counts) >= limit:
+                    break
+        return counts
+
     def _delete_namespace_impl(self, namespace_id: str):
         """Delete a namespace and all its entities."""
         file_path = self._namespace_file(namespace_id)
@@ -260,6 +274,8 @@ class FilesystemEntityBackend(BaseEntityBackend):
 
         # Apply filters
         if filters:
+            id_list = filters.get("id")
+            id_set = {str(v) for v in id_list} if isinstance(id_list, (list, tuple, set)) else None
             filtered = []
             for ent in entities:
                 match = True
@@ -272,7 +288,11 @@ class FilesystemEntityBackend(BaseEntityBackend):
                         ent_value = ent.get(key)
                         if ent_value is None and ent.get("metadata"):
                             ent_value = ent["metadata"].get(key)
-                    if ent_value != value:
+                    if key == "id" and id_set is not None:
+                        if str(ent_value) not in id_set:
+                            match = False
+                            break
+                    elif ent_value != value:
                         match = False
                         break
                 if match:
@@ -331,3 +351,12 @@ class FilesystemEntityBackend(BaseEntityBackend):
                 raise EvolveException(f"Entity `{entity_id}` not found")
             data.num_entities = len(data.entities)
             self._save_namespace_data(namespace_id, data)
+
+    def _delete_entities_by_ids_impl(self, namespace_id: str, entity_ids: list[str]) -> None:
+        """Delete several entities with a single load/save of the namespace file."""
+        ids = set(entity_ids)
+        with self._lock:
+            data = self._load_namespace_data(namespace_id)
+            data.entities = [e for e in data.entities if str(e["id"]) not in ids]
+            data.num_entities = len(data.entities)
+            self._save_namespace_data(namespace_id, data)
@@ -3,8 +3,13 @@ import json
 import logging
 import os
 import uuid
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
+import numpy as np
 from altk_evolve.backend.base import BaseEntityBackend, BaseSettings
+from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient
+from altk_evolve.config.evolve import get_evolve_config
 from altk_evolve.config.milvus import MilvusDBSettings, milvus_client_settings
 from altk_evolve.db.sqlite_manager import SQLiteManager
 from altk_evolve.schema.core import Namespace, RecordedEntity
@@ -13,7 +18,9 @@ from altk_evolve.utils.utils import deserialize_content
 from pymilvus import CollectionSchema, DataType, FieldSchema, MilvusClient
 from pymilvus.exceptions import MilvusException
 from pymilvus.milvus_client.index import IndexParams
-from sentence_transformers import SentenceTransformer
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("entities-db.milvus")
@@ -21,7 +28,7 @@ logger = logging.getLogger("entities-db.milvus")
 
 class MilvusEntityBackend(BaseEntityBackend):
     milvus: MilvusClient
-    embedding_model: SentenceTransformer
+    embedding_model: "SentenceTransformer | EmbeddingDaemonClient"
     _schema_filter_fields = {"id", "type", "content", "created_at"}
 
     def __init__(self, config: BaseSettings | None = None):
@@ -36,8 +43,15 @@ class MilvusEntityBackend(BaseEntityBackend):
             db_name=self.config.db_name,
             token=self.config.token,
             timeout=self.config.timeout,
+            keep_alive=self.config.keep_alive,
         )
-        self.embedding_model = SentenceTransformer(self.config.embedding_model)
+        if get_evolve_config().embedding_daemon:
+            self.embedding_model = EmbeddingDaemonClient(self.config.embedding_model)
+        else:
+            # Deferred: importing sentence_transformers pulls in torch.
+            from sentence_transformers import SentenceTransformer
+
+            self.embedding_model = SentenceTransformer(self.config.embedding_model)
         self.metric_type = "COSINE"
 
     def _build_filter_expr(self, filters: dict | None, base_conditions: list[str] | None = None) -> str:
@@ -46,6 +60,10 @@ class MilvusEntityBackend(BaseEntityBackend):
         for key, value in (filters or {}).items():
             if value is None:
                 continue
+            if key == "id" and isinstance(value, (list, tuple, set, frozenset)):
+                # ID-list pushdown; non-numeric IDs can never match the INT64 primary key.
+                expressions.append(f"id in {json.dumps(sorted(int(v) for v in value if str(v).isdigit()))}")
+                continue
             literal = json.dumps(value)
             if key.startswith("metadata."):
                 metadata_key = key.split(".", 1)[1]
@@ -62,7 +80,9 @@ class MilvusEntityBackend(BaseEntityBackend):
         for key, value in (filters or {}).items():
             if value is None:
                 continue
-            if key in self._schema_filter_fields:
+            if key == "id" and isinstance(value, (list, tuple, set)):
+                schema_filters[key] = frozenset(str(v) for v in value)
+            elif key in self._schema_filter_fields:
                 schema_filters[key] = value
             elif key.startswith("metadata."):
                 metadata_filters[key.split(".", 1)[1]] = value
@@ -75,7 +95,10 @@ class MilvusEntityBackend(BaseEntityBackend):
         for key, value in schema_filters.items():
             entity_value = getattr(entity, key, None)
             if key == "id":
-                if str(entity_value) != str(value):
+                if isinstance(value, frozenset):
+                    if str(entity_value) not in value:
+                        return False
+                elif str(entity_value) != str(value):
                     return False
             elif key == "created_at":
                 if isinstance(entity_value, datetime.datetime):
@@ -143,6 +166,17 @@ class MilvusEntityBackend(BaseEntityBackend):
         sorted_results.extend(item[1] for item in sorted(without_scores, key=lambda item: item[0]))
         return sorted_results
 
+    @staticmethod
+    def _is_raw_data_error(exc: MilvusException, namespace_id: str) -> bool:
+        """Milvus raises a HasRawData assertion when listing some collections; callers treat it as empty."""
+        if "HasRawData" not in str(exc):
+            return False
+        logger.warning(
+            "Milvus raw-data assertion for namespace=%s; returning empty results.",
+            namespace_id,
+        )
+        return True
+
     @staticmethod
     def _flatten_search_results(results: list) -> list:
         if not results:
@@ -215,16 +249,25 @@ class MilvusEntityBackend(BaseEntityBackend):
         except Exception as exc:
             raise EvolveException(f"Failed to ensure embedding index for namespace={namespace_id}: {exc}") from exc
 
-    def create_namespace(self, namespace_id: str | None = None) -> Namespace:
-        namespace_id = namespace_id or "ns_" + str(uuid.uuid4()).replace("-", "_")
-
+    def _create_collection(self, namespace_id: str) -> None:
         if not self.milvus.has_collection(namespace_id):
             self.milvus.create_collection(collection_name=namespace_id, dimension=384, auto_id=False, schema=entity_schema)
         self._ensure_embedding_index(namespace_id)
 
+    def create_namespace(self, namespace_id: str | None = None) -> Namespace:
+        namespace_id = namespace_id or "ns_" + str(uuid.uuid4()).replace("-", "_")
+        self._create_collection(namespace_id)
+
         with SQLiteManager(self.sqlite_uri) as db_manager:
             return db_manager.create_namespace(namespace_id)
 
+    def create_namespaces(self, namespace_ids: list[str]) -> list[Namespace]:
+        for namespace_id in namespace_ids:
+            self._create_collection(namespace_id)
+
+        with SQLiteManager(self.sqlite_uri) as db_manager:
+            return db_manager.create_namespaces(namespace_ids)
+
     def get_namespace_details(self, namespace_id: str) -> Namespace:
         self._validate_namespace(namespace_id)
 
@@ -257,6 +300,32 @@ class MilvusEntityBackend(BaseEntityBackend):
         with SQLiteManager(self.sqlite_uri) as db_manager:
             db_manager.delete_namespace(namespace_id)
 
+    def _embed(self, texts: str | list[str]) -> np.ndarray:
+        """Encode text(s) into a C-contiguous float32 ndarray.
+
+        pymilvus marshals FLOAT_VECTOR rows straight from float32 buffers, so
+        handing it ``np.float32`` arrays (rather than float64 or nested lists)
+        avoids a per-dimension Python conversion on every insert/search.
+        """
+        embeddings = self.embedding_model.encode(texts, convert_to_numpy=True)
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        return self._embed(query)
+
+    def _embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Encode a batch with a single device-to-host copy.
+
+        With ``convert_to_numpy`` sentence-transformers moves every minibatch to
+        the host as it goes; with ``convert_to_tensor`` the whole ``(N, dim)``
+        result stays on the model's device until it is copied out once here.
+        """
+        if isinstance(self.embedding_model, EmbeddingDaemonClient):
+            # The daemon already returns one host-side float32 matrix.
+            return self._embed(texts)
+        embeddings = self.embedding_model.encode(texts, batch_size=128, convert_to_tensor=True)
+        return np.ascontiguousarray(embeddings.float().cpu().numpy(), dtype=np.float32)
+
     # ── update_entities hooks ────────────────────────────────────────
 
     def _add_entity(self, namespace_id: str, entity_type: str, content_str: str, timestamp: int, metadata: dict) -> str:
@@ -267,12 +336,33 @@ class MilvusEntityBackend(BaseEntityBackend):
                     "type": entity_type,
                     "content": content_str,
                     "created_at": timestamp,
-                    "embedding": self.embedding_model.encode(content_str),
+                    "embedding": self._embed(content_str),
                     "metadata": metadata,
                 },
             )["ids"][0]
         )
 
+    def _add_entities(self, namespace_id: str, entity_type: str, rows: list[tuple[str, dict]], timestamp: int) -> list[str]:
+        if not rows:
+            return []
+        # One batched encode and one insert RPC for the whole batch; each row
+        # carries a float32 view into the shared embedding matrix.
+        embeddings = self._embed_batch([content_str for content_str, _ in rows])
+        result = self.milvus.insert(
+            collection_name=namespace_id,
+            data=[
+                {
+                    "type": entity_type,
+                    "content": content_str,
+                    "created_at": timestamp,
+                    "embedding": embeddings[i],
+                    "metadata": metadata,
+                }
+                for i, (content_str, metadata) in enumerate(rows)
+            ],
+        )
+        return [str(entity_id) for entity_id in result["ids"]]
+
     def _update_entity(self, namespace_id: str, entity_id: str, entity_type: str, content_str: str, timestamp: int, metadata: dict) -> None:
         self.milvus.upsert(
             collection_name=namespace_id,
@@ -281,7 +371,7 @@ class MilvusEntityBackend(BaseEntityBackend):
                 "id": int(entity_id),
                 "content": content_str,
                 "created_at": timestamp,
-                "embedding": self.embedding_model.encode(content_str),
+                "embedding": self._embed(content_str),
                 "metadata": metadata,
             },
             partial_update=True,
@@ -325,7 +415,9 @@ class MilvusEntityBackend(BaseEntityBackend):
         self._validate_namespace(namespace_id)
         filters = filters or {}
         schema_filters, metadata_filters = self._split_filters(filters)
-        fetch_limit = max(limit, 1000) if filters else limit
+        # Schema filters are pushed into the Milvus expression; only metadata filters
+        # are applied afterwards, so only they need headroom beyond ``limit``.
+        fetch_limit = max(limit, 1000) if metadata_filters else limit
 
         if query is None:
             try:
@@ -336,11 +428,7 @@ class MilvusEntityBackend(BaseEntityBackend):
                     limit=fetch_limit,
                 )
             except MilvusException as exc:
-                if "HasRawData" in str(exc):
-                    logger.warning(
-                        "Milvus raw-data assertion for namespace=%s; returning empty results.",
-                        namespace_id,
-                    )
+                if self._is_raw_data_error(exc, namespace_id):
                     return []
                 raise
         else:
@@ -349,7 +437,7 @@ class MilvusEntityBackend(BaseEntityBackend):
                 raw_results = self.milvus.search(
                     collection_name=namespace_id,
                     anns_field="embedding",
-                    data=[self.embedding_model.encode(query)],
+                    data=[self._query_embedding(query)],
                     filter=self._build_filter_expr(schema_filters),
                     limit=fetch_limit,
                     output_fields=["*"],
@@ -361,7 +449,7 @@ class MilvusEntityBackend(BaseEntityBackend):
                     raw_results = self.milvus.search(
                         collection_name=namespace_id,
                         anns_field="embedding",
-                        data=[self.embedding_model.encode(query)],
+                        data=[self._query_embedding(query)],
                         filter=self._build_filter_expr(schema_filters),
                         limit=fetch_limit,
                         output_fields=["*"],
@@ -376,6 +464,45 @@ class MilvusEntityBackend(BaseEntityBackend):
         filtered = [entity for entity in parsed if self._entity_matches_filter(entity, schema_filters, metadata_filters)]
         return filtered[:limit]
 
+    def _iter_entities_impl(self, namespace_id: str, filters: dict | None, limit: int, page_size: int) -> Iterator[list[RecordedEntity]]:
+        self._validate_namespace(namespace_id)
+        schema_filters, metadata_filters = self._split_filters(filters)
+        # Metadata filters are applied client-side, so the server-side limit only
+        # holds when every filter can be pushed down into the Milvus expression.
+        try:
+            iterator = self.milvus.query_iterator(
+                collection_name=namespace_id,
+                batch_size=max(1, page_size),
+                limit=-1 if metadata_filters else limit,
+                filter=self._build_filter_expr(schema_filters, base_conditions=["id > 0"]),
+                output_fields=["id", "type", "content", "created_at", "metadata"],
+            )
+        except MilvusException as exc:
+            if self._is_raw_data_error(exc, namespace_id):
+                return
+            raise
+        remaining = limit
+        try:
+            while remaining > 0:
+                try:
+                    batch = iterator.next()
+                except MilvusException as exc:
+                    if self._is_raw_data_error(exc, namespace_id):
+                        return
+                    raise
+                if not batch:
+                    break
+                page = [
+                    entity
+                    for entity in (parse_milvus_entity(row) for row in batch)
+                    if self._entity_matches_filter(entity, schema_filters, metadata_filters)
+                ][:remaining]
+                if page:
+                    remaining -= len(page)
+                    yield page
+        finally:
+            iterator.close()
+
     def _delete_entity_by_id_impl(self, namespace_id: str, entity_id: str):
         try:
             entity_id_int = int(entity_id)
@@ -384,6 +511,14 @@ class MilvusEntityBackend(BaseEntityBackend):
         self._validate_namespace(namespace_id)
         self.milvus.delete(collection_name=namespace_id, ids=[entity_id_int])
 
+    def _delete_entities_by_ids_impl(self, namespace_id: str, entity_ids: list[str]) -> None:
+        try:
+            ids = [int(entity_id) for entity_id in entity_ids]
+        except ValueError as exc:
+            raise EvolveException(f"Invalid entity IDs: {entity_ids}. Entity IDs must be numeric.") from exc
+        self._validate_namespace(namespace_id)
+        self.milvus.delete(collection_name=namespace_id, ids=ids)
+
     def close(self):
         try:
             if hasattr(self, "milvus"):
@@ -1,22 +1,30 @@
 import datetime
 import json
 import logging
+import queue
+import threading
 import uuid
-from collections.abc import Callable, Sequence
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import psycopg
 from psycopg import sql
 from pgvector.psycopg import register_vector
-from sentence_transformers import SentenceTransformer
 
 from altk_evolve.backend.base import BaseEntityBackend, BaseSettings
+from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient
+from altk_evolve.config.evolve import get_evolve_config
 from altk_evolve.config.postgres import PostgresDBSettings, postgres_db_settings
 from altk_evolve.db.sqlite_manager import SQLiteManager
 from altk_evolve.schema.core import Namespace, RecordedEntity
 from altk_evolve.schema.exceptions import EvolveException, NamespaceNotFoundException
 from altk_evolve.utils.utils import deserialize_content
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("entities-db.pgvector")
 
@@ -40,7 +48,7 @@ def _entity_row_factory(cursor: psycopg.Cursor[Any]) -> Callable[[Sequence[Any]]
 
 class PostgresEntityBackend(BaseEntityBackend):
     conn: psycopg.Connection
-    embedding_model: SentenceTransformer
+    embedding_model: "SentenceTransformer | EmbeddingDaemonClient"
     embedding_dim: int
     _settings: PostgresDBSettings
     _schema_filter_fields = {"id", "type", "content", "created_at"}
@@ -50,10 +58,23 @@ class PostgresEntityBackend(BaseEntityBackend):
         super().__init__(config)
         self._settings = config if isinstance(config, type(postgres_db_settings)) else postgres_db_settings
         self.conn = self._connect_target_db()
+        # Read connections, LIFO so a single-threaded caller keeps reusing the main
+        # connection; extra ones are opened only when concurrent reads find it taken.
+        self._read_pool: queue.LifoQueue[psycopg.Connection] = queue.LifoQueue()
+        self._read_pool.put(self.conn)
+        self._read_pool_opened = 1
+        self._read_pool_lock = threading.Lock()
         try:
             self._ensure_pgvector_extension()
             register_vector(self.conn)
-            self.embedding_model = SentenceTransformer(self._settings.embedding_model)
+            self._configure_search(self.conn)
+            if get_evolve_config().embedding_daemon:
+                self.embedding_model = EmbeddingDaemonClient(self._settings.embedding_model)
+            else:
+                # Deferred: importing sentence_transformers pulls in torch.
+                from sentence_transformers import SentenceTransformer
+
+                self.embedding_model = SentenceTransformer(self._settings.embedding_model)
             embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
             if embedding_dim is None or embedding_dim <= 0:
                 raise EvolveException(
@@ -146,6 +167,61 @@ class PostgresEntityBackend(BaseEntityBackend):
             self._create_database()
             return self._connect(self._settings.dbname)
 
+    @contextmanager
+    def _read_conn(self) -> Iterator[psycopg.Connection]:
+        """Borrow a connection for a read.
+
+        Writes always use ``self.conn``. Concurrent reads (e.g. API requests served
+        from a threadpool) each get their own connection, up to ``read_pool_size``
+        including the main one, instead of queueing on a single connection.
+        """
+        if self._settings.read_pool_size <= 1:
+            yield self.conn
+            return
+        conn = self._acquire_read_conn()
+        try:
+            yield conn
+        finally:
+            self._release_read_conn(conn)
+
+    def _acquire_read_conn(self) -> psycopg.Connection:
+        try:
+            return self._read_pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._read_pool_lock:
+            can_open = self._read_pool_opened < self._settings.read_pool_size
+            if can_open:
+                self._read_pool_opened += 1
+        if can_open:
+            try:
+                conn = self._connect(self._settings.dbname)
+                register_vector(conn)
+                self._configure_search(conn)
+            except Exception:
+                with self._read_pool_lock:
+                    self._read_pool_opened -= 1
+                raise
+            return conn
+        try:
+            return self._read_pool.get(timeout=self._settings.pool_timeout)
+        except queue.Empty:
+            raise EvolveException(
+                f"No Postgres read connection became free within {self._settings.pool_timeout:.0f}s "
+                f"(EVOLVE_PG_READ_POOL_SIZE={self._settings.read_pool_size})"
+            ) from None
+
+    def _release_read_conn(self, conn: psycopg.Connection) -> None:
+        if conn is not self.conn and (conn.closed or conn.broken):
+            with self._read_pool_lock:
+                self._read_pool_opened -= 1
+            return
+        self._read_pool.put(conn)
+
+    def _configure_search(self, conn: psycopg.Connection) -> None:
+        """Set the session's HNSW search breadth; connections are autocommit, so a plain SET lasts the session."""
+        conn.execute(sql.SQL("SET hnsw.ef_search = {}").format(sql.Literal(self._settings.hnsw_ef_search)))
+
     def _ensure_pgvector_extension(self):
         """Ensure the pgvector extension is installed."""
         with self.conn.cursor() as cur:
@@ -158,7 +234,7 @@ class PostgresEntityBackend(BaseEntityBackend):
     def _table_exists(self, namespace_id: str) -> bool:
         """Check if the table for a namespace exists."""
         table = self._table_name(namespace_id)
-        with self.conn.cursor() as cur:
+        with self._read_conn() as conn, conn.cursor() as cur:
             cur.execute(
                 "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = %s)",
                 (table,),
@@ -166,6 +242,15 @@ class PostgresEntityBackend(BaseEntityBackend):
             row = cur.fetchone()
             return row[0] if row else False
 
+    def _existing_tables(self, namespace_ids: list[str]) -> set[str]:
+        """Return the table names, among those of ``namespace_ids``, that exist (one catalog query)."""
+        with self._read_conn() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_name = ANY(%s)",
+                ([self._table_name(namespace_id) for namespace_id in namespace_ids],),
+            )
+            return {row[0] for row in cur.fetchall()}
+
     def _validate_namespace(self, namespace_id: str):
         if not self._table_exists(namespace_id):
             raise NamespaceNotFoundException(f"Namespace `{namespace_id}` not found")
@@ -179,9 +264,7 @@ class PostgresEntityBackend(BaseEntityBackend):
         """Return details about the backend."""
         return {"backend": "postgres", "host": self._settings.host, "port": self._settings.port}
 
-    def create_namespace(self, namespace_id: str | None = None) -> Namespace:
-        """Create a new namespace (PostgreSQL table) for entities."""
-        namespace_id = namespace_id or "ns_" + str(uuid.uuid4()).replace("-", "_")
+    def _create_table(self, namespace_id: str) -> None:
         table = self._table_name(namespace_id)
 
         with self.conn.cursor() as cur:
@@ -199,10 +282,38 @@ class PostgresEntityBackend(BaseEntityBackend):
                     """
                 ).format(table=sql.Identifier(table), dim=sql.Literal(self.embedding_dim))
             )
+            # Unfiltered similarity search orders by cosine distance; without this index every query scans
+            # the whole table. CONCURRENTLY (the connection is autocommit) so that reaching this for an
+            # existing, unindexed table does not block its writes while the index builds; a build that
+            # fails leaves an invalid index the planner ignores, so searches fall back to exact scans.
+            cur.execute(
+                sql.SQL(
+                    "CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} USING hnsw (embedding vector_cosine_ops) "
+                    "WITH (m = {m}, ef_construction = {ef_construction})"
+                ).format(
+                    index=sql.Identifier(f"{table}_embedding_hnsw_idx"),
+                    table=sql.Identifier(table),
+                    m=sql.Literal(self._settings.hnsw_m),
+                    ef_construction=sql.Literal(self._settings.hnsw_ef_construction),
+                )
+            )
+
+    def create_namespace(self, namespace_id: str | None = None) -> Namespace:
+        """Create a new namespace (PostgreSQL table) for entities."""
+        namespace_id = namespace_id or "ns_" + str(uuid.uuid4()).replace("-", "_")
+        self._create_table(namespace_id)
 
         with SQLiteManager() as db_manager:
             return db_manager.create_namespace(namespace_id)
 
+    def create_namespaces(self, namespace_ids: list[str]) -> list[Namespace]:
+        """Create several namespace tables, registering them all in one SQLite transaction."""
+        for namespace_id in namespace_ids:
+            self._create_table(namespace_id)
+
+        with SQLiteManager() as db_manager:
+            return db_manager.create_namespaces(namespace_ids)
+
     def get_namespace_details(self, namespace_id: str) -> Namespace:
         self._validate_namespace(namespace_id)
         table = self._table_name(namespace_id)
@@ -212,7 +323,7 @@ class PostgresEntityBackend(BaseEntityBackend):
             if namespace is None:
                 raise NamespaceNotFoundException(f"Namespace {namespace_id} not found")
 
-            with self.conn.cursor() as cur:
+            with self._read_conn() as conn, conn.cursor() as cur:
                 cur.execute(sql.SQL("SELECT COUNT(*) FROM {table}").format(table=sql.Identifier(table)))
                 row = cur.fetchone()
                 namespace.num_entities = row[0] if row else 0
@@ -224,7 +335,7 @@ class PostgresEntityBackend(BaseEntityBackend):
             for namespace in db_manager.search_namespaces(limit):
                 table = self._table_name(namespace.id)
                 if self._table_exists(namespace.id):
-                    with self.conn.cursor() as cur:
+                    with self._read_conn() as conn, conn.cursor() as cur:
                         cur.execute(sql.SQL("SELECT COUNT(*) FROM {table}").format(table=sql.Identifier(table)))
                         row = cur.fetchone()
                         namespace.num_entities = row[0] if row else 0
@@ -233,6 +344,27 @@ class PostgresEntityBackend(BaseEntityBackend):
                 namespaces.append(namespace)
             return namespaces
 
+    def search_namespaces_lite(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Return ``(namespace_id, num_entities)`` pairs, counting every table in one ``UNION ALL`` query."""
+        with SQLiteManager() as db_manager:
+            namespace_ids = [namespace.id for namespace in db_manager.search_namespaces(limit)]
+        if not namespace_ids:
+            return []
+        existing = self._existing_tables(namespace_ids)
+        present = [namespace_id for namespace_id in namespace_ids if self._table_name(namespace_id) in existing]
+        counts: dict[str, int] = {}
+        if present:
+            stmt = sql.SQL(" UNION ALL ").join(
+                sql.SQL("SELECT {namespace_id}, COUNT(*) FROM {table}").format(
+                    namespace_id=sql.Literal(namespace_id), table=sql.Identifier(self._table_name(namespace_id))
+                )
+                for namespace_id in present
+            )
+            with self._read_conn() as conn, conn.cursor() as cur:
+                cur.execute(stmt)
+                counts = {namespace_id: count for namespace_id, count in cur.fetchall()}
+        return [(namespace_id, counts.get(namespace_id, 0)) for namespace_id in namespace_ids]
+
     def _delete_namespace_impl(self, namespace_id: str):
         """Delete a namespace and its table."""
         table = self._table_name(namespace_id)
@@ -244,6 +376,9 @@ class PostgresEntityBackend(BaseEntityBackend):
 
     # ── update_entities hooks ────────────────────────────────────────
 
+    def _embed_query(self, query: str) -> np.ndarray:
+        return np.asarray(self.embedding_model.encode(query))
+
     def _add_entity(self, namespace_id: str, entity_type: str, content_str: str, timestamp: int, metadata: dict) -> str:
         table = self._table_name(namespace_id)
         embedding = self.embedding_model.encode(content_str).tolist()
@@ -298,15 +433,8 @@ class PostgresEntityBackend(BaseEntityBackend):
 
     # ── search / delete ──────────────────────────────────────────────
 
-    def _search_entities_impl(
-        self,
-        namespace_id: str,
-        query: str | None = None,
-        filters: dict | None = None,
-        limit: int = 10,
-    ) -> list[RecordedEntity]:
-        self._validate_namespace(namespace_id)
-        table = self._table_name(namespace_id)
+    def _where_clause(self, filters: dict | None) -> tuple[sql.Composable, list[Any]]:
+        """Translate search filters into a WHERE clause and its parameters."""
         filters = filters or {}
 
         where_parts: list[sql.Composable] = []
@@ -315,6 +443,12 @@ class PostgresEntityBackend(BaseEntityBackend):
             if value is None:
                 continue
 
+            if key == "id" and isinstance(value, (list, tuple, set)):
+                # ID-list pushdown; non-numeric IDs can never match a BIGSERIAL key.
+                where_parts.append(sql.SQL("id = ANY(%s)"))
+                params.append([int(v) for v in value if str(v).isdigit()])
+                continue
+
             if key in self._schema_filter_fields:
                 where_parts.append(sql.SQL("{} = %s").format(sql.Identifier(key)))
                 params.append(value)
@@ -342,24 +476,101 @@ class PostgresEntityBackend(BaseEntityBackend):
             where_parts.append(sql.SQL("metadata @> %s::jsonb"))
             params.append(json.dumps({metadata_key: value}))
         where_clause = sql.SQL(" AND ").join(where_parts) if where_parts else sql.SQL("TRUE")
+        return where_clause, params
+
+    def _search_entities_impl(
+        self,
+        namespace_id: str,
+        query: str | None = None,
+        filters: dict | None = None,
+        limit: int = 10,
+    ) -> list[RecordedEntity]:
+        self._validate_namespace(namespace_id)
+        table = self._table_name(namespace_id)
+        where_clause, params = self._where_clause(filters)
 
         if query is None:
             stmt = sql.SQL("SELECT id, type, content, created_at, metadata FROM {table} WHERE {where} LIMIT %s").format(
                 table=sql.Identifier(table), where=where_clause
             )
             query_params = params + [limit]
-        else:
-            query_embedding = self.embedding_model.encode(query).tolist()
+        elif params:
+            # pgvector applies WHERE after the HNSW scan, which yields only ef_search candidates, so a
+            # filtered search (e.g. guidelines in a namespace full of trajectories) could come back
+            # short or empty. Materializing the filtered rows first keeps the index out of the ORDER BY:
+            # an exact scan over the matching rows only.
+            query_embedding = self._query_embedding(query).tolist()
             stmt = sql.SQL(
-                "SELECT id, type, content, created_at, metadata FROM {table} WHERE {where} ORDER BY embedding <=> %s::vector LIMIT %s"
+                "WITH candidates AS MATERIALIZED "
+                "(SELECT id, type, content, created_at, metadata, embedding FROM {table} WHERE {where}) "
+                "SELECT id, type, content, created_at, metadata FROM candidates ORDER BY embedding <=> %s::vector LIMIT %s"
             ).format(table=sql.Identifier(table), where=where_clause)
             query_params = params + [str(query_embedding), limit]
+        else:
+            query_embedding = self._query_embedding(query).tolist()
+            stmt = sql.SQL("SELECT id, type, content, created_at, metadata FROM {table} ORDER BY embedding <=> %s::vector LIMIT %s").format(
+                table=sql.Identifier(table)
+            )
+            query_params = [str(query_embedding), limit]
 
-        with self.conn.cursor(row_factory=_entity_row_factory) as cur:
+        with self._read_conn() as conn, conn.cursor(row_factory=_entity_row_factory) as cur:
             cur.execute(stmt, query_params)
             results: list[RecordedEntity] = cur.fetchall()
             return results
 
+    def _iter_entities_impl(self, namespace_id: str, filters: dict | None, limit: int, page_size: int) -> Iterator[list[RecordedEntity]]:
+        """Page through a namespace with keyset pagination on the primary key, so deep pages cost the same as the first."""
+        self._validate_namespace(namespace_id)
+        table = self._table_name(namespace_id)
+        where_clause, params = self._where_clause(filters)
+        stmt = sql.SQL("SELECT id, type, content, created_at, metadata FROM {table} WHERE {where} AND id > %s ORDER BY id LIMIT %s").format(
+            table=sql.Identifier(table), where=where_clause
+        )
+        page_size = max(1, page_size)
+        last_id = 0
+        remaining = limit
+        while remaining > 0:
+            batch_size = min(page_size, remaining)
+            with self._read_conn() as conn, conn.cursor(row_factory=_entity_row_factory) as cur:
+                cur.execute(stmt, params + [last_id, batch_size])
+                page: list[RecordedEntity] = cur.fetchall()
+            if not page:
+                return
+            yield page
+            if len(page) < batch_size:
+                return
+            remaining -= len(page)
+            last_id = int(page[-1].id)
+
+    def _get_entities_batch_impl(self, namespace_ids: list[str], limit_per: int) -> dict[str, list[RecordedEntity]]:
+        """Read every namespace in one ``UNION ALL`` query; namespaces without a table are left out."""
+        if not namespace_ids:
+            return {}
+        existing = self._existing_tables(namespace_ids)
+        present = []
+        for namespace_id in namespace_ids:
+            if self._table_name(namespace_id) in existing:
+                present.append(namespace_id)
+            else:
+                logger.error(f"Error fetching entities for namespace {namespace_id}: namespace not found")
+        if not present:
+            return {}
+
+        stmt = sql.SQL(" UNION ALL ").join(
+            sql.SQL("(SELECT {namespace_id} AS namespace_id, id, type, content, created_at, metadata FROM {table} LIMIT %s)").format(
+                namespace_id=sql.Literal(namespace_id), table=sql.Identifier(self._table_name(namespace_id))
+            )
+            for namespace_id in present
+        )
+        batch: dict[str, list[RecordedEntity]] = {namespace_id: [] for namespace_id in present}
+        with self._read_conn() as conn, conn.cursor() as cur:
+            cur.execute(stmt, [limit_per] * len(present))
+            # The entity row factory reads columns by name, so the extra namespace_id column is ignored.
+            make_row = _entity_row_factory(cur)
+            for values in cur.fetchall():
+                batch[values[0]].append(make_row(values))
+        return batch
+
     def _delete_entity_by_id_impl(self, namespace_id: str, entity_id: str):
         try:
             entity_id_int = int(entity_id)
@@ -374,8 +585,28 @@ class PostgresEntityBackend(BaseEntityBackend):
                 (entity_id_int,),
             )
 
+    def _delete_entities_by_ids_impl(self, namespace_id: str, entity_ids: list[str]) -> None:
+        try:
+            ids = [int(entity_id) for entity_id in entity_ids]
+        except ValueError:
+            raise EvolveException(f"Invalid entity IDs: {entity_ids}. Entity IDs must be numeric.")
+        self._validate_namespace(namespace_id)
+        table = self._table_name(namespace_id)
+
+        with self.conn.cursor() as cur:
+            cur.execute(sql.SQL("DELETE FROM {table} WHERE id = ANY(%s)").format(table=sql.Identifier(table)), (ids,))
+
     def close(self):
-        """Close PostgreSQL connection."""
+        """Close PostgreSQL connections."""
+        read_pool = getattr(self, "_read_pool", None)
+        while read_pool is not None and not read_pool.empty():
+            conn = read_pool.get_nowait()
+            if conn is self.conn:
+                continue
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled PostgreSQL connection: {e}")
         try:
             if hasattr(self, "conn") and self.conn and not self.conn.closed:
                 self.conn.close()
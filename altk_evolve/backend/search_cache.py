@@ -0,0 +1,171 @@
+"""
+Semantic cache for public ``search_entities`` reads on vector backends.
+
+Agents repeat themselves: the same or a near-identical query is often issued
+several times in one session. An entry is keyed by ``(namespace, filters,
+limit)``; within a key, a query hits when it is textually identical to a cached
+one up to case and whitespace (no embedding needed) or when its normalized embedding has cosine similarity of at least
+``threshold`` with one (a single matrix-vector product over that key's cached
+embeddings). A hit skips the ANN search and result parsing. Listing reads
+(``query=None``) back ``get_entity_by_id`` and read-after-write checks, so they
+are cached only when ``listings`` is also set; they are then stored under the
+``None`` query and hit only on an exact key match.
+
+Entries expire after ``ttl`` seconds, and every write that goes through the
+backend (add/update/delete entities, metadata patches, namespace deletes)
+drops the namespace's entries, so staleness is bounded by ``ttl`` only for
+writes made by *other* processes.
+
+The cache is off by default (``EVOLVE_SEMCACHE_SIZE=0``): it lives in one
+process, and a near-duplicate hit answers with another query's results. Enable
+it for single-process deployments that can tolerate both.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from altk_evolve.schema.core import RecordedEntity
+
+_GroupKey = tuple[str, str, int]
+
+
+@dataclass
+class _Entry:
+    embedding: np.ndarray | None
+    results: list[RecordedEntity]
+    expires_at: float
+
+
+class _Group:
+    """Cached queries for one (namespace, filters, limit) key plus their stacked embeddings."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str | None, _Entry] = {}
+        self._matrix: np.ndarray | None = None
+        self._matrix_queries: list[str | None] = []
+
+    def invalidate_matrix(self) -> None:
+        self._matrix = None
+
+    def matrix(self) -> tuple[np.ndarray | None, list[str | None]]:
+        if self._matrix is None:
+            queries = [query for query, entry in self.entries.items() if entry.embedding is not None]
+            self._matrix_queries = queries
+            self._matrix = np.stack([self.entries[query].embedding for query in queries]) if queries else None  # type: ignore[misc]
+        return self._matrix, self._matrix_queries
+
+
+class SemanticSearchCache:
+    def __init__(self, size: int = 256, threshold: float = 0.95, ttl: float = 60.0, listings: bool = False):
+        self.size = size
+        self.threshold = threshold
+        self.ttl = ttl
+        self.listings = listings
+        self._groups: dict[_GroupKey, _Group] = {}
+        # Global LRU order over (group key, query) so ``size`` bounds all groups together.
+        self._order: OrderedDict[tuple[_GroupKey, str | None], None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "SemanticSearchCache":
+        from altk_evolve.config.cache import get_cache_settings
+
+        cache_settings = get_cache_settings()
+        return cls(size=cache_settings.size, threshold=cache_settings.threshold, ttl=cache_settings.ttl, listings=cache_settings.listings)
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and self.ttl > 0
+
+    @staticmethod
+    def _group_key(namespace_id: str, filters: dict | None, limit: int) -> _GroupKey:
+        return namespace_id, json.dumps(filters or {}, sort_keys=True, default=str), limit
+
+    @staticmethod
+    def _query_key(query: str | None) -> str | None:
+        """Fold case and collapse whitespace, so trivially different re-asks of a task hit exactly."""
+        return None if query is None else " ".join(query.split()).casefold()
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def _drop(self, group_key: _GroupKey, query: str | None) -> None:
+        group = self._groups.get(group_key)
+        if group is not None and group.entries.pop(query, None) is not None:
+            group.invalidate_matrix()
+            if not group.entries:
+                del self._groups[group_key]
+        self._order.pop((group_key, query), None)
+
+    def get(
+        self, namespace_id: str, query: str | None, filters: dict | None, limit: int, embedding: np.ndarray | None = None
+    ) -> list[RecordedEntity] | None:
+        """Return copies of cached results for ``query`` (exact or near-duplicate), or None on a miss."""
+        group_key = self._group_key(namespace_id, filters, limit)
+        query = self._query_key(query)
+        now = time.monotonic()
+        with self._lock:
+            group = self._groups.get(group_key)
+            if group is None:
+                return None
+            hit = group.entries.get(query)
+            hit_query = query
+            if hit is None and embedding is not None:
+                matrix, queries = group.matrix()
+                if matrix is not None:
+                    similarities = matrix @ self._normalize(embedding)
+                    best = int(np.argmax(similarities))
+                    if similarities[best] >= self.threshold:
+                        hit_query = queries[best]
+                        hit = group.entries[hit_query]
+            if hit is None:
+                return None
+            if hit.expires_at <= now:
+                self._drop(group_key, hit_query)
+                return None
+            self._order.move_to_end((group_key, hit_query))
+            # Post-read plugins may transform results in place; never hand out the cached objects.
+            return [entity.model_copy(deep=True) for entity in hit.results]
+
+    def put(
+        self,
+        namespace_id: str,
+        query: str | None,
+        filters: dict | None,
+        limit: int,
+        results: list[RecordedEntity],
+        embedding: np.ndarray | None = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        group_key = self._group_key(namespace_id, filters, limit)
+        query = self._query_key(query)
+        entry = _Entry(
+            embedding=self._normalize(embedding) if embedding is not None else None,
+            results=[entity.model_copy(deep=True) for entity in results],
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            group = self._groups.setdefault(group_key, _Group())
+            group.entries[query] = entry
+            group.invalidate_matrix()
+            self._order[(group_key, query)] = None
+            self._order.move_to_end((group_key, query))
+            while len(self._order) > self.size:
+                (old_key, old_query), _ = self._order.popitem(last=False)
+                self._drop(old_key, old_query)
+
+    def invalidate(self, namespace_id: str | None = None) -> None:
+        """Drop every entry for ``namespace_id`` (or all entries when None)."""
+        with self._lock:
+            for group_key in [key for key in self._groups if namespace_id is None or key[0] == namespace_id]:
+                for query in list(self._groups[group_key].entries):
+                    self._drop(group_key, query)
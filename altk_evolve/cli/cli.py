@@ -1,25 +1,38 @@
 """Evolve CLI for managing entities and namespaces."""
 
-import importlib.resources
+import contextlib
+import datetime
+import functools
+import itertools
 import json
+import os
 import platform
 import sys
-import zipfile
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 from rich.console import Console
+from rich.live import Live
+from rich.style import Style
 from rich.table import Table
 
-from altk_evolve.frontend.client.evolve_client import EvolveClient
-from altk_evolve.schema.core import Entity
+from altk_evolve.utils import json as fast_json
 from altk_evolve.schema.exceptions import (
     EvolveException,
     NamespaceAlreadyExistsException,
     NamespaceNotFoundException,
 )
 
+# The client stack (backends, numpy, pydantic-settings) and the entity schemas are
+# imported where they are used, so `evolve --help` and commands such as
+# `skills package` never load them.
+if TYPE_CHECKING:
+    from altk_evolve.frontend.client.evolve_client import EvolveClient
+    from altk_evolve.schema.conflict_resolution import EntityUpdate
+    from altk_evolve.schema.core import Entity, RecordedEntity
+
 app = typer.Typer(help="Evolve CLI - Manage entities and namespaces")
 namespaces_app = typer.Typer(help="Namespace management commands")
 entities_app = typer.Typer(help="Entity management commands")
@@ -28,6 +41,7 @@ skills_app = typer.Typer(help="Skill management commands")
 viz_app = typer.Typer(help="Visualization commands")
 hooks_app = typer.Typer(help="Hook seam management commands")
 retention_app = typer.Typer(help="Data retention commands")
+embeddings_app = typer.Typer(help="Embedding model commands")
 
 app.add_typer(namespaces_app, name="namespaces")
 app.add_typer(entities_app, name="entities")
@@ -36,12 +50,16 @@ app.add_typer(skills_app, name="skills")
 app.add_typer(viz_app, name="viz")
 app.add_typer(hooks_app, name="hooks")
 app.add_typer(retention_app, name="retention")
+app.add_typer(embeddings_app, name="embeddings")
 
 console = Console()
 
 
-def get_client() -> EvolveClient:
-    """Get a EvolveClient instance."""
+@functools.lru_cache(maxsize=1)
+def get_client() -> "EvolveClient":
+    """Get the process-wide EvolveClient, building the backend on first use."""
+    from altk_evolve.frontend.client.evolve_client import EvolveClient
+
     return EvolveClient()
 
 
@@ -149,7 +167,7 @@ def list_namespaces(
         table.add_row(
             ns.id,
             str(ns.num_entities) if ns.num_entities is not None else "-",
-            ns.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            _fmt_dt(ns.created_at, seconds=True),
         )
 
     console.print(table)
@@ -169,6 +187,29 @@ def create_namespace(
         raise typer.Exit(1)
 
 
+@namespaces_app.command("create-bulk")
+def create_namespaces_bulk(
+    file: Annotated[Optional[Path], typer.Option("--file", "-f", help="File with one namespace ID per line (default: read stdin)")] = None,
+    skip_existing: Annotated[bool, typer.Option("--skip-existing", help="Ignore IDs that already exist instead of failing")] = False,
+):
+    """Create many namespaces from a list of IDs in one backend call."""
+    with open(file, encoding="utf-8") if file else contextlib.nullcontext(sys.stdin) as lines:
+        namespace_ids = list(dict.fromkeys(line.strip() for line in lines if line.strip()))
+
+    client = get_client()
+    if skip_existing:
+        namespace_ids = [namespace_id for namespace_id in namespace_ids if not client.namespace_exists(namespace_id)]
+    if not namespace_ids:
+        console.print("[yellow]No namespaces to create.[/yellow]")
+        return
+    try:
+        created = client.create_namespaces(namespace_ids)
+    except NamespaceAlreadyExistsException as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Created {len(created)} namespaces.[/green]")
+
+
 @namespaces_app.command("delete")
 def delete_namespace(
     namespace_id: Annotated[str, typer.Argument(help="ID of the namespace to delete")],
@@ -204,7 +245,7 @@ def namespace_info(
         ns = client.get_namespace_details(namespace_id)
         console.print(f"[bold]Namespace:[/bold] {ns.id}")
         console.print(f"[bold]Entities:[/bold] {ns.num_entities or 'unknown'}")
-        console.print(f"[bold]Created:[/bold] {ns.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        console.print(f"[bold]Created:[/bold] {_fmt_dt(ns.created_at, seconds=True)}")
     except NamespaceNotFoundException:
         console.print(f"[red]Namespace '{namespace_id}' not found.[/red]")
         raise typer.Exit(1)
@@ -215,6 +256,58 @@ def namespace_info(
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=256)
+def _fmt_minute(year: int, month: int, day: int, hour: int, minute: int) -> str:
+    return f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
+
+
+def _fmt_dt(dt: datetime.datetime, seconds: bool = False) -> str:
+    """Format as ``YYYY-MM-DD HH:MM[:SS]`` with integer formatting instead of strftime.
+
+    Entities written in one burst share a minute, so the minute prefix is memoized.
+    """
+    text = _fmt_minute(dt.year, dt.month, dt.day, dt.hour, dt.minute)
+    return f"{text}:{dt.second:02d}" if seconds else text
+
+
+# Column layout shared by every entity table; styles are parsed once here rather than per table.
+_ENTITY_COLUMNS: tuple[tuple[str, Style | None, int | None], ...] = (
+    ("ID", Style.parse("cyan"), 20),
+    ("Type", Style.parse("magenta"), None),
+    ("Content", None, 60),
+    ("Created At", Style.parse("dim"), None),
+)
+
+
+def _entity_table(title: str) -> Table:
+    """An empty entities table (ID, Type, Content, Created At) for list/search output."""
+    table = Table(title=title)
+    for header, style, max_width in _ENTITY_COLUMNS:
+        table.add_column(header, style=style or "", max_width=max_width)
+    return table
+
+
+def _add_entity_row(table: Table, entity: "RecordedEntity") -> None:
+    """Append one entity, truncating content to the Content column's width."""
+    content_str = entity.content if isinstance(entity.content, str) else str(entity.content)
+    table.add_row(
+        str(entity.id),
+        entity.type,
+        content_str[:57] + "..." if len(content_str) > 60 else content_str,
+        _fmt_dt(entity.created_at),
+    )
+
+
+def _render_entities(table: Table, entities: Iterable["RecordedEntity"]) -> int:
+    """Add rows to ``table`` as they arrive, repainting live; returns the row count."""
+    total = 0
+    with Live(table, console=console, refresh_per_second=8):
+        for entity in entities:
+            _add_entity_row(table, entity)
+            total += 1
+    return total
+
+
 @entities_app.command("list")
 def list_entities(
     namespace: Annotated[str, typer.Argument(help="Namespace to list entities from")],
@@ -224,38 +317,29 @@ def list_entities(
     """List all entities in a namespace."""
     client = get_client()
 
+    filters = {"type": type_filter} if type_filter else None
+    # Rows are fetched lazily in pages; pull the first one up front so a missing
+    # namespace or an empty result is reported before the live table opens.
     try:
-        filters = {"type": type_filter} if type_filter else None
-        entities = client.get_all_entities(namespace, filters=filters, limit=limit)
+        entities = client.iter_all_entities(namespace, filters=filters, limit=limit)
+        first = next(entities, None)
     except NamespaceNotFoundException:
         console.print(f"[red]Namespace '{namespace}' not found.[/red]")
         raise typer.Exit(1)
 
-    if not entities:
+    if first is None:
         console.print("[yellow]No entities found.[/yellow]")
         return
 
-    table = Table(title=f"Entities in '{namespace}'")
-    table.add_column("ID", style="cyan", max_width=20)
-    table.add_column("Type", style="magenta")
-    table.add_column("Content", max_width=60)
-    table.add_column("Created At", style="dim")
+    table = _entity_table(f"Entities in '{namespace}'")
+    total = _render_entities(table, itertools.chain([first], entities))
 
-    for entity in entities:
-        content = entity.content
-        content_str = str(content)
+    console.print(f"\n[dim]Total: {total} entities[/dim]")
 
-        if len(content_str) > 60:
-            content_str = content_str[:57] + "..."
-        table.add_row(
-            str(entity.id),
-            entity.type,
-            content_str,
-            entity.created_at.strftime("%Y-%m-%d %H:%M"),
-        )
 
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(entities)} entities[/dim]")
+def _stdin_is_interactive() -> bool:
+    """Whether prompts can be answered; scripts and pipes get an error instead of a hang."""
+    return sys.stdin.isatty()
 
 
 @entities_app.command("add")
@@ -265,19 +349,26 @@ def add_entity(
     entity_type: Annotated[str, typer.Option("--type", "-t", help="Entity type")] = "guideline",
     metadata: Annotated[Optional[str], typer.Option("--metadata", "-m", help="JSON metadata")] = None,
     no_conflict_resolution: Annotated[bool, typer.Option("--no-conflict-resolution", help="Disable conflict resolution")] = False,
+    create_namespace: Annotated[
+        bool, typer.Option("--create-namespace", help="Create the namespace if it doesn't exist, without asking")
+    ] = False,
 ):
     """Add a new entity to a namespace."""
     client = get_client()
+    interactive = _stdin_is_interactive()
 
-    # If no content provided, prompt for it
+    # If no content provided, prompt for it (only when there is a terminal to prompt on)
     if not content:
+        if not interactive:
+            console.print("[red]No content given. Pass --content when stdin is not a terminal.[/red]")
+            raise typer.Exit(1)
         content = typer.prompt("Entity content")
 
     # Parse metadata if provided
     parsed_metadata = None
     if metadata:
         try:
-            parsed_metadata = json.loads(metadata)
+            parsed_metadata = fast_json.loads(metadata)
         except json.JSONDecodeError:
             console.print("[red]Invalid JSON metadata.[/red]")
             raise typer.Exit(1)
@@ -286,30 +377,37 @@ def add_entity(
 
     # Ensure namespace exists
     if not client.namespace_exists(namespace):
-        create = typer.confirm(f"Namespace '{namespace}' doesn't exist. Create it?")
-        if create:
+        if not create_namespace and not interactive:
+            console.print(f"[red]Namespace '{namespace}' doesn't exist. Pass --create-namespace to create it.[/red]")
+            raise typer.Exit(1)
+        if create_namespace or typer.confirm(f"Namespace '{namespace}' doesn't exist. Create it?"):
             client.create_namespace(namespace)
             console.print(f"[green]Created namespace:[/green] {namespace}")
         else:
             raise typer.Exit(1)
 
+    from altk_evolve.schema.core import Entity
+
     entity = Entity(
         content=content,
         type=entity_type,
         metadata=parsed_metadata,
     )
 
+    results = _update_entities_or_exit(client, namespace, [entity], enable_conflict_resolution=not no_conflict_resolution)
+    if results:
+        result = results[0]
+        console.print(f"[green]Entity {result.event}:[/green] ID={result.id}")
+    else:
+        console.print("[yellow]No entity was added (possibly filtered by conflict resolution).[/yellow]")
+
+
+def _update_entities_or_exit(
+    client: "EvolveClient", namespace: str, entities: list["Entity"], enable_conflict_resolution: bool
+) -> list["EntityUpdate"]:
+    """Write one batch of same-typed entities, turning failures into a CLI error exit."""
     try:
-        results = client.update_entities(
-            namespace,
-            [entity],
-            enable_conflict_resolution=not no_conflict_resolution,
-        )
-        if results:
-            result = results[0]
-            console.print(f"[green]Entity {result.event}:[/green] ID={result.id}")
-        else:
-            console.print("[yellow]No entity was added (possibly filtered by conflict resolution).[/yellow]")
+        return client.update_entities(namespace, entities, enable_conflict_resolution=enable_conflict_resolution)
     except EvolveException as e:
         console.print(f"[red]Error adding entity: {e}[/red]")
         raise typer.Exit(1)
@@ -324,6 +422,66 @@ def add_entity(
         raise
 
 
+def _read_bulk_entities(lines: Iterable[str], default_type: str) -> Iterator["Entity"]:
+    """Parse JSONL lines of ``{"content": ..., "type"?: ..., "metadata"?: {...}}`` into entities, lazily."""
+    from altk_evolve.schema.core import Entity
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = fast_json.loads(line)
+            if not isinstance(record, dict) or "content" not in record:
+                raise ValueError('expected a JSON object with a "content" field')
+            yield Entity(content=record["content"], type=record.get("type") or default_type, metadata=record.get("metadata") or {})
+        except ValueError as e:  # includes JSONDecodeError and pydantic's ValidationError
+            console.print(f"[red]Invalid entity on line {line_number}: {e}[/red]")
+            raise typer.Exit(1)
+
+
+@entities_app.command("add-bulk")
+def add_entities_bulk(
+    namespace: Annotated[str, typer.Argument(help="Namespace to add entities to")],
+    file: Annotated[Optional[Path], typer.Option("--file", "-f", help="JSONL file of entities (default: read stdin)")] = None,
+    entity_type: Annotated[str, typer.Option("--type", "-t", help="Type for lines that don't set one")] = "guideline",
+    batch_size: Annotated[int, typer.Option("--batch-size", min=1, help="Entities written per update call")] = 64,
+    no_conflict_resolution: Annotated[bool, typer.Option("--no-conflict-resolution", help="Disable conflict resolution")] = False,
+):
+    """Add many entities from JSONL, one `{"content": ..., "type": ..., "metadata": {...}}` per line.
+
+    Entities are written in batches (one update call, embedding pass and insert
+    per batch) instead of one CLI invocation per entity.
+    """
+    client = get_client()
+    if not client.namespace_exists(namespace):
+        client.create_namespace(namespace)
+        console.print(f"[green]Created namespace:[/green] {namespace}")
+
+    events: dict[str, int] = {}
+    # update_entities takes one entity type per call, so batches are buffered per type.
+    pending: dict[str, list["Entity"]] = {}
+
+    def flush(batch_type: str) -> None:
+        for result in _update_entities_or_exit(client, namespace, pending.pop(batch_type), not no_conflict_resolution):
+            events[result.event] = events.get(result.event, 0) + 1
+
+    with open(file, encoding="utf-8") if file else contextlib.nullcontext(sys.stdin) as lines:
+        for entity in _read_bulk_entities(lines, entity_type):
+            batch = pending.setdefault(entity.type, [])
+            batch.append(entity)
+            if len(batch) >= batch_size:
+                flush(entity.type)
+    for batch_type in list(pending):
+        flush(batch_type)
+
+    if not events:
+        console.print("[yellow]No entities were added.[/yellow]")
+        return
+    summary = ", ".join(f"{event} {count}" for event, count in sorted(events.items()))
+    console.print(f"[green]Bulk add complete:[/green] {summary}")
+
+
 @entities_app.command("delete")
 def delete_entity(
     namespace: Annotated[str, typer.Argument(help="Namespace containing the entity")],
@@ -364,27 +522,10 @@ def search_entities(
         console.print("[yellow]No matching entities found.[/yellow]")
         return
 
-    table = Table(title=f"Search results for '{query}'")
-    table.add_column("ID", style="cyan", max_width=20)
-    table.add_column("Type", style="magenta")
-    table.add_column("Content", max_width=60)
-    table.add_column("Created At", style="dim")
-
-    for entity in entities:
-        content = entity.content
-        content_str = str(content)
-
-        if len(content_str) > 60:
-            content_str = content_str[:57] + "..."
-        table.add_row(
-            str(entity.id),
-            entity.type,
-            content_str,
-            entity.created_at.strftime("%Y-%m-%d %H:%M"),
-        )
-
-    console.print(table)
-    console.print(f"\n[dim]Found: {len(entities)} entities[/dim]")
+    # Results are a ranked top-k list, so the backend returns them all at once;
+    # they still go through the same live renderer as `entities list`.
+    total = _render_entities(_entity_table(f"Search results for '{query}'"), entities)
+    console.print(f"\n[dim]Found: {total} entities[/dim]")
 
 
 @entities_app.command("show")
@@ -396,9 +537,7 @@ def show_entity(
     client = get_client()
 
     try:
-        # Search with a broad query and filter by ID
-        entities = client.get_all_entities(namespace, limit=1000)
-        entity = next((e for e in entities if str(e.id) == entity_id), None)
+        entity = client.get_entity_by_id(namespace, entity_id)
 
         if not entity:
             console.print(f"[red]Entity '{entity_id}' not found.[/red]")
@@ -406,10 +545,10 @@ def show_entity(
 
         console.print(f"[bold]ID:[/bold] {entity.id}")
         console.print(f"[bold]Type:[/bold] {entity.type}")
-        console.print(f"[bold]Created:[/bold] {entity.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        console.print(f"[bold]Created:[/bold] {_fmt_dt(entity.created_at, seconds=True)}")
         console.print(f"[bold]Content:[/bold]\n{entity.content}")
         if entity.metadata:
-            console.print(f"[bold]Metadata:[/bold]\n{json.dumps(entity.metadata, indent=2)}")
+            console.print(f"[bold]Metadata:[/bold]\n{fast_json.dumps_pretty(entity.metadata)}")
 
     except NamespaceNotFoundException:
         console.print(f"[red]Namespace '{namespace}' not found.[/red]")
@@ -423,11 +562,11 @@ def consolidate_entities(
     dry_run: Annotated[bool, typer.Option("--dry-run", help="Show clusters without modifying anything")] = True,
 ):
     """Cluster similar guideline entities by task description similarity."""
-    from altk_evolve.config.evolve import evolve_config
+    from altk_evolve.config.evolve import get_evolve_config
 
     client = get_client()
 
-    effective_threshold = threshold if threshold is not None else evolve_config.clustering_threshold
+    effective_threshold = threshold if threshold is not None else get_evolve_config().clustering_threshold
 
     console.print(f"[bold]Clustering entities in '{namespace}'[/bold]")
     console.print(f"  Threshold: {effective_threshold}")
@@ -538,15 +677,19 @@ def sync_phoenix(
     project: Annotated[Optional[str], typer.Option("--project", "-p", help="Phoenix project name")] = None,
     limit: Annotated[int, typer.Option(help="Maximum number of spans to fetch")] = 100,
     include_errors: Annotated[bool, typer.Option("--include-errors", help="Include failed/error spans")] = False,
+    batch_size: Annotated[int, typer.Option("--batch-size", min=1, help="Traces generated and stored per batch")] = 64,
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help="Maximum trajectories processed in parallel")] = 8,
     guidelines_mode: Annotated[
         Optional[str],
         typer.Option("--guidelines-mode", help="Guideline generation mode: regular, consistency, or both"),
     ] = None,
 ):
     """Sync trajectories from Arize Phoenix and generate guidelines."""
-    from altk_evolve.config.guidelines import guidelines_settings
+    from altk_evolve.config.guidelines import get_guidelines_settings
     from altk_evolve.sync.phoenix_sync import PhoenixSync
 
+    guidelines_settings = get_guidelines_settings()
+
     if guidelines_mode is not None:
         if guidelines_mode not in ("regular", "consistency", "both"):
             console.print(f"[red]Invalid --guidelines-mode '{guidelines_mode}'. Choose: regular, consistency, both.[/red]")
@@ -568,7 +711,7 @@ def sync_phoenix(
     console.print()
 
     try:
-        result = syncer.sync(limit=limit, include_errors=include_errors)
+        result = syncer.sync(limit=limit, include_errors=include_errors, batch_size=batch_size, concurrency=concurrency)
 
         table = Table(title="Sync Results")
         table.add_column("Metric", style="cyan")
@@ -596,14 +739,94 @@ def sync_phoenix(
 # =============================================================================
 
 
+# Formats that are already compressed: deflating them again burns CPU for no gain.
+_STORED_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".whl", ".skill"})
+_ZIP_BUFFER_SIZE = 1 << 20
+# The earliest timestamp a zip entry can hold.
+_REPRODUCIBLE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def _walk_files(root: Path, prefix: str = "") -> Iterator[tuple[str, str]]:
+    """Yield ``(path, relative_posix_path)`` for every file under ``root``.
+
+    ``os.scandir`` reports entry types from the directory listing itself, so
+    unlike ``Path.rglob`` + ``is_file()`` this needs no ``stat`` per entry.
+    Symlinked directories are not descended into.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            relative = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(Path(entry.path), f"{relative}/")
+            elif entry.is_file():
+                yield entry.path, relative
+
+
+def _package_one(
+    skill_name: str, skill_path: Path, output_dir: Path, compress_level: int, reproducible: bool = False
+) -> tuple[str, bool, str]:
+    """Zip one skill directory into ``<output_dir>/<skill_name>.skill``.
+
+    Members are written in sorted path order. With ``reproducible`` every
+    member also gets a fixed timestamp and normalized permissions, so the same
+    tree always produces a byte-identical archive.
+
+    Returns ``(skill_name, ok, message)`` where message is the output path or the error.
+    """
+    import shutil
+    import stat
+    import zipfile
+
+    output_file = output_dir / f"{skill_name}.skill"
+    try:
+        with (
+            open(output_file, "wb", buffering=_ZIP_BUFFER_SIZE) as out,
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED, compresslevel=compress_level) as zf,
+        ):
+            for file_path, relative in sorted(_walk_files(skill_path), key=lambda item: item[1]):
+                # Archive path includes skill name as top-level directory
+                zinfo = zipfile.ZipInfo.from_file(file_path, f"{skill_name}/{relative}")
+                if reproducible:
+                    zinfo.date_time = _REPRODUCIBLE_DATE_TIME
+                    mode = 0o755 if zinfo.external_attr >> 16 & 0o111 else 0o644
+                    zinfo.external_attr = (stat.S_IFREG | mode) << 16
+                if os.path.splitext(relative)[1].lower() in _STORED_SUFFIXES:
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zinfo._compresslevel = compress_level  # what ZipFile.write sets; public as compress_level only on 3.13+
+                # ZipFile.write copies in 8 KiB chunks; larger reads cut syscalls and feed deflate bigger blocks.
+                with open(file_path, "rb", buffering=_ZIP_BUFFER_SIZE) as src, zf.open(zinfo, "w") as dst:
+                    shutil.copyfileobj(src, dst, _ZIP_BUFFER_SIZE)
+    except (OSError, PermissionError, zipfile.LargeZipFile, zipfile.BadZipFile, ValueError) as e:
+        return skill_name, False, str(e)
+    return skill_name, True, str(output_file)
+
+
 @skills_app.command("package")
 def package_skills(
     source: Annotated[Path, typer.Option("--source", "-s", help="Source skills directory")] = Path("plugins/evolve/skills"),
     output: Annotated[Path, typer.Option("--output", "-o", help="Output directory for .skill files")] = Path("dist"),
     clean: Annotated[bool, typer.Option("--clean", help="Remove existing .skill files before packaging")] = False,
     dry_run: Annotated[bool, typer.Option("--dry-run", help="Show what would be packaged without creating files")] = False,
+    compress_level: Annotated[
+        Optional[int],
+        typer.Option(
+            "--compress-level", min=0, max=9, help="Deflate level: 0 is fastest, 9 is smallest (default: 6, or 9 with --reproducible)"
+        ),
+    ] = None,
+    workers: Annotated[Optional[int], typer.Option("--workers", min=1, help="Skills packaged in parallel (default: CPU count)")] = None,
+    reproducible: Annotated[
+        bool,
+        typer.Option(
+            "--reproducible/--no-reproducible", help="Fix timestamps and permissions so identical skills give byte-identical archives"
+        ),
+    ] = False,
 ):
     """Package plugin skills into .skill files for distribution."""
+    if compress_level is None:
+        # A reproducible archive is built once and cached downstream, so spend the CPU on size.
+        compress_level = 9 if reproducible else 6
     # Validate source directory
     if not source.exists():
         console.print(f"[red]Source directory not found: {source}[/red]")
@@ -635,7 +858,7 @@ def package_skills(
     table.add_column("Output", style="dim")
 
     for skill_name, skill_path in skill_dirs:
-        file_count = sum(1 for _ in skill_path.rglob("*") if _.is_file())
+        file_count = sum(1 for _ in _walk_files(skill_path))
         output_file = output / f"{skill_name}.skill"
         table.add_row(skill_name, str(file_count), str(output_file))
 
@@ -657,26 +880,26 @@ def package_skills(
             for skill_file in existing_skills:
                 skill_file.unlink()
 
-    # Package each skill
+    # Package skills in parallel. zlib releases the GIL while deflating, so
+    # threads scale across cores without pickling paths into subprocesses.
     packaged = 0
     failed = 0
-    for skill_name, skill_path in skill_dirs:
-        output_file = output / f"{skill_name}.skill"
-
-        try:
-            with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-                for file_path in skill_path.rglob("*"):
-                    if file_path.is_file():
-                        # Archive path includes skill name as top-level directory
-                        arcname = f"{skill_name}/{file_path.relative_to(skill_path)}"
-                        zf.write(file_path, arcname)
-
-            console.print(f"[green]Packaged:[/green] {skill_name} -> {output_file}")
-            packaged += 1
-
-        except (OSError, PermissionError, zipfile.LargeZipFile, zipfile.BadZipFile, ValueError) as e:
-            console.print(f"[red]Failed to package {skill_name}: {e}[/red]")
-            failed += 1
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    max_workers = min(workers or os.cpu_count() or 1, len(skill_dirs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_package_one, skill_name, skill_path, output, compress_level, reproducible)
+            for skill_name, skill_path in skill_dirs
+        ]
+        for future in as_completed(futures):
+            skill_name, ok, message = future.result()
+            if ok:
+                console.print(f"[green]Packaged:[/green] {skill_name} -> {message}")
+                packaged += 1
+            else:
+                console.print(f"[red]Failed to package {skill_name}: {message}[/red]")
+                failed += 1
 
     if failed == 0:
         console.print(f"\n[bold green]Successfully packaged {packaged}/{len(skill_dirs)} skill(s)[/bold green]")
@@ -710,6 +933,8 @@ def serve_viz(
 def _load_hooks_template() -> str:
     """Read the bundled default hooks config template (READI active, regex
     commented). Packaged as data so `evolve hooks init` works from an install."""
+    import importlib.resources
+
     return importlib.resources.files("altk_evolve.cli.templates").joinpath("hooks.yaml").read_text(encoding="utf-8")
 
 
@@ -766,5 +991,73 @@ def hooks_init(
     console.print(hooks_init_platform_note(platform.system()), style="yellow", markup=False, highlight=False)
 
 
+# =============================================================================
+# Embeddings Commands
+# =============================================================================
+
+
+def _configured_embedding_model() -> str:
+    """The embedding model the configured backend would load itself."""
+    from altk_evolve.config.evolve import get_evolve_config
+
+    if get_evolve_config().backend == "postgres":
+        from altk_evolve.config.postgres import get_postgres_db_settings
+
+        return get_postgres_db_settings().embedding_model
+    from altk_evolve.config.milvus import get_milvus_client_settings
+
+    return get_milvus_client_settings().embedding_model
+
+
+@embeddings_app.command("daemon")
+def embeddings_daemon(
+    model: Annotated[
+        Optional[str],
+        typer.Option("--model", "-m", help="sentence-transformers model to serve. Defaults to the configured backend's model."),
+    ] = None,
+    socket_path: Annotated[
+        Optional[Path],
+        typer.Option("--socket", help="Unix socket path. Defaults to a per-model socket under ~/.cache/evolve."),
+    ] = None,
+    idle_timeout: Annotated[
+        float,
+        typer.Option("--idle-timeout", help="Exit after this many seconds without requests (0 disables)."),
+    ] = 900.0,
+):
+    """Serve embeddings from one long-lived process.
+
+    Backends connect here (and start it on demand) when EVOLVE_EMBEDDING_DAEMON=true,
+    so each CLI invocation skips reloading the embedding model.
+    """
+    from altk_evolve.backend.embedding_daemon import default_socket_path, serve
+
+    model_name = model or _configured_embedding_model()
+    path = socket_path or default_socket_path(model_name)
+    console.print(f"[bold]Embedding daemon[/bold] serving '{model_name}' on {path}")
+    try:
+        serve(model_name, path, idle_timeout=idle_timeout or None)
+    except KeyboardInterrupt:
+        pass
+    console.print("[dim]Embedding daemon stopped.[/dim]")
+
+
+@embeddings_app.command("stop")
+def embeddings_stop(
+    model: Annotated[
+        Optional[str],
+        typer.Option("--model", "-m", help="Model whose daemon to stop. Defaults to the configured backend's model."),
+    ] = None,
+    socket_path: Annotated[Optional[Path], typer.Option("--socket", help="Unix socket path of the daemon to stop.")] = None,
+):
+    """Stop a running embedding daemon."""
+    from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient
+
+    client = EmbeddingDaemonClient(model or _configured_embedding_model(), socket_path=socket_path, spawn=False)
+    if client.stop():
+        console.print(f"[green]Stopped embedding daemon at {client.socket_path}[/green]")
+    else:
+        console.print(f"[yellow]No embedding daemon running at {client.socket_path}[/yellow]")
+
+
 if __name__ == "__main__":
     app()
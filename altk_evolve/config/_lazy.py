@@ -0,0 +1,19 @@
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_settings(module_name: str, **getters: Callable[[], Any]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that resolves each settings singleton through its getter.
+
+    Importing a config module then parses no settings: ``llm_settings`` and the
+    like are read from the environment on first access, via their cached
+    ``get_*`` function.
+    """
+
+    def __getattr__(name: str) -> Any:
+        getter = getters.get(name)
+        if getter is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return getter()
+
+    return __getattr__
@@ -0,0 +1,23 @@
+from functools import lru_cache
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from altk_evolve.config._lazy import lazy_settings
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EVOLVE_SEMCACHE_", env_file=".env", extra="ignore")
+    size: int = Field(default=0, description="Cached search queries per backend (0, the default, disables the semantic search cache)")
+    threshold: float = Field(default=0.95, description="Cosine similarity at which a cached query answers a new one")
+    ttl: float = Field(default=60.0, description="Seconds a cached search result stays valid")
+    listings: bool = Field(default=False, description="Also cache listing reads (searches without a query) while the cache is enabled")
+
+
+@lru_cache(maxsize=1)
+def get_cache_settings() -> CacheSettings:
+    return CacheSettings()
+
+
+cache_settings: CacheSettings
+
+__getattr__ = lazy_settings(__name__, cache_settings=get_cache_settings)
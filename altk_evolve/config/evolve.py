@@ -1,9 +1,12 @@
+from functools import lru_cache
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Literal
 
 from altk_evolve.config.hooks import HooksConfig
 
+from altk_evolve.config._lazy import lazy_settings
+
 
 class EvolveConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="EVOLVE_", env_file=".env", extra="ignore")
@@ -12,6 +15,9 @@ class EvolveConfig(BaseSettings):
     settings: BaseSettings | None = None
     clustering_threshold: float = 0.80
     segmentation_enabled: bool = True
+    # Embed through a shared, auto-started daemon (see backend/embedding_daemon.py)
+    # instead of loading the sentence-transformers model in every process.
+    embedding_daemon: bool = False
     hooks: HooksConfig = Field(default_factory=HooksConfig)
     # Consolidation dosage knobs (see docs: capability-dependent dosage).
     #   none     - skip consolidation entirely
@@ -47,5 +53,12 @@ class EvolveConfig(BaseSettings):
         return self
 
 
+@lru_cache(maxsize=1)
+def get_evolve_config() -> EvolveConfig:
+    return EvolveConfig()
+
+
 # to reload settings call evolve_config.__init__()
-evolve_config = EvolveConfig()
+evolve_config: EvolveConfig
+
+__getattr__ = lazy_settings(__name__, evolve_config=get_evolve_config)
@@ -1,10 +1,20 @@
+from functools import lru_cache
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from altk_evolve.config._lazy import lazy_settings
+
 
 class FilesystemSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="EVOLVE_", env_file=".env", extra="ignore")
     data_dir: str = Field(default="evolve_data", description="Directory to store JSON data files")
 
 
-filesystem_settings = FilesystemSettings()
+@lru_cache(maxsize=1)
+def get_filesystem_settings() -> FilesystemSettings:
+    return FilesystemSettings()
+
+
+filesystem_settings: FilesystemSettings
+
+__getattr__ = lazy_settings(__name__, filesystem_settings=get_filesystem_settings)
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -6,6 +7,8 @@ from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import Self
 
+from altk_evolve.config._lazy import lazy_settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,5 +39,12 @@ class GuidelinesSettings(BaseSettings):
         return v
 
 
+@lru_cache(maxsize=1)
+def get_guidelines_settings() -> GuidelinesSettings:
+    return GuidelinesSettings()
+
+
 # to reload settings call guidelines_settings.__init__()
-guidelines_settings = GuidelinesSettings()
+guidelines_settings: GuidelinesSettings
+
+__getattr__ = lazy_settings(__name__, guidelines_settings=get_guidelines_settings)
@@ -1,9 +1,12 @@
 import os
+from functools import lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Literal
 
+from altk_evolve.config._lazy import lazy_settings
+
 
 def _default_model_name() -> str:
     model_name = os.getenv("EVOLVE_MODEL_NAME")
@@ -41,7 +44,18 @@ class LLMSettings(BaseSettings):
     allow_dynamic_categories: bool = False
     confirm_new_categories: bool = False
     custom_llm_provider: str | None = Field(default_factory=_default_custom_provider)
+    # Seconds an identical conflict-resolution prompt reuses the previous LLM verdict (0 disables).
+    conflict_resolution_cache_ttl: float = 300.0
+    # SQLite file caching guideline-generation and consolidation responses by prompt ("" disables).
+    llm_cache_path: str = ""
+
+
+@lru_cache(maxsize=1)
+def get_llm_settings() -> LLMSettings:
+    return LLMSettings()
 
 
 # to reload settings call llm_settings.__init__()
-llm_settings = LLMSettings()
+llm_settings: LLMSettings
+
+__getattr__ = lazy_settings(__name__, llm_settings=get_llm_settings)
@@ -1,6 +1,9 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
+from altk_evolve.config._lazy import lazy_settings
+
 
 class MilvusDBSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="EVOLVE_", env_file=".env", extra="ignore")
@@ -10,6 +13,8 @@ class MilvusDBSettings(BaseSettings):
     db_name: str = Field(default="")
     token: str = Field(default="")
     timeout: float | None = Field(default=None)
+    # Keep the gRPC channel alive between calls so idle periods (e.g. between dashboard polls) don't force a reconnect.
+    keep_alive: bool = Field(default=True)
     sqlite_uri: str = Field(default="entities.sqlite.db")
     embedding_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2")
 
@@ -19,6 +24,18 @@ class MilvusOtherSettings(BaseSettings):
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
 
 
+@lru_cache(maxsize=1)
+def get_milvus_client_settings() -> MilvusDBSettings:
+    return MilvusDBSettings()
+
+
+@lru_cache(maxsize=1)
+def get_milvus_other_settings() -> MilvusOtherSettings:
+    return MilvusOtherSettings()
+
+
 # to reload settings call milvus_client_settings.__init__()
-milvus_client_settings = MilvusDBSettings()
-milvus_other_settings = MilvusOtherSettings()
+milvus_client_settings: MilvusDBSettings
+milvus_other_settings: MilvusOtherSettings
+
+__getattr__ = lazy_settings(__name__, milvus_client_settings=get_milvus_client_settings, milvus_other_settings=get_milvus_other_settings)
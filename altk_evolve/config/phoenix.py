@@ -1,6 +1,9 @@
+from functools import lru_cache
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from altk_evolve.config._lazy import lazy_settings
+
 
 class PhoenixSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="PHOENIX_", env_file=".env", extra="ignore")
@@ -8,4 +11,11 @@ class PhoenixSettings(BaseSettings):
     project: str = Field(default="default", description="Phoenix project name")
 
 
-phoenix_settings = PhoenixSettings()
+@lru_cache(maxsize=1)
+def get_phoenix_settings() -> PhoenixSettings:
+    return PhoenixSettings()
+
+
+phoenix_settings: PhoenixSettings
+
+__getattr__ = lazy_settings(__name__, phoenix_settings=get_phoenix_settings)
@@ -1,6 +1,9 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
+from altk_evolve.config._lazy import lazy_settings
+
 
 class PostgresDBSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="EVOLVE_PG_", env_file=".env", extra="ignore")
@@ -12,7 +15,21 @@ class PostgresDBSettings(BaseSettings):
     dbname: str = Field(default="evolve")
     auto_create_db: bool = Field(default=False)
     bootstrap_db: str = Field(default="postgres")
+    read_pool_size: int = Field(default=4, description="Connections concurrent reads may use, including the main one (1 disables pooling)")
+    pool_timeout: float = Field(default=10.0, description="Seconds a read waits for a free pooled connection before failing")
+    hnsw_m: int = Field(default=16, description="Graph degree of the HNSW embedding index built for new namespace tables")
+    hnsw_ef_construction: int = Field(default=64, description="Candidate list size while building the HNSW embedding index")
+    hnsw_ef_search: int = Field(
+        default=64, description="Candidate list size per unfiltered similarity search; higher trades latency for recall"
+    )
+
+
+@lru_cache(maxsize=1)
+def get_postgres_db_settings() -> PostgresDBSettings:
+    return PostgresDBSettings()
 
 
 # to reload settings call postgres_db_settings.__init__()
-postgres_db_settings = PostgresDBSettings()
+postgres_db_settings: PostgresDBSettings
+
+__getattr__ = lazy_settings(__name__, postgres_db_settings=get_postgres_db_settings)
@@ -1,8 +1,10 @@
+import atexit
 import datetime
 import logging
 import os
 import sqlite3
 import threading
+from collections.abc import Iterable
 
 from altk_evolve.schema.core import Namespace
 from altk_evolve.schema.exceptions import NamespaceAlreadyExistsException
@@ -23,6 +25,62 @@ def convert_timestamp(time: bytes) -> datetime.datetime:
 sqlite3.register_adapter(datetime.datetime, adapt_datetime_epoch)
 sqlite3.register_converter("timestamp", convert_timestamp)
 
+# One connection (and the lock guarding it) per database path, shared by every
+# SQLiteManager in the process. Backends open a manager per namespace call, so
+# reusing the handle skips reconnecting and re-running the schema DDL each time.
+_connections: dict[str, tuple[sqlite3.Connection, threading.Lock]] = {}
+_connections_lock = threading.Lock()
+
+# WAL lets readers proceed alongside a writer and, with synchronous=NORMAL, only
+# fsyncs at checkpoints instead of on every commit.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+_CREATE_NAMESPACES_TABLE = """
+    CREATE TABLE IF NOT EXISTS namespaces (
+        id           TEXT PRIMARY KEY,
+        created_at   TIMESTAMP NOT NULL
+    )
+"""
+
+
+def _shared_connection(db_path: str) -> tuple[sqlite3.Connection, threading.Lock, bool]:
+    """Return ``(connection, lock, created)`` for ``db_path``, opening it on first use."""
+    with _connections_lock:
+        shared = _connections.get(db_path)
+        if shared is not None:
+            if os.path.exists(db_path):
+                return shared[0], shared[1], False
+            # The file was removed underneath us; don't keep writing to the unlinked inode.
+            shared[0].close()
+            del _connections[db_path]
+        # Autocommit: single statements are atomic on their own; multi-statement
+        # writes open their own transaction.
+        connection = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        for pragma in _PRAGMAS:
+            connection.execute(pragma)
+        lock = threading.Lock()
+        if db_path != ":memory:":
+            # Each ":memory:" connect is a distinct database, so only file-backed handles are shared.
+            _connections[db_path] = (connection, lock)
+        return connection, lock, True
+
+
+def close_shared_connections() -> None:
+    """Close every cached connection (e.g. before deleting the database files)."""
+    with _connections_lock:
+        for connection, _ in _connections.values():
+            connection.close()
+        _connections.clear()
+
+
+atexit.register(close_shared_connections)
+
 
 class SQLiteManager:
     """A database for any resources that can't be generalized across backends."""
@@ -37,16 +95,8 @@ class SQLiteManager:
         assert self.connection is not None
         with self._lock:
             try:
-                self.connection.execute("BEGIN")
-                self.connection.execute("""
-                    CREATE TABLE IF NOT EXISTS namespaces (
-                        id           TEXT PRIMARY KEY,
-                        created_at   TIMESTAMP NOT NULL
-                    )
-                """)
-                self.connection.execute("COMMIT")
+                self.connection.execute(_CREATE_NAMESPACES_TABLE)
             except Exception as e:
-                self.connection.execute("ROLLBACK")
                 logger.error(f"Failed to create namespaces table: {e}")
                 raise
 
@@ -56,7 +106,6 @@ class SQLiteManager:
         created_at = datetime.datetime.now(datetime.timezone.utc)
         with self._lock:
             try:
-                self.connection.execute("BEGIN")
                 self.connection.execute(
                     """
                     INSERT INTO namespaces (
@@ -66,15 +115,36 @@ class SQLiteManager:
                 """,
                     (namespace_id, created_at),
                 )
-                self.connection.execute("COMMIT")
             except sqlite3.IntegrityError as e:
                 raise NamespaceAlreadyExistsException(f'Namespace "{namespace_id}" already exists.') from e
             except Exception as e:
-                self.connection.execute("ROLLBACK")
                 logger.error(f"Failed to create namespace: {e}")
                 raise
         return Namespace(id=namespace_id, created_at=created_at)
 
+    def create_namespaces(self, namespace_ids: Iterable[str]) -> list[Namespace]:
+        """Insert several namespaces in one transaction; none are created if any already exists."""
+        assert self._lock is not None
+        assert self.connection is not None
+        namespace_ids = list(namespace_ids)
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(
+                    "INSERT INTO namespaces (id, created_at) VALUES (?, ?)",
+                    [(namespace_id, created_at) for namespace_id in namespace_ids],
+                )
+                self.connection.execute("COMMIT")
+            except sqlite3.IntegrityError as e:
+                self.connection.execute("ROLLBACK")
+                raise NamespaceAlreadyExistsException(f"One of the namespaces already exists: {e}") from e
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to create namespaces: {e}")
+                raise
+        return [Namespace(id=namespace_id, created_at=created_at) for namespace_id in namespace_ids]
+
     def get_namespace(self, namespace_id: str) -> Namespace | None:
         assert self._lock is not None
         assert self.connection is not None
@@ -114,9 +184,7 @@ class SQLiteManager:
         assert self._lock is not None
         assert self.connection is not None
         with self._lock:
-            self.connection.execute("BEGIN")
             self.connection.execute("DELETE FROM namespaces WHERE id = ?", (namespace_id,))
-            self.connection.execute("COMMIT")
 
     def reset(self) -> None:
         """Drop and recreate every table."""
@@ -126,22 +194,24 @@ class SQLiteManager:
             try:
                 self.connection.execute("BEGIN")
                 self.connection.execute("DROP TABLE IF EXISTS namespaces")
+                self.connection.execute(_CREATE_NAMESPACES_TABLE)
                 self.connection.execute("COMMIT")
-                self._create_namespace_table()
             except Exception as e:
                 self.connection.execute("ROLLBACK")
                 logger.error(f"Failed to reset tables: {e}")
                 raise
 
     def close(self) -> None:
+        """Release this manager's handle; shared file-backed connections stay open for reuse."""
         if self.connection:
-            self.connection.close()
+            if _connections.get(self.db_path, (None,))[0] is not self.connection:
+                self.connection.close()
             self.connection = None
 
     def __enter__(self) -> "SQLiteManager":
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._lock = threading.Lock()
-        self._create_namespace_table()
+        self.connection, self._lock, created = _shared_connection(self.db_path)
+        if created:
+            self._create_namespace_table()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -1,14 +1,61 @@
-from typing import Any, List, Optional
+from collections import Counter
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, List, Optional
+import asyncio
+import heapq
 import logging
+import threading
+import time
 from pydantic import BaseModel
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Response
+from starlette.concurrency import run_in_threadpool
+
+if TYPE_CHECKING:
+    from altk_evolve.frontend.client.evolve_client import EvolveClient
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 MAX_ENTITY_LIMIT = 500
+DASHBOARD_RECENT_LIMIT = 10
+
+# /dashboard payloads keyed by backend. The UI polls this endpoint and each
+# computation costs 1 + N backend calls, so a payload is reused for
+# DASHBOARD_CACHE_TTL seconds and concurrent misses share one computation.
+# Writes made through this router drop the cache; writes from other clients
+# show up once the entry expires.
+DASHBOARD_CACHE_TTL = 30
+_dashboard_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+_dashboard_inflight: dict[tuple[str, str], Future] = {}
+_dashboard_generation = 0
+_dashboard_lock = threading.Lock()
+# The server-side cache above is dropped on writes; a browser-cached copy would
+# not be, so browsers must revalidate every poll.
+DASHBOARD_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def _snippet(content: Any, max_len: int = 100) -> str:
+    """First ``max_len`` characters of ``content`` (stringified if needed), with "..." when cut."""
+    text = content if type(content) is str else str(content)
+    head = text[:max_len]
+    # Slicing an exact str to or past its end returns the same object, so identity tells whether it was cut.
+    return text if head is text else head + "..."
+
+
+async def _client_dep() -> "EvolveClient":
+    """Route dependency resolving the shared client.
+
+    mcp_server imports this module to mount the router, so get_client cannot be
+    imported at the top. Once the client is initialized it is returned on the
+    event loop, without a threadpool hop or the init lock; only the lazy setup
+    (which does backend I/O) runs in the threadpool.
+    """
+    from altk_evolve.frontend.mcp.mcp_server import get_client, get_initialized_client
+
+    client = get_initialized_client()
+    return client if client is not None else await run_in_threadpool(get_client)
 
 
 class NamespaceCreateRequest(BaseModel):
@@ -21,68 +68,118 @@ class EntityCreateRequest(BaseModel):
     metadata: dict = {}
 
 
-@router.get("/dashboard")
-def get_dashboard() -> dict[str, Any]:
-    from altk_evolve.frontend.mcp.mcp_server import get_client
-
-    client = get_client()
+def clear_dashboard_cache() -> None:
+    global _dashboard_generation
+    with _dashboard_lock:
+        _dashboard_cache.clear()
+        # In-flight computations may have read pre-write state; keep them out of the cache.
+        _dashboard_generation += 1
+
+
+async def _cached_dashboard(client) -> dict[str, Any]:
+    key = ("dashboard", str(client.config.backend))
+    with _dashboard_lock:
+        cached = _dashboard_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        future = _dashboard_inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _dashboard_inflight[key] = Future()
+            generation = _dashboard_generation
+    if not is_owner:
+        return await asyncio.wrap_future(future)
 
-    # 1. Backend health
     try:
-        health = client.ready()
-    except Exception as e:
-        logger.error(f"Error checking health: {e}")
-        health = False
+        payload = await _compute_dashboard(client)
+    except BaseException as e:
+        with _dashboard_lock:
+            _dashboard_inflight.pop(key, None)
+        future.set_exception(e)
+        raise
+    with _dashboard_lock:
+        _dashboard_inflight.pop(key, None)
+        if generation == _dashboard_generation:
+            _dashboard_cache[key] = (time.monotonic() + DASHBOARD_CACHE_TTL, payload)
+    future.set_result(payload)
+    return payload
 
-    # 2. Namespace count
-    try:
-        namespaces = client.all_namespaces(limit=1000)
-        namespace_count = len(namespaces)
-    except Exception as e:
-        logger.error(f"Error fetching namespaces: {e}")
+
+# The read-only routes below are ``async def`` so a burst of requests waits on
+# the event loop; every blocking client call (including memory hooks fired by
+# backend reads) runs in the threadpool via ``run_in_threadpool``.
+
+
+@router.get("/dashboard")
+async def get_dashboard(response: Response, client: "EvolveClient" = Depends(_client_dep)) -> dict[str, Any]:
+    response.headers["Cache-Control"] = DASHBOARD_CACHE_CONTROL
+    return await _cached_dashboard(client)
+
+
+async def _compute_dashboard(client) -> dict[str, Any]:
+    # 1. Backend health and 2. namespace count, fetched concurrently
+    health, namespaces = await asyncio.gather(
+        run_in_threadpool(client.ready), run_in_threadpool(client.all_namespaces, limit=1000), return_exceptions=True
+    )
+    if isinstance(health, Exception):
+        logger.error(f"Error checking health: {health}")
+        health = False
+    if isinstance(namespaces, Exception):
+        logger.error(f"Error fetching namespaces: {namespaces}")
+        client.invalidate_ready_cache()
         namespaces = []
-        namespace_count = 0
+    namespace_count = len(namespaces)
 
     # 3. Entity counts and recent entities across namespaces
     # For MVP, we will aggregate from all available namespaces up to the limit
+    # One pass over the namespaces reads each model attribute once.
     total_entities = 0
-    approximate_type_breakdown: dict[str, int] = {}
-    recent_entities: list[dict[str, Any]] = []
-
+    namespace_ids: list[str] = []
     for ns in namespaces:
+        namespace_ids.append(ns.id)
+        total_entities += ns.num_entities or 0
+    approximate_type_breakdown: Counter[str] = Counter()
+    recent_heap: list[tuple[str, int, dict[str, Any]]] = []
+    seen = 0
+
+    samples: dict[str, list] = {}
+    if namespace_ids:
+        # One batched read for every namespace's sample; backends fan out or
+        # combine the per-namespace reads themselves.
         try:
-            total_entities += ns.num_entities or 0
-            # Fetch only a small sample per namespace for the dashboard
-            ns_entities = client.get_all_entities(ns.id, limit=10)
-
-            for entity in ns_entities:
-                etype = entity.type or "unknown"
-                approximate_type_breakdown[etype] = approximate_type_breakdown.get(etype, 0) + 1
-
-                # Safely handle non-string content before slicing
-                content = entity.content
-                if isinstance(content, str):
-                    snippet = content[:100] + "..." if len(content) > 100 else content
-                else:
-                    safe_str = str(content)
-                    snippet = safe_str[:100] + "..." if len(safe_str) > 100 else safe_str
-
-                recent_entities.append(
-                    {
-                        "id": entity.id,
-                        "type": entity.type,
-                        "content": snippet,
-                        "namespace": ns.id,
-                        "created_at": entity.created_at.isoformat() if hasattr(entity, "created_at") and entity.created_at else None,
-                    }
-                )
+            samples = await run_in_threadpool(client.get_entities_batch, namespace_ids, limit_per=10)
         except Exception as e:
-            logger.error(f"Error fetching entities for namespace {ns.id}: {e}")
+            logger.error(f"Error fetching entities for namespaces: {e}")
+            client.invalidate_ready_cache()
+
+    for ns_id, ns_entities in samples.items():
+        approximate_type_breakdown.update(entity.type or "unknown" for entity in ns_entities)
+        for entity in ns_entities:
+            # Keep only the newest DASHBOARD_RECENT_LIMIT entities in a min-heap; ties go
+            # to the entity seen first. Entities that cannot enter it are never formatted.
+            created_at = entity.created_at.isoformat() if entity.created_at else None
+            sort_key = (created_at or "", -seen)
+            seen += 1
+            if len(recent_heap) == DASHBOARD_RECENT_LIMIT and sort_key <= recent_heap[0][:2]:
+                continue
+
+            item = (
+                *sort_key,
+                {
+                    "id": entity.id,
+                    "type": entity.type,
+                    "content": _snippet(entity.content),
+                    "namespace": ns_id,
+                    "created_at": created_at,
+                },
+            )
+            if len(recent_heap) < DASHBOARD_RECENT_LIMIT:
+                heapq.heappush(recent_heap, item)
+            else:
+                heapq.heapreplace(recent_heap, item)
 
-    # sort by created_at descending (assuming we have those or just use the end of list)
-    # the client doesn't strictly order by date right now unless we extract or sort manually
-    recent_entities.sort(key=lambda x: x.get("created_at") or "", reverse=True)
-    recent_entities = recent_entities[:10]  # top 10
+    # Newest first; the sequence number makes every key unique, so the dicts are never compared.
+    recent_entities = [item[2] for item in sorted(recent_heap, reverse=True)]
 
     return {
         "health": health,
@@ -95,15 +192,10 @@ def get_dashboard() -> dict[str, Any]:
 
 
 @router.get("/namespaces")
-def list_namespaces() -> List[dict[str, Any]]:
-    from altk_evolve.frontend.mcp.mcp_server import get_client
-
-    client = get_client()
+async def list_namespaces(client: "EvolveClient" = Depends(_client_dep)) -> List[dict[str, Any]]:
     try:
-        namespaces = []
-        for ns in client.all_namespaces(limit=1000):
-            namespaces.append({"id": ns.id, "amount_of_entities": ns.num_entities or 0})
-        return namespaces
+        counts = await run_in_threadpool(client.all_namespaces_lite, limit=1000)
+        return [{"id": namespace_id, "amount_of_entities": num_entities} for namespace_id, num_entities in counts]
     except Exception as e:
         from fastapi import HTTPException
 
@@ -112,12 +204,10 @@ def list_namespaces() -> List[dict[str, Any]]:
 
 
 @router.post("/namespaces")
-def add_namespace(req: NamespaceCreateRequest) -> dict[str, Any]:
-    from altk_evolve.frontend.mcp.mcp_server import get_client
-
-    client = get_client()
+def add_namespace(req: NamespaceCreateRequest, client: "EvolveClient" = Depends(_client_dep)) -> dict[str, Any]:
     try:
         client.create_namespace(req.namespace_id)
+        clear_dashboard_cache()
         return {"success": True, "namespace_id": req.namespace_id}
     except Exception as e:
         from fastapi import HTTPException
@@ -127,12 +217,10 @@ def add_namespace(req: NamespaceCreateRequest) -> dict[str, Any]:
 
 
 @router.delete("/namespaces/{namespace_id}")
-def delete_namespace(namespace_id: str) -> dict[str, Any]:
-    from altk_evolve.frontend.mcp.mcp_server import get_client
-
-    client = get_client()
+def delete_namespace(namespace_id: str, client: "EvolveClient" = Depends(_client_dep)) -> dict[str, Any]:
     try:
         client.delete_namespace(namespace_id)
+        clear_dashboard_cache()
         return {"success": True}
     except Exception as e:
         from fastapi import HTTPException
@@ -142,14 +230,12 @@ def delete_namespace(namespace_id: str) -> dict[str, Any]:
 
 
 @router.get("/namespaces/{namespace_id}/entities")
-def list_namespace_entities(
+async def list_namespace_entities(
     namespace_id: str,
     type: Optional[str] = Query(None, description="Filter entities by type (e.g., guideline, task)"),
     limit: int = Query(100, description=f"Maximum number of entities to return (max {MAX_ENTITY_LIMIT})"),
+    client: "EvolveClient" = Depends(_client_dep),
 ) -> List[dict[str, Any]]:
-    from altk_evolve.frontend.mcp.mcp_server import get_client
-
-    client = get_client()
     try:
         # Sanitize limit
         limit = max(1, min(limit, MAX_ENTITY_LIMIT))
@@ -158,7 +244,7 @@ def list_namespace_entities(
         if type:
             filters["type"] = type
 
-        entities = client.get_all_entities(namespace_id, filters=filters, limit=limit)
+        entities = await run_in_threadpool(client.get_all_entities, namespace_id, filters=filters, limit=limit)
 
         result = []
         for entity in entities:
@@ -168,7 +254,7 @@ def list_namespace_entities(
                     "type": entity.type,
                     "content": entity.content,
                     "metadata": entity.metadata or {},
-                    "created_at": entity.created_at.isoformat() if hasattr(entity, "created_at") and entity.created_at else None,
+                    "created_at": created_at.isoformat() if (created_at := entity.created_at) else None,
                 }
             )
 
@@ -183,12 +269,10 @@ def list_namespace_entities(
 
 
 @router.delete("/namespaces/{namespace_id}/entities/{entity_id}")
-def delete_namespace_entity(namespace_id: str, entity_id: str) -> dict[str, Any]:
-    from altk_evolve.frontend.mcp.mcp_server import get_client
-
-    client = get_client()
+def delete_namespace_entity(namespace_id: str, entity_id: str, client: "EvolveClient" = Depends(_client_dep)) -> dict[str, Any]:
     try:
         client.delete_entity_by_id(namespace_id, entity_id)
+        clear_dashboard_cache()
         return {"success": True}
     except Exception as e:
         from fastapi import HTTPException
@@ -198,8 +282,9 @@ def delete_namespace_entity(namespace_id: str, entity_id: str) -> dict[str, Any]
 
 
 @router.post("/namespaces/{namespace_id}/entities")
-def create_namespace_entity(namespace_id: str, req: EntityCreateRequest) -> dict[str, Any]:
-    from altk_evolve.frontend.mcp.mcp_server import get_client
+async def create_namespace_entity(
+    namespace_id: str, req: EntityCreateRequest, client: "EvolveClient" = Depends(_client_dep)
+) -> dict[str, Any]:
     from altk_evolve.schema.core import Entity
     from fastapi import HTTPException
 
@@ -234,11 +319,13 @@ def create_namespace_entity(namespace_id: str, req: EntityCreateRequest) -> dict
             logger.error(f"Policy validation failed: {e}")
             raise HTTPException(status_code=422, detail=f"Invalid policy metadata schema: {e}")
 
-    client = get_client()
+    # Validation above is microsecond-scale and stays on the event loop; only the
+    # insert occupies a threadpool slot, leaving the rest free for concurrent reads.
     try:
         new_entity = Entity(type=entity_type, content=req.content, metadata=req.metadata)
         # Using enable_conflict_resolution=False for a direct insert
-        updates = client.update_entities(namespace_id, [new_entity], enable_conflict_resolution=False)
+        updates = await run_in_threadpool(client.update_entities, namespace_id, [new_entity], enable_conflict_resolution=False)
+        clear_dashboard_cache()
         if not updates:
             raise Exception("Failed to insert entity. No updates returned.")
         return {"success": True, "id": updates[0].id}
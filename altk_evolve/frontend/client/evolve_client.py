@@ -1,5 +1,9 @@
 import datetime
 import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, cast
 
 from altk_evolve.backend.base import BaseEntityBackend
@@ -14,6 +18,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds a healthy ready() result is reused, so health polls (e.g. the
+# dashboard) do not ping the backend on every request.
+READY_CACHE_TTL = 5.0
+
+# Consolidated originals are deleted in batches of at most this many IDs.
+_DELETE_BATCH_SIZE = 500
+
+# Page size used when streaming guidelines into clustering.
+_CLUSTER_PAGE_SIZE = 512
+
+# Concurrent combine_cluster (LLM) calls during consolidation.
+_COMBINE_MAX_WORKERS = 8
+
+
+# Backend name -> (backend class, expected settings class or None), filled on
+# first use so later clients skip the import machinery for heavy backends.
+_BACKEND_CLASSES: dict[str, tuple[type[BaseEntityBackend], type | None]] = {}
+
+
+def _backend_classes(backend: str) -> tuple[type[BaseEntityBackend], type | None]:
+    """Resolve (and memoize) the backend class for ``backend``, importing its module on first use."""
+    resolved = _BACKEND_CLASSES.get(backend)
+    if resolved is not None:
+        return resolved
+    if backend == "milvus":
+        from altk_evolve.backend.milvus import MilvusEntityBackend
+
+        resolved = (MilvusEntityBackend, None)
+    elif backend == "filesystem":
+        from altk_evolve.backend.filesystem import FilesystemEntityBackend, FilesystemSettings
+
+        resolved = (FilesystemEntityBackend, FilesystemSettings)
+    elif backend == "postgres":
+        from altk_evolve.backend.postgres import PostgresEntityBackend
+        from altk_evolve.config.postgres import PostgresDBSettings
+
+        resolved = (PostgresEntityBackend, PostgresDBSettings)
+    else:
+        raise NotImplementedError(f"Entity backend not implemented: {backend}")
+    _BACKEND_CLASSES[backend] = resolved
+    return resolved
+
 
 def _filter_by_evidence(entities: list[RecordedEntity], evidence_filter: str) -> list[RecordedEntity]:
     """Keep guidelines matching an evidence polarity. Unknown evidence (None) is always kept."""
@@ -33,30 +79,13 @@ class EvolveClient:
         """Initialize the Evolve client."""
         self.config = config or EvolveConfig()
         self.backend: BaseEntityBackend
+        self._ready_checked_at: float | None = None
+        self._ready_lock = threading.Lock()
 
-        if self.config.backend == "milvus":
-            from altk_evolve.backend.milvus import MilvusEntityBackend
-
-            self.backend = MilvusEntityBackend(self.config.settings)
-        elif self.config.backend == "filesystem":
-            from altk_evolve.backend.filesystem import FilesystemEntityBackend, FilesystemSettings
-
-            if not isinstance(self.config.settings, (FilesystemSettings, type(None))):
-                raise TypeError(
-                    f"Type of `config` should be `{FilesystemSettings.__name__}` or `None`, got `{type(self.config.settings).__name__}`"
-                )
-            self.backend = FilesystemEntityBackend(self.config.settings)
-        elif self.config.backend == "postgres":
-            from altk_evolve.backend.postgres import PostgresEntityBackend
-            from altk_evolve.config.postgres import PostgresDBSettings
-
-            if not isinstance(self.config.settings, (PostgresDBSettings, type(None))):
-                raise TypeError(
-                    f"Type of `config` should be `{PostgresDBSettings.__name__}` or `None`, got `{type(self.config.settings).__name__}`"
-                )
-            self.backend = PostgresEntityBackend(self.config.settings)
-        else:
-            raise NotImplementedError(f"Entity backend not implemented: {self.config.backend}")
+        backend_cls, settings_cls = _backend_classes(self.config.backend)
+        if settings_cls is not None and not isinstance(self.config.settings, (settings_cls, type(None))):
+            raise TypeError(f"Type of `config` should be `{settings_cls.__name__}` or `None`, got `{type(self.config.settings).__name__}`")
+        self.backend = backend_cls(self.config.settings)
 
         # Initialize the memory hook seam. The seam is ALWAYS live — there is no
         # enable/disable switch; behavior is decided by which plugins resolve
@@ -77,17 +106,48 @@ class EvolveClient:
         initialize_hooks(self.config.hooks)
 
     def ready(self) -> bool:
-        """Check if the backend is healthy."""
-        return self.backend.ready()
+        """Check if the backend is healthy.
+
+        A healthy result is reused for ``READY_CACHE_TTL`` seconds; an unhealthy
+        result or an error is never cached, so recovery shows up immediately.
+        """
+        with self._ready_lock:
+            if self._ready_checked_at is not None and time.monotonic() - self._ready_checked_at < READY_CACHE_TTL:
+                return True
+        try:
+            is_ready = self.backend.ready()
+        except Exception:
+            self.invalidate_ready_cache()
+            raise
+        with self._ready_lock:
+            self._ready_checked_at = time.monotonic() if is_ready else None
+        return is_ready
+
+    def invalidate_ready_cache(self) -> None:
+        """Forget a cached healthy ``ready()`` result, e.g. after a backend call failed."""
+        with self._ready_lock:
+            self._ready_checked_at = None
+
+    def close(self) -> None:
+        """Release the backend's connections (Milvus channel, Postgres pool). The client is unusable afterwards."""
+        self.backend.close()
 
     def create_namespace(self, namespace_id: str | None = None) -> Namespace:
         """Create a new namespace for entities to exist in."""
         return self.backend.create_namespace(namespace_id)
 
+    def create_namespaces(self, namespace_ids: list[str]) -> list[Namespace]:
+        """Create several namespaces in one call."""
+        return self.backend.create_namespaces(namespace_ids)
+
     def all_namespaces(self, limit: int = 10) -> list[Namespace]:
         """Get details about a specific namespace."""
         return self.backend.search_namespaces(limit)
 
+    def all_namespaces_lite(self, limit: int = 10) -> list[tuple[str, int]]:
+        """Get ``(namespace_id, num_entities)`` pairs, skipping the rest of the namespace details."""
+        return self.backend.search_namespaces_lite(limit)
+
     def get_namespace_details(self, namespace_id: str) -> Namespace:
         """Get details about a specific namespace."""
         return self.backend.get_namespace_details(namespace_id)
@@ -110,14 +170,48 @@ class EvolveClient:
         """Search for entities in a namespace."""
         return self.backend.search_entities(namespace_id, query, filters, limit)
 
-    def get_all_entities(self, namespace_id: str, filters: dict | None = None, limit: int = 100) -> list[RecordedEntity]:
-        """Get all entities from a namespace."""
-        return self.search_entities(namespace_id, query=None, filters=filters, limit=limit)
+    @staticmethod
+    def _with_id_filter(filters: dict | None, id_in: list[str] | None) -> dict | None:
+        return filters if id_in is None else {**(filters or {}), "id": list(id_in)}
+
+    def get_all_entities(
+        self, namespace_id: str, filters: dict | None = None, limit: int = 100, id_in: list[str] | None = None
+    ) -> list[RecordedEntity]:
+        """Get all entities from a namespace, optionally only those whose ID is in ``id_in`` (filtered by the backend)."""
+        if id_in is not None and not id_in:
+            return []
+        return self.search_entities(namespace_id, query=None, filters=self._with_id_filter(filters, id_in), limit=limit)
+
+    def iter_all_entities(
+        self,
+        namespace_id: str,
+        filters: dict | None = None,
+        limit: int = 100,
+        page_size: int = 100,
+        id_in: list[str] | None = None,
+    ) -> Iterator[RecordedEntity]:
+        """Lazily yield up to ``limit`` entities from a namespace, fetched from the backend in pages."""
+        if id_in is not None and not id_in:
+            return
+        filters = self._with_id_filter(filters, id_in)
+        for page in self.backend.iter_entities(namespace_id, filters=filters, limit=limit, page_size=page_size):
+            yield from page
+
+    def get_entities_batch(self, namespace_ids: list[str], limit_per: int = 10) -> dict[str, list[RecordedEntity]]:
+        """Get up to ``limit_per`` entities from each of several namespaces, keyed by namespace ID.
+
+        Namespaces that cannot be read are left out of the result.
+        """
+        return self.backend.get_entities_batch(namespace_ids, limit_per)
 
     def delete_entity_by_id(self, namespace_id: str, entity_id: str) -> None:
         """Delete a specific entity by its ID."""
         self.backend.delete_entity_by_id(namespace_id, entity_id)
 
+    def delete_entities_by_ids(self, namespace_id: str, entity_ids: list[str]) -> list[str]:
+        """Delete several entities in one backend call. Returns the IDs submitted for deletion (vetoed ones are skipped)."""
+        return self.backend.delete_entities_by_ids(namespace_id, entity_ids)
+
     def get_entity_by_id(self, namespace_id: str, entity_id: str) -> RecordedEntity | None:
         """Fetch a single entity by its ID. Returns None if not found."""
         results = self.search_entities(namespace_id, filters={"id": entity_id}, limit=1)
@@ -201,17 +295,26 @@ class EvolveClient:
         Returns:
             List of clusters, each containing related RecordedEntity objects.
         """
-        entities = self.get_all_entities(namespace_id, filters={"type": "guideline"}, limit=limit)
-        if len(entities) >= limit:
+        fetched = 0
+
+        def stream() -> Iterator[RecordedEntity]:
+            # Pages are clustered as they arrive instead of being materialized up front.
+            nonlocal fetched
+            for entity in self.iter_all_entities(namespace_id, filters={"type": "guideline"}, limit=limit, page_size=_CLUSTER_PAGE_SIZE):
+                fetched += 1
+                yield entity
+
+        clusters = self._cluster_guideline_entities(stream(), threshold=threshold)
+        if fetched >= limit:
             logger.warning(
                 "Fetched %d entities (hit limit=%d); clustering results may be incomplete. Consider increasing the limit.",
-                len(entities),
+                fetched,
                 limit,
             )
-        return self._cluster_guideline_entities(entities, threshold=threshold)
+        return clusters
 
-    def _cluster_guideline_entities(self, entities: list[RecordedEntity], threshold: float | None = None) -> list[list[RecordedEntity]]:
-        """Cluster a pre-fetched list of guideline entities by task similarity."""
+    def _cluster_guideline_entities(self, entities: Iterable[RecordedEntity], threshold: float | None = None) -> list[list[RecordedEntity]]:
+        """Cluster guideline entities (a list or a lazy iterator) by task similarity."""
         from altk_evolve.llm.guidelines.clustering import cluster_entities
 
         if threshold is None:
@@ -262,66 +365,72 @@ class EvolveClient:
                 limit,
             )
         clusters = self._cluster_guideline_entities(entities, threshold=threshold)
+        if not clusters:
+            return ConsolidationResult(clusters_found=0, guidelines_before=0, guidelines_after=0)
+
         clusters_found = 0
         guidelines_before = 0
         guidelines_after = 0
         support_before = 0
         support_after = 0
-
-        for cluster in clusters:
-            # Phase 1: combine + insert (skip cluster on failure)
-            try:
-                consolidated_guidelines = combine_cluster(cluster, mode=combine_mode)
-
-                task_description = (cluster[0].metadata or {}).get("task_description", "")
-                new_entities = [
-                    Entity(
-                        content=guideline.content,
-                        type="guideline",
-                        metadata={
-                            "task_description": task_description,
-                            "rationale": guideline.rationale,
-                            "category": guideline.category,
-                            "trigger": guideline.trigger,
-                            "implementation_steps": guideline.implementation_steps,
-                            "support": guideline.support,
-                            "evidence": guideline.evidence,
-                        },
-                    )
-                    for guideline in consolidated_guidelines
-                ]
-                if not new_entities:
+        pending_deletes: list[str] = []
+
+        # The LLM calls run concurrently; their results are written back one
+        # cluster at a time, in cluster order, so the phases below are unchanged.
+        with ThreadPoolExecutor(max_workers=min(_COMBINE_MAX_WORKERS, len(clusters))) as executor:
+            combined = [executor.submit(combine_cluster, cluster, mode=combine_mode) for cluster in clusters]
+            for cluster, future in zip(clusters, combined):
+                # Phase 1: combine + insert (skip cluster on failure)
+                try:
+                    consolidated_guidelines = future.result()
+
+                    task_description = (cluster[0].metadata or {}).get("task_description", "")
+                    # Guideline models are validated already, so skip re-validating each Entity.
+                    new_entities = [
+                        Entity.model_construct(
+                            content=guideline.content,
+                            type="guideline",
+                            metadata={
+                                "task_description": task_description,
+                                "rationale": guideline.rationale,
+                                "category": guideline.category,
+                                "trigger": guideline.trigger,
+                                "implementation_steps": guideline.implementation_steps,
+                                "support": guideline.support,
+                                "evidence": guideline.evidence,
+                            },
+                        )
+                        for guideline in consolidated_guidelines
+                    ]
+                    if not new_entities:
+                        logger.warning(
+                            "LLM returned no consolidated guidelines for cluster (IDs: %s); skipping deletion.",
+                            [e.id for e in cluster],
+                        )
+                        continue
+                    self.update_entities(namespace_id, new_entities, enable_conflict_resolution=False)
+                except Exception:
                     logger.warning(
-                        "LLM returned no consolidated guidelines for cluster (IDs: %s); skipping deletion.",
+                        "Failed to consolidate cluster of %d entities (IDs: %s); skipping.",
+                        len(cluster),
                         [e.id for e in cluster],
+                        exc_info=True,
                     )
                     continue
-                self.update_entities(namespace_id, new_entities, enable_conflict_resolution=False)
-            except Exception:
-                logger.warning(
-                    "Failed to consolidate cluster of %d entities (IDs: %s); skipping.",
-                    len(cluster),
-                    [e.id for e in cluster],
-                    exc_info=True,
-                )
-                continue
 
-            clusters_found += 1
-            guidelines_before += len(cluster)
-            guidelines_after += len(consolidated_guidelines)
-            support_before += sum(int((e.metadata or {}).get("support", 1) or 1) for e in cluster)
-            support_after += sum(g.support for g in consolidated_guidelines)
+                clusters_found += 1
+                guidelines_before += len(cluster)
+                guidelines_after += len(consolidated_guidelines)
+                support_before += sum(int((e.metadata or {}).get("support", 1) or 1) for e in cluster)
+                support_after += sum(g.support for g in consolidated_guidelines)
 
-            # Phase 2: delete originals (log errors but don't roll back insert)
-            for entity in cluster:
-                try:
-                    self.delete_entity_by_id(namespace_id, entity.id)
-                except Exception:
-                    logger.warning(
-                        "Failed to delete original entity %s after successful insert; skipping.",
-                        entity.id,
-                        exc_info=True,
-                    )
+                # Phase 2: queue the originals for deletion; they are deleted in batches
+                pending_deletes.extend(e.id for e in cluster)
+                if len(pending_deletes) >= _DELETE_BATCH_SIZE:
+                    self._flush_deletes(namespace_id, pending_deletes)
+                    pending_deletes = []
+
+        self._flush_deletes(namespace_id, pending_deletes)
 
         return ConsolidationResult(
             clusters_found=clusters_found,
@@ -331,6 +440,19 @@ class EvolveClient:
             support_after=support_after,
         )
 
+    def _flush_deletes(self, namespace_id: str, entity_ids: list[str]) -> None:
+        """Delete consolidated originals in chunks of ``_DELETE_BATCH_SIZE`` (log errors but don't roll back inserts)."""
+        for start in range(0, len(entity_ids), _DELETE_BATCH_SIZE):
+            chunk = entity_ids[start : start + _DELETE_BATCH_SIZE]
+            try:
+                self.delete_entities_by_ids(namespace_id, chunk)
+            except Exception:
+                logger.warning(
+                    "Failed to delete original entities %s after successful insert; skipping.",
+                    chunk,
+                    exc_info=True,
+                )
+
     def select_guidelines(
         self,
         namespace_id: str,
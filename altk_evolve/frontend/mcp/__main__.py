@@ -1,8 +1,8 @@
 import argparse
+import asyncio
 import logging
 import os
 import sys
-import threading
 import uvicorn
 
 from altk_evolve.frontend.mcp.mcp_server import app, get_client, mcp
@@ -47,15 +47,28 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def run_api_server():
-    """Run the FastAPI server for UI and API in a background thread."""
+async def serve_api(server: uvicorn.Server) -> None:
+    """Serve the UI and API until ``server.should_exit`` is set, without ever taking MCP down."""
     try:
-        # We run with log_level="warning" to avoid cluttering stdio for MCP
-        uvicorn.run(app, host="127.0.0.1", port=8000, log_level="warning")
-    except Exception as e:
+        await server.serve()
+    except (Exception, SystemExit) as e:
+        # uvicorn calls sys.exit(1) when it cannot bind, e.g. the port is taken.
         logging.error(f"Failed to start UI server: {e}")
 
 
+async def run_stdio_server() -> None:
+    """Run MCP over stdio and the UI/API server on the same event loop."""
+    # We run with log_level="warning" to avoid cluttering stdio for MCP
+    api_server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=8000, log_level="warning"))
+    api_task = asyncio.create_task(serve_api(api_server))
+    try:
+        await mcp.run_async()
+    finally:
+        # Stop the UI server once the MCP client goes away.
+        api_server.should_exit = True
+        await api_task
+
+
 def run_sse_server(host: str, port: int) -> None:
     """Run the MCP server over SSE with disconnect-tolerant teardown."""
     if _is_truthy_env("EVOLVE_MCP_WARMUP", True):
@@ -83,11 +96,7 @@ def main():
 
     try:
         if args.transport == "stdio":
-            # Start the HTTP API/UI server in a daemon thread so it dies when the parent dies
-            api_thread = threading.Thread(target=run_api_server, daemon=True)
-            api_thread.start()
-            # Start FastMCP using stdio (which blocks)
-            mcp.run()
+            asyncio.run(run_stdio_server())
         else:
             run_sse_server(args.host, args.port)
     except KeyboardInterrupt:
@@ -4,22 +4,32 @@ Evolve MCP Server
 This server provides a tool to get task-relevant guidelines.
 """
 
+import contextvars
+import hashlib
+import io
 import json
 import logging
 import threading
 import uuid
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 from fastmcp import FastMCP
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
+from pydantic import TypeAdapter
 from fastapi.responses import FileResponse, RedirectResponse
 from starlette.requests import Request
+from starlette.responses import Response
 from starlette.exceptions import HTTPException
+from altk_evolve.utils.json import dumps as fast_json_dumps, loads as fast_json_loads
 from altk_evolve.config.evolve import evolve_config
 from altk_evolve.frontend.client.evolve_client import EvolveClient
 from altk_evolve.frontend.api.routes import router as api_router
+from altk_evolve.frontend.mcp.static_assets import PrecompressedStaticFiles, precompress_assets
 from altk_evolve.llm.fact_extraction.fact_extraction import (
     ExtractedFact,
     categorize_facts,
@@ -33,25 +43,57 @@ from altk_evolve.schema.exceptions import EvolveException, NamespaceNotFoundExce
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("entities-mcp")
 
+# Validates a whole batch of entity dicts in one pydantic-core call instead of one constructor call per entity.
+_ENTITY_LIST = TypeAdapter(list[Entity])
+
+# Fixed tool responses, serialized once at import.
+_PERMISSION_DENIED_RESPONSE = fast_json_dumps({"error": "Permission denied: caller is not the owner of this entity"})
+_CREATION_FAILED_RESPONSE = fast_json_dumps({"error": "Entity creation failed"})
+
+# Caps in-flight guideline-generation LLM calls across concurrent save_trajectory
+# invocations; a burst queues here instead of tripping provider rate limits.
+_MAX_CONCURRENT_GUIDELINE_GENERATIONS = 8
+_guideline_generation_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_GUIDELINE_GENERATIONS)
+
+# Work a tool call overlaps with its own (e.g. the trajectory write during
+# guideline generation) runs on one shared pool instead of a pool per call.
+_MAX_BACKGROUND_WORKERS = 8
+_background_executor = ThreadPoolExecutor(max_workers=_MAX_BACKGROUND_WORKERS, thread_name_prefix="evolve-mcp")
+
 _client = None
 _initialized_namespaces: set[str] = set()
 _client_init_lock = threading.Lock()
 
 # Need to configure FastAPI separately and mount FastMCP on it
 app = FastAPI(title="Evolve API & UI")
+# Entity and trajectory listings from /api are large, repetitive JSON. Responses that
+# already carry a Content-Encoding (the pre-compressed UI assets) pass through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 mcp = FastMCP("entities")
 
 # Mount API routes
 app.include_router(api_router, prefix="/api")
 
 
-# Configure UI Static Files Serving
-def _setup_ui_routes():
-    # UI directory path
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    frontend_dir = os.path.dirname(current_dir)
-    ui_dist_dir = os.path.join(frontend_dir, "ui", "dist")
+# Vite build output of altk_evolve/frontend/ui
+_UI_DIST_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui", "dist")
+
+# Browsers may reuse a UI file they hold, but must revalidate it first (cheap with an ETag).
+_UI_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
 
+def _conditional_file_response(request: Request, path: str) -> Response:
+    """Serve ``path`` with an mtime/size ETag, or ``304 Not Modified`` when the client already has it."""
+    stat_result = os.stat(path)
+    etag = f'"{int(stat_result.st_mtime)}-{stat_result.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": _UI_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, headers=headers, stat_result=stat_result)
+
+
+# Configure UI Static Files Serving
+def _setup_ui_routes(target_app: FastAPI = app, ui_dist_dir: str = _UI_DIST_DIR):
     # Only mount UI if dist folder exists (i.e. we built it)
     if os.path.exists(ui_dist_dir) and os.path.isdir(ui_dist_dir):
         logger.info(f"Mounting Evolve UI at /ui from {ui_dist_dir}")
@@ -65,31 +107,53 @@ def _setup_ui_routes():
         # We need to mount the assets folder directly at /assets so the browser finds them
         assets_dir = os.path.join(ui_dist_dir, "assets")
         if os.path.exists(assets_dir):
-            app.mount("/assets", StaticFiles(directory=assets_dir), name="ui_assets")
+            # Gzip the assets once now so requests only pick the right file.
+            precompress_assets(assets_dir)
+            target_app.mount("/assets", PrecompressedStaticFiles(directory=assets_dir), name="ui_assets")
 
+        # StaticFiles already answers If-None-Match / If-Modified-Since with 304.
         # We can also mount the root dist at /ui_static just in case
-        app.mount("/ui_static", StaticFiles(directory=ui_dist_dir), name="ui_static")
-
-        @app.get("/")
+        target_app.mount("/ui_static", StaticFiles(directory=ui_dist_dir), name="ui_static")
+
+        # The SPA shell is fixed for a given build, so read it once instead of per navigation.
+        resolved_base = os.path.realpath(ui_dist_dir)
+        index_file = os.path.realpath(os.path.join(ui_dist_dir, "index.html"))
+        index_bytes: bytes | None = None
+        index_etag = ""
+        if index_file.startswith(resolved_base + os.sep) and os.path.isfile(index_file):
+            with open(index_file, "rb") as f:
+                index_bytes = f.read()
+            index_etag = f'"{hashlib.md5(index_bytes).hexdigest()}"'
+
+        @lru_cache(maxsize=2048)
+        def resolve_spa_path(catchall: str) -> str | None:
+            """Map a /ui sub-path to a file inside dist, or None; cached like the index (a build is fixed)."""
+            potential_file = os.path.realpath(os.path.join(ui_dist_dir, catchall))
+            if potential_file.startswith(resolved_base + os.sep) and os.path.isfile(potential_file):
+                return potential_file
+            return None
+
+        @target_app.get("/")
         async def root_redirect():
             return RedirectResponse(url="/ui/")
 
         # Catch-all route to serve the React SPA index.html for /ui and /ui/*
-        @app.get("/ui")
-        @app.get("/ui/{catchall:path}")
+        @target_app.get("/ui")
+        @target_app.get("/ui/{catchall:path}")
         async def serve_spa(request: Request, catchall: str = ""):
-            resolved_base = os.path.realpath(ui_dist_dir)
             # If the requested file exists in dist, serve it (for assets not caught by /ui_static if any)
             if catchall:
-                potential_file = os.path.realpath(os.path.join(ui_dist_dir, catchall))
-                if potential_file.startswith(resolved_base + os.sep) and os.path.isfile(potential_file):
-                    return FileResponse(potential_file)
+                potential_file = resolve_spa_path(catchall)
+                if potential_file is not None:
+                    return _conditional_file_response(request, potential_file)
 
             # Otherwise serve index.html
-            index_file = os.path.realpath(os.path.join(ui_dist_dir, "index.html"))
-            if index_file.startswith(resolved_base + os.sep) and os.path.exists(index_file):
-                return FileResponse(index_file)
-            raise HTTPException(status_code=404, detail="UI index.html not found")
+            if index_bytes is None:
+                raise HTTPException(status_code=404, detail="UI index.html not found")
+            headers = {"ETag": index_etag, "Cache-Control": "no-cache"}
+            if request.headers.get("if-none-match") == index_etag:
+                return Response(status_code=304, headers=headers)
+            return Response(index_bytes, media_type="text/html", headers=headers)
     else:
         logger.info("Evolve UI dist directory not found. Skipping UI mount.")
 
@@ -97,14 +161,31 @@ def _setup_ui_routes():
 _setup_ui_routes()
 
 
+def get_initialized_client() -> EvolveClient | None:
+    """Return the client if ``get_client()`` has fully initialized it, else None.
+
+    Lock-free and I/O-free, so async callers can use it on the event loop and
+    fall back to ``get_client()`` in a worker thread only on the cold path.
+    """
+    client = _client
+    if client is not None and evolve_config.namespace_id in _initialized_namespaces:
+        return client
+    return None
+
+
 def get_client() -> EvolveClient:
     """Get the EvolveClient singleton with lazy initialization.
 
     Initializes the client and ensures the default namespace exists on first access.
     This avoids the FastMCP SSE lifespan initialization race condition.
+    Once initialized, the client is returned without taking the init lock.
     """
     global _client
 
+    client = get_initialized_client()
+    if client is not None:
+        return client
+
     with _client_init_lock:
         if _client is None:
             logger.info("Initializing Evolve client...")
@@ -177,48 +258,60 @@ def get_entities_logic(
     logger.debug(f"get_entities_logic identifiers: user_id={user_id}, session_id={session_id}")
     client = get_client()
 
-    try:
-        private_results = client.search_entities(
-            namespace_id=resolved_ns,
-            query=task,
-            filters={"type": entity_type},
-            limit=limit,
-        )
-    except NamespaceNotFoundException:
-        _evict_namespace(resolved_ns)
-        resolved_ns = _resolve_namespace(namespace_id)
-        private_results = client.search_entities(
-            namespace_id=resolved_ns,
-            query=task,
-            filters={"type": entity_type},
-            limit=limit,
-        )
-
-    header = f"# {entity_type.capitalize()}s for: {task}"
-    response_lines = [f"{header}\n"]
-
-    for i, entity in enumerate(private_results, 1):
-        response_lines.append(f"{i}. {entity.content}")
-
+    public_search = None
     if include_public:
-        public_results = client.get_public_entities(
+        # The cross-namespace public search is independent of the private one,
+        # so it runs in the background and the response waits for the slower.
+        public_search = _submit_background(
+            client.get_public_entities,
             query=task,
             entity_type=entity_type,
             exclude_namespace_ids=[resolved_ns],
             limit=limit,
         )
-        private_ids: set[str] = {e.id for e in private_results}
-        seen_public_ids: set[str] = set()
-        idx = len(private_results) + 1
-        for entity in public_results:
-            if entity.id in private_ids or entity.id in seen_public_ids:
-                continue
-            seen_public_ids.add(entity.id)
-            owner = (entity.metadata or {}).get("owner_id", "unknown")
-            response_lines.append(f"{idx}. [public: {owner}] {entity.content}")
-            idx += 1
 
-    return "\n".join(response_lines)
+    try:
+        try:
+            private_results = client.search_entities(
+                namespace_id=resolved_ns,
+                query=task,
+                filters={"type": entity_type},
+                limit=limit,
+            )
+        except NamespaceNotFoundException:
+            _evict_namespace(resolved_ns)
+            resolved_ns = _resolve_namespace(namespace_id)
+            private_results = client.search_entities(
+                namespace_id=resolved_ns,
+                query=task,
+                filters={"type": entity_type},
+                limit=limit,
+            )
+
+        # Written straight into one buffer rather than collected as lines and joined.
+        response = io.StringIO()
+        response.write(f"# {entity_type.capitalize()}s for: {task}\n")
+        for i, entity in enumerate(private_results, 1):
+            response.write(f"\n{i}. {entity.content}")
+
+        if public_search is not None:
+            public_results = public_search.result()
+            private_ids: set[str] = {e.id for e in private_results}
+            seen_public_ids: set[str] = set()
+            idx = len(private_results) + 1
+            for entity in public_results:
+                if entity.id in private_ids or entity.id in seen_public_ids:
+                    continue
+                seen_public_ids.add(entity.id)
+                owner = (entity.metadata or {}).get("owner_id", "unknown")
+                response.write(f"\n{idx}. [public: {owner}] {entity.content}")
+                idx += 1
+
+        return response.getvalue()
+    finally:
+        # Drop the public search if the private one failed before it was consumed.
+        if public_search is not None:
+            public_search.cancel()
 
 
 def _parse_metadata(metadata: str | None) -> dict[str, Any]:
@@ -226,7 +319,7 @@ def _parse_metadata(metadata: str | None) -> dict[str, Any]:
         return {}
 
     try:
-        parsed = json.loads(metadata)
+        parsed = fast_json_loads(metadata)
     except json.JSONDecodeError as e:
         logger.warning("Invalid JSON in metadata parameter: %s", e)
         raise ValueError(f"Failed to parse metadata: {str(e)}") from e
@@ -237,6 +330,28 @@ def _parse_metadata(metadata: str | None) -> dict[str, Any]:
     return parsed
 
 
+def _message_without_text(message: dict[str, Any]) -> dict[str, Any]:
+    """Drop a string ``content`` from a trajectory message: the entity already stores it as its own content.
+
+    The rest (role, tool calls, ids) is kept, so ``{**metadata["message"], "content": entity.content}``
+    rebuilds the original message without every row carrying the text twice.
+    """
+    if isinstance(message["content"], str):
+        return {key: value for key, value in message.items() if key != "content"}
+    return message
+
+
+def _submit_background(fn, /, *args, **kwargs) -> Future:
+    """Run ``fn`` on the shared background pool in a copy of the caller's contextvars."""
+    return _background_executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def _raise_if_failed(future: Future) -> None:
+    """Re-raise the error of ``future`` if it has already failed; a pending or successful future is left alone."""
+    if future.done():
+        future.result()
+
+
 def _persist_entities(
     namespace_id: str | None,
     entities: list[Entity],
@@ -553,27 +668,35 @@ def save_trajectory(
     )
     logger.debug(f"save_trajectory identifiers: user_id={effective_user_id}, session_id={session_id}")
 
-    entities = []
-    messages = json.loads(trajectory_data)
+    # Guideline generation needs the whole conversation, so it is parsed in one
+    # pass, with orjson when available (several times faster on multi-MB trajectories).
+    messages = fast_json_loads(trajectory_data)
     trajectory_metadata_base: dict = {"task_id": task_id}
     if effective_user_id:
         trajectory_metadata_base["user_id"] = effective_user_id
     if session_id:
         trajectory_metadata_base["session_id"] = session_id
 
-    for message in messages:
-        entities.append(
-            Entity(
-                type="trajectory",
-                content=message["content"] if isinstance(message["content"], str) else str(message["content"]),
-                metadata={
+    entities = _ENTITY_LIST.validate_python(
+        [
+            {
+                "type": "trajectory",
+                "content": message["content"] if isinstance(message["content"], str) else str(message["content"]),
+                "metadata": {
                     **trajectory_metadata_base,
-                    "message": message,
+                    "message": _message_without_text(message),
                 },
-            )
-        )
+            }
+            for message in messages
+        ]
+    )
 
-    _, resolved_ns = _persist_entities(
+    # Guideline generation (LLM calls) does not depend on the trajectory write,
+    # so the write runs in the background while the guidelines are generated.
+    # It is joined before the guideline write, so entity order is unchanged, and
+    # checked before each pipeline so a failed write stops further LLM calls.
+    trajectory_write = _submit_background(
+        _persist_entities,
         namespace_id=namespace_id,
         entities=entities,
         enable_conflict_resolution=False,
@@ -594,26 +717,30 @@ def save_trajectory(
     guideline_entities = []
 
     if guidelines_mode in ("regular", "both"):
+        _raise_if_failed(trajectory_write)
         try:
-            regular_results = generate_guidelines(messages)
-            guideline_entities += [
-                Entity(
-                    type="guideline",
-                    content=guideline.content,
-                    metadata={
-                        **guideline_metadata_base,
-                        "task_description": result.task_description,
-                        "category": guideline.category,
-                        "rationale": guideline.rationale,
-                        "trigger": guideline.trigger,
-                        "implementation_steps": guideline.implementation_steps,
-                        "generation_method": "regular",
-                        "support": 1,
-                    },
-                )
-                for result in regular_results
-                for guideline in result.guidelines
-            ]
+            with _guideline_generation_slots:
+                regular_results = generate_guidelines(messages)
+            guideline_entities += _ENTITY_LIST.validate_python(
+                [
+                    {
+                        "type": "guideline",
+                        "content": guideline.content,
+                        "metadata": {
+                            **guideline_metadata_base,
+                            "task_description": result.task_description,
+                            "category": guideline.category,
+                            "rationale": guideline.rationale,
+                            "trigger": guideline.trigger,
+                            "implementation_steps": guideline.implementation_steps,
+                            "generation_method": "regular",
+                            "support": 1,
+                        },
+                    }
+                    for result in regular_results
+                    for guideline in result.guidelines
+                ]
+            )
         except Exception:
             logger.error(
                 f"Regular guideline generation failed for task {task_id}, skipping",
@@ -621,38 +748,44 @@ def save_trajectory(
             )
 
     if guidelines_mode in ("consistency", "both"):
+        _raise_if_failed(trajectory_write)
         try:
             from altk_evolve.llm.guidelines.consistency_guidelines import generate_consistency_guidelines
 
             trajectory = {
                 "messages": messages,
                 "trace_id": task_id,
-                "tools": json.loads(tools) if tools else None,
+                "tools": fast_json_loads(tools) if tools else None,
             }
-            consistency_results = generate_consistency_guidelines(trajectory)
-            guideline_entities += [
-                Entity(
-                    type="guideline",
-                    content=guideline.content,
-                    metadata={
-                        **guideline_metadata_base,
-                        "task_description": result.task_description,
-                        "category": guideline.category,
-                        "rationale": guideline.rationale,
-                        "trigger": guideline.trigger,
-                        "implementation_steps": guideline.implementation_steps,
-                        "generation_method": "consistency",
-                        "support": 1,
-                    },
-                )
-                for result in consistency_results
-                for guideline in result.guidelines
-            ]
+            with _guideline_generation_slots:
+                consistency_results = generate_consistency_guidelines(trajectory)
+            guideline_entities += _ENTITY_LIST.validate_python(
+                [
+                    {
+                        "type": "guideline",
+                        "content": guideline.content,
+                        "metadata": {
+                            **guideline_metadata_base,
+                            "task_description": result.task_description,
+                            "category": guideline.category,
+                            "rationale": guideline.rationale,
+                            "trigger": guideline.trigger,
+                            "implementation_steps": guideline.implementation_steps,
+                            "generation_method": "consistency",
+                            "support": 1,
+                        },
+                    }
+                    for result in consistency_results
+                    for guideline in result.guidelines
+                ]
+            )
         except Exception:
             logger.error(
                 f"Consistency guideline generation failed for task {task_id}, skipping",
                 exc_info=True,
             )
+
+    _, resolved_ns = trajectory_write.result()
     if guideline_entities:
         get_client().update_entities(
             namespace_id=resolved_ns,
@@ -673,6 +806,39 @@ def save_trajectory(
     )
 
 
+_RESERVED_METADATA_KEYS = frozenset({"owner_id", "visibility", "published_at", "creation_mode"})
+
+
+def _visibility_error(visibility: str, owner_id: str | None) -> dict[str, str] | None:
+    if visibility not in ("private", "public"):
+        return {"error": f"Invalid visibility '{visibility}': must be 'private' or 'public'"}
+    if visibility == "public" and not owner_id:
+        return {"error": "Missing owner_id", "message": "public entities must have an owner_id"}
+    return None
+
+
+def _build_entity(content: str, entity_type: str, metadata: dict[str, Any], owner_id: str | None, visibility: str) -> Entity:
+    """Build a manually created entity; caller-supplied values for reserved metadata keys are dropped."""
+    metadata_dict = {key: value for key, value in metadata.items() if key not in _RESERVED_METADATA_KEYS}
+
+    if entity_type in ("guideline", "policy"):
+        metadata_dict.setdefault("creation_mode", "manual")
+
+    metadata_dict["visibility"] = visibility
+    if visibility == "public":
+        from datetime import UTC, datetime
+
+        metadata_dict.setdefault("published_at", datetime.now(UTC).isoformat())
+    if owner_id:
+        metadata_dict["owner_id"] = owner_id
+
+    return Entity(type=entity_type, content=content, metadata=metadata_dict)
+
+
+def _update_summary(update: EntityUpdate) -> dict[str, Any]:
+    return {"event": update.event, "id": update.id, "type": update.type, "content": update.content, "metadata": update.metadata}
+
+
 @mcp.tool()
 def create_entity(
     content: str,
@@ -700,60 +866,107 @@ def create_entity(
     """
     logger.info(f"Creating entity of type: {entity_type} (namespace override: {namespace_id})")
     try:
-        if visibility not in ("private", "public"):
-            return json.dumps({"error": f"Invalid visibility '{visibility}': must be 'private' or 'public'"})
-        if visibility == "public" and not owner_id:
-            return json.dumps({"error": "Missing owner_id", "message": "public entities must have an owner_id"})
-
-        _RESERVED_KEYS = {"owner_id", "visibility", "published_at", "creation_mode"}
+        error = _visibility_error(visibility, owner_id)
+        if error is not None:
+            return fast_json_dumps(error)
 
         metadata_dict = {}
         if metadata:
             try:
-                metadata_dict = json.loads(metadata)
+                metadata_dict = fast_json_loads(metadata)
             except json.JSONDecodeError as e:
                 logger.warning("Invalid JSON in metadata parameter: %s", e)
-                return json.dumps({"error": "Invalid JSON", "message": f"Failed to parse metadata: {str(e)}", "invalid_metadata": metadata})
+                return fast_json_dumps(
+                    {"error": "Invalid JSON", "message": f"Failed to parse metadata: {str(e)}", "invalid_metadata": metadata}
+                )
             if not isinstance(metadata_dict, dict):
-                return json.dumps(
+                return fast_json_dumps(
                     {"error": "Invalid metadata type", "message": "metadata must be a JSON object", "invalid_metadata": metadata}
                 )
-            for key in _RESERVED_KEYS:
-                metadata_dict.pop(key, None)
-
-        if entity_type in ("guideline", "policy"):
-            metadata_dict.setdefault("creation_mode", "manual")
-
-        metadata_dict["visibility"] = visibility
-        if visibility == "public":
-            from datetime import UTC, datetime
-
-            metadata_dict.setdefault("published_at", datetime.now(UTC).isoformat())
-        if owner_id:
-            metadata_dict["owner_id"] = owner_id
-
-        entity = Entity(type=entity_type, content=content, metadata=metadata_dict)
 
         updates, _ = _persist_entities(
             namespace_id=namespace_id,
-            entities=[entity],
+            entities=[_build_entity(content, entity_type, metadata_dict, owner_id, visibility)],
             enable_conflict_resolution=enable_conflict_resolution,
         )
 
         if updates:
-            update = updates[0]
-            return json.dumps(
-                {"event": update.event, "id": update.id, "type": update.type, "content": update.content, "metadata": update.metadata}
-            )
+            return fast_json_dumps(_update_summary(updates[0]))
         else:
-            return json.dumps({"error": "Entity creation failed"})
+            return _CREATION_FAILED_RESPONSE
 
     except Exception as e:
         import traceback
 
         traceback.print_exc()
         logger.exception(f"CRASH IN CREATE_ENTITY: {e}")
-        return json.dumps({"error": f"Server Error: {str(e)}"})
+        return fast_json_dumps({"error": f"Server Error: {str(e)}"})
+
+
+@mcp.tool()
+def create_entities_bulk(
+    items: str,
+    enable_conflict_resolution: bool = False,
+    namespace_id: str | None = None,
+) -> str:
+    """
+    Create several entities in the namespace with a single write.
+
+    Prefer this over calling create_entity in a loop: the whole batch is embedded and stored in one call.
+
+    Args:
+        items: JSON array of objects with 'content' and 'entity_type', plus optional 'metadata' (object),
+            'owner_id' and 'visibility' ('private' by default or 'public'), as in create_entity
+        enable_conflict_resolution: If True, uses LLM to check for conflicts with existing entities
+        namespace_id: Optional namespace override. Falls back to the configured default.
+
+    Returns:
+        JSON array with one update summary (ADD/UPDATE/DELETE/NONE) per stored entity, or an error message.
+        Nothing is stored if any item is invalid.
+    """
+    logger.info(f"Creating entities in bulk (namespace override: {namespace_id})")
+    try:
+        try:
+            parsed_items = fast_json_loads(items)
+        except json.JSONDecodeError as e:
+            logger.warning("Invalid JSON in items parameter: %s", e)
+            return fast_json_dumps({"error": "Invalid JSON", "message": f"Failed to parse items: {str(e)}"})
+        if not isinstance(parsed_items, list):
+            return fast_json_dumps({"error": "Invalid items type", "message": "items must be a JSON array"})
+
+        entities = []
+        for index, item in enumerate(parsed_items):
+            if not isinstance(item, dict) or not isinstance(item.get("content"), str) or not isinstance(item.get("entity_type"), str):
+                return fast_json_dumps(
+                    {
+                        "error": "Invalid item",
+                        "index": index,
+                        "message": "each item must be an object with 'content' and 'entity_type' strings",
+                    }
+                )
+            visibility = item.get("visibility", "private")
+            owner_id = item.get("owner_id")
+            error = _visibility_error(visibility, owner_id)
+            if error is not None:
+                return fast_json_dumps({**error, "index": index})
+            metadata_dict = item.get("metadata") or {}
+            if not isinstance(metadata_dict, dict):
+                return fast_json_dumps({"error": "Invalid metadata type", "index": index, "message": "metadata must be a JSON object"})
+            entities.append(_build_entity(item["content"], item["entity_type"], metadata_dict, owner_id, visibility))
+
+        if not entities:
+            return "[]"
+
+        updates, _ = _persist_entities(
+            namespace_id=namespace_id,
+            entities=entities,
+            enable_conflict_resolution=enable_conflict_resolution,
+        )
+        return fast_json_dumps([_update_summary(update) for update in updates])
+
+    except Exception as e:
+        logger.exception(f"Error creating entities in bulk: {e}")
+        return fast_json_dumps({"error": f"Server Error: {str(e)}"})
 
 
 @mcp.tool()
@@ -780,7 +993,7 @@ def publish_entity(entity_id: str, user_id: str | None = None, namespace_id: str
 
         existing_owner = (entity.metadata or {}).get("owner_id")
         if existing_owner is not None and user_id != existing_owner:
-            return json.dumps({"error": "Permission denied: caller is not the owner of this entity"})
+            return _PERMISSION_DENIED_RESPONSE
 
         metadata_updates: dict = {
             "visibility": "public",
@@ -823,7 +1036,7 @@ def unpublish_entity(entity_id: str, user_id: str | None = None, namespace_id: s
 
         existing_owner = (entity.metadata or {}).get("owner_id")
         if existing_owner is not None and user_id != existing_owner:
-            return json.dumps({"error": "Permission denied: caller is not the owner of this entity"})
+            return _PERMISSION_DENIED_RESPONSE
 
         updated = get_client().patch_entity_metadata(
             namespace_id=resolved_ns,
@@ -857,18 +1070,18 @@ def delete_entity(entity_id: str, user_id: str | None = None, namespace_id: str
     try:
         entity = get_client().get_entity_by_id(namespace_id=resolved_ns, entity_id=entity_id)
         if entity is None:
-            return json.dumps({"success": False, "error": f"Entity {entity_id} not found"})
+            return fast_json_dumps({"success": False, "error": f"Entity {entity_id} not found"})
 
         existing_owner = (entity.metadata or {}).get("owner_id")
         if existing_owner is not None and user_id != existing_owner:
             logger.info(f"Delete denied for entity={entity_id} namespace={resolved_ns}: caller is not owner")
-            return json.dumps({"error": "Permission denied: caller is not the owner of this entity"})
+            return _PERMISSION_DENIED_RESPONSE
 
         get_client().delete_entity_by_id(namespace_id=resolved_ns, entity_id=entity_id)
-        return json.dumps({"success": True, "message": f"Entity {entity_id} deleted successfully"})
+        return fast_json_dumps({"success": True, "message": f"Entity {entity_id} deleted successfully"})
     except NamespaceNotFoundException:
         _evict_namespace(resolved_ns)
-        return json.dumps({"success": False, "error": f"Namespace '{resolved_ns}' not found"})
+        return fast_json_dumps({"success": False, "error": f"Namespace '{resolved_ns}' not found"})
     except EvolveException as e:
         logger.exception(f"Error deleting entity {entity_id}: {str(e)}")
-        return json.dumps({"success": False, "error": str(e)})
+        return fast_json_dumps({"success": False, "error": str(e)})
@@ -0,0 +1,92 @@
+"""Pre-compressed serving for the Vite UI assets.
+
+Assets are gzipped once when the UI is mounted (``<file>.gz`` next to each
+compressible file), and :class:`PrecompressedStaticFiles` hands the gzipped
+variant to clients that accept it, so no request pays for compression.
+Content-hashed build files are marked immutable, so browsers never revalidate them.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import mimetypes
+import os
+import re
+import stat
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+logger = logging.getLogger("entities-mcp")
+
+COMPRESSIBLE_SUFFIXES = (".js", ".css", ".html", ".svg", ".json", ".map")
+
+# Vite names build output ``[name]-[hash][ext]``; a new build changes the hash, so such a URL never changes content.
+_HASHED_ASSET = re.compile(r"-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def precompress_assets(directory: str) -> None:
+    """Write a ``.gz`` sibling for every compressible file under ``directory`` that lacks an up-to-date one.
+
+    Best effort: a read-only install (e.g. site-packages) is logged and served uncompressed.
+    """
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            gz_path = path + ".gz"
+            try:
+                if os.path.exists(gz_path) and os.path.getmtime(gz_path) >= os.path.getmtime(path):
+                    continue
+                with open(path, "rb") as f:
+                    data = f.read()
+                tmp_path = f"{gz_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(gzip.compress(data, compresslevel=9, mtime=0))
+                # Atomic, so a concurrent request never sees a half-written file.
+                os.replace(tmp_path, gz_path)
+            except OSError as e:
+                logger.warning(f"Could not pre-compress UI assets in {directory}; serving them uncompressed: {e}")
+                return
+
+
+def _accepts_gzip(headers: Headers) -> bool:
+    for coding in headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` that prefers a ``<path>.gz`` sibling when the client accepts gzip."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self._get_response(path, scope)
+        if response.status_code in (200, 304) and _HASHED_ASSET.search(path):
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    async def _get_response(self, path: str, scope: Scope) -> Response:
+        compressible = path.endswith(COMPRESSIBLE_SUFFIXES)
+        if compressible and scope["method"] in ("GET", "HEAD") and _accepts_gzip(Headers(scope=scope)):
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + ".gz")
+            except (OSError, ValueError):
+                stat_result = None
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                response = self.file_response(full_path, stat_result, scope)
+                response.headers["content-type"] = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                response.headers["content-encoding"] = "gzip"
+                response.headers["vary"] = "Accept-Encoding"
+                return response
+        response = await super().get_response(path, scope)
+        if compressible:
+            response.headers["vary"] = "Accept-Encoding"
+        return response
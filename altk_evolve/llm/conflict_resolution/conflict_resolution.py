@@ -1,12 +1,17 @@
 import json
+import threading
+import time
+from collections import OrderedDict
 
 from jinja2 import Template
+from pydantic import TypeAdapter
+from altk_evolve.utils.json import loads as fast_json_loads
 from altk_evolve.config.llm import llm_settings
 from altk_evolve.hooks.manager import dispatch_llm_pre_call
 from altk_evolve.schema.conflict_resolution import SimpleEntity, EntityUpdate
 from altk_evolve.schema.core import RecordedEntity
 from altk_evolve.schema.exceptions import EvolveException
-from altk_evolve.utils.utils import clean_llm_response, serialize_content
+from altk_evolve.utils.utils import clean_llm_response, serialize_content, wait_before_llm_retry
 from litellm import completion
 from pathlib import Path
 
@@ -17,6 +22,50 @@ from pathlib import Path
 # NOT listed: those should refresh to the incoming write's normalized values.
 _STICKY_STORED_METADATA_KEYS = ("generation_method",)
 
+_CONFLICT_RESOLUTION_TEMPLATE = Template((Path(__file__).parent / "prompts/conflict_resolution.jinja2").read_text())
+# The default instructions take no variables, so they are rendered once.
+_DEFAULT_UPDATE_ENTITIES_PROMPT = Template((Path(__file__).parent / "prompts/default_conflict_resolution.jinja2").read_text()).render()
+# Serializes entity lists for the prompt in one pydantic-core pass, without intermediate dicts.
+_SIMPLE_ENTITY_LIST_ADAPTER = TypeAdapter(list[SimpleEntity])
+# Validates a whole verdict list in one pydantic-core pass.
+_ENTITY_UPDATE_LIST_ADAPTER = TypeAdapter(list[EntityUpdate])
+
+# Parsed LLM verdicts keyed by (model, provider, prompt messages). Re-adding the
+# same content against the same stored neighbours renders the same prompt, so
+# within the TTL the verdict is reused instead of paying for another LLM call.
+# Metadata is threaded onto a fresh copy per call, since it is not in the prompt.
+_CACHE_MAX_ENTRIES = 256
+_verdict_cache: OrderedDict[tuple[str, str | None, str], tuple[float, list[dict]]] = OrderedDict()
+_verdict_cache_lock = threading.Lock()
+
+
+def clear_conflict_resolution_cache() -> None:
+    with _verdict_cache_lock:
+        _verdict_cache.clear()
+
+
+def _cached_verdict(key: tuple[str, str | None, str]) -> list[dict] | None:
+    with _verdict_cache_lock:
+        cached = _verdict_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, events = cached
+        if time.monotonic() >= expires_at:
+            del _verdict_cache[key]
+            return None
+        return events
+
+
+def _store_verdict(key: tuple[str, str | None, str], events: list[dict]) -> None:
+    ttl = llm_settings.conflict_resolution_cache_ttl
+    if ttl <= 0:
+        return
+    with _verdict_cache_lock:
+        _verdict_cache[key] = (time.monotonic() + ttl, events)
+        _verdict_cache.move_to_end(key)
+        while len(_verdict_cache) > _CACHE_MAX_ENTRIES:
+            _verdict_cache.popitem(last=False)
+
 
 def resolve_conflicts(
     old_entities: list[RecordedEntity], new_entities: list[RecordedEntity], custom_update_entities_prompt: str | None = None
@@ -37,18 +86,28 @@ def resolve_conflicts(
         [{"role": "user", "content": prompt}], purpose="conflict_resolution", model=llm_settings.conflict_resolution_model
     )
 
+    cache_key = (
+        llm_settings.conflict_resolution_model,
+        llm_settings.custom_llm_provider,
+        json.dumps(llm_messages, sort_keys=True, default=str),
+    )
+    cached_events = _cached_verdict(cache_key) if llm_settings.conflict_resolution_cache_ttl > 0 else None
+
     last_error: Exception | None = None
     for attempt in range(3):
         try:
-            completion_response = completion(
-                model=llm_settings.conflict_resolution_model,
-                messages=llm_messages,
-                custom_llm_provider=llm_settings.custom_llm_provider,
-            )
-            response = completion_response.choices[0].message.content or ""  # type: ignore[union-attr]
-            response = clean_llm_response(response)
-            parsed = json.loads(response)
-            entity_updates = [EntityUpdate.model_validate(event) for event in parsed["entities"]]
+            if cached_events is not None:
+                events = cached_events
+            else:
+                completion_response = completion(
+                    model=llm_settings.conflict_resolution_model,
+                    messages=llm_messages,
+                    custom_llm_provider=llm_settings.custom_llm_provider,
+                )
+                response = completion_response.choices[0].message.content or ""  # type: ignore[union-attr]
+                response = clean_llm_response(response)
+                events = fast_json_loads(response)["entities"]
+            entity_updates = _ENTITY_UPDATE_LIST_ADAPTER.validate_python(events)
             for update in entity_updates:
                 if update.event == "ADD":
                     update.metadata = new_entities_by_id[update.id].metadata
@@ -77,10 +136,16 @@ def resolve_conflicts(
                             merged[sticky_key] = stored_metadata[sticky_key]
                     update.metadata = merged
 
+            if cached_events is None:
+                _store_verdict(cache_key, events)
             return entity_updates
         except Exception as e:
             last_error = e
+            # A cached verdict that no longer applies falls back to a fresh LLM call.
+            cached_events = None
             if attempt < 2:
+                if not wait_before_llm_retry(e, attempt):
+                    raise EvolveException("Failed to resolve conflicts: the LLM provider rejected the request") from e
                 continue
     raise EvolveException("Failed to resolve conflicts after 3 attempts") from last_error
 
@@ -91,14 +156,11 @@ def get_update_entities_messages(
     custom_update_entities_prompt: str | None = None,
 ) -> str:
     if custom_update_entities_prompt is None:
-        prompt_file = Path(__file__).parent / "prompts/default_conflict_resolution.jinja2"
-        custom_update_entities_prompt = Template(prompt_file.read_text()).render()
+        custom_update_entities_prompt = _DEFAULT_UPDATE_ENTITIES_PROMPT
 
     prompt_input = {
         "custom_update_entities_prompt": custom_update_entities_prompt,
-        "old_entities": json.dumps([entity.model_dump(mode="json") for entity in old_entities], indent=4),
-        "new_entities": json.dumps([entity.model_dump(mode="json") for entity in new_entities], indent=4),
+        "old_entities": _SIMPLE_ENTITY_LIST_ADAPTER.dump_json(old_entities, indent=4).decode("utf-8"),
+        "new_entities": _SIMPLE_ENTITY_LIST_ADAPTER.dump_json(new_entities, indent=4).decode("utf-8"),
     }
-    prompt_file = Path(__file__).parent / "prompts/conflict_resolution.jinja2"
-
-    return Template(prompt_file.read_text()).render(**prompt_input)
+    return _CONFLICT_RESOLUTION_TEMPLATE.render(**prompt_input)
@@ -14,6 +14,12 @@ from altk_evolve.schema.core import RecordedEntity
 from altk_evolve.utils.utils import clean_llm_response
 
 
+_FACT_EXTRACTION_TEMPLATE = Template((Path(__file__).parent / "prompts/fact_extraction.jinja2").read_text(encoding="utf-8"))
+_FACT_EXTRACTION_PREDEFINED_TEMPLATE = Template(
+    (Path(__file__).parent / "prompts/fact_extraction_predefined.jinja2").read_text(encoding="utf-8")
+)
+
+
 class ExtractedFact(BaseModel):
     category: str
     key: str
@@ -44,13 +50,9 @@ def _build_prompt(messages: list[dict], use_categorization: bool) -> str:
         if categories_info["type"] == "predefined_only":
             categories_dict = categories_info["descriptions"]
             prompt_input["categories"] = [(k, v) for k, v in categories_dict.items()]
-            prompt_file = Path(__file__).parent / "prompts/fact_extraction_predefined.jinja2"
-        else:
-            prompt_file = Path(__file__).parent / "prompts/fact_extraction.jinja2"
-    else:
-        prompt_file = Path(__file__).parent / "prompts/fact_extraction.jinja2"
+            return _FACT_EXTRACTION_PREDEFINED_TEMPLATE.render(**prompt_input)
 
-    return Template(prompt_file.read_text(encoding="utf-8")).render(**prompt_input)
+    return _FACT_EXTRACTION_TEMPLATE.render(**prompt_input)
 
 
 def extract_facts_from_messages(messages: list[dict], use_categorization: bool | None = None) -> list[str] | list[ExtractedFact]:
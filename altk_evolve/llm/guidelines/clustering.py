@@ -2,40 +2,59 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from collections.abc import Iterable
 from functools import lru_cache
 from pathlib import Path
 
 import litellm
 import numpy as np
 from jinja2 import Template
-from litellm import completion, get_supported_openai_params, supports_response_schema
+from litellm import completion
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from sentence_transformers import SentenceTransformer
 
+from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient
+from altk_evolve.utils.json import loads as fast_json_loads
 from altk_evolve.config.evolve import evolve_config
 from altk_evolve.config.llm import llm_settings
 from altk_evolve.hooks.manager import dispatch_llm_pre_call
+from altk_evolve.llm import response_cache
 from altk_evolve.schema.core import RecordedEntity
 from altk_evolve.schema.exceptions import EvolveException
 from altk_evolve.schema.guidelines import ConsolidatedGuideline, ConsolidatedGuidelineResponse, Evidence, Guideline
-from altk_evolve.utils.utils import clean_llm_response
+from altk_evolve.utils.utils import clean_llm_response, structured_output_support, wait_before_llm_retry
 
 logger = logging.getLogger(__name__)
 
 MAX_CLUSTER_ENTITIES = 5000
+# Descriptions per encoder forward pass, and rows per similarity block in cluster_entities.
+_ENCODE_BATCH_SIZE = 256
+_SIMILARITY_BLOCK_ROWS = 512
 _VALID_CATEGORIES = {"strategy", "recovery", "optimization"}
 
 _COMBINE_GUIDELINES_TEMPLATE = Template((Path(__file__).parent / "prompts/combine_guidelines.jinja2").read_text())
 
 
 @lru_cache(maxsize=4)
-def _get_sentence_transformer(model_name: str) -> SentenceTransformer:
+def _load_sentence_transformer(model_name: str) -> SentenceTransformer:
     return SentenceTransformer(model_name)
 
 
-def _union_find(n: int, pairs: list[tuple[int, int]]) -> list[list[int]]:
-    """Group indices into connected components using union-find with path compression.
+def _get_sentence_transformer(model_name: str) -> SentenceTransformer | EmbeddingDaemonClient:
+    """Return an encoder for ``model_name``: the shared embedding daemon when enabled, else an in-process model."""
+    if evolve_config.embedding_daemon:
+        # The daemon already holds the model for the backends; loading a second copy here costs seconds and memory.
+        return EmbeddingDaemonClient(model_name)
+    return _load_sentence_transformer(model_name)
+
+
+def _union_find(n: int, pairs: np.ndarray | list[tuple[int, int]]) -> list[list[int]]:
+    """Group indices into connected components of the graph whose edges are ``pairs``.
+
+    The components are labelled by scipy's compiled graph search rather than a
+    Python union-find loop, which dominated on dense similarity graphs.
 
     Args:
         n: Total number of elements.
@@ -44,34 +63,48 @@ def _union_find(n: int, pairs: list[tuple[int, int]]) -> list[list[int]]:
     Returns:
         List of groups, where each group is a list of indices.
     """
-    parent = list(range(n))
+    if n == 0:
+        return []
+    edges = np.asarray(pairs, dtype=np.intp).reshape(-1, 2)
+    graph = coo_matrix((np.ones(len(edges), dtype=np.int8), (edges[:, 0], edges[:, 1])), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
 
-    def find(x: int) -> int:
-        while parent[x] != x:
-            parent[x] = parent[parent[x]]
-            x = parent[x]
-        return x
+    # Bucket indices by label with one stable sort instead of a per-index dict append.
+    # Labels are numbered in order of each component's smallest index, and so are the groups.
+    order = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    return [group.tolist() for group in np.split(order, boundaries)]
 
-    for i, j in pairs:
-        ri, rj = find(i), find(j)
-        if ri != rj:
-            parent[ri] = rj
 
-    groups: dict[int, list[int]] = {}
-    for i in range(n):
-        root = find(i)
-        groups.setdefault(root, []).append(i)
+def _similar_pairs(embeddings: np.ndarray, threshold: float) -> np.ndarray:
+    """Return the index pairs ``(i, j)``, ``i < j``, whose rows have similarity ``>= threshold``, as a ``(k, 2)`` array.
 
-    return list(groups.values())
+    Rows are compared a block at a time against themselves and all later rows only,
+    so the lower triangle is never computed and the full N x N matrix never exists.
+    """
+    n = len(embeddings)
+    blocks: list[np.ndarray] = [np.empty((0, 2), dtype=np.intp)]
+    for start in range(0, n, _SIMILARITY_BLOCK_ROWS):
+        block = embeddings[start : start + _SIMILARITY_BLOCK_ROWS]
+        hits = block @ embeddings[start:].T >= threshold
+        # Row r is index start + r and column c is index start + c; keep c > r. Only the
+        # leading square can hold c <= r, so only it is masked, in place.
+        square = hits[:, : len(block)]
+        square &= np.triu(square, k=1)
+        blocks.append(np.argwhere(hits) + start)
+    return np.concatenate(blocks)
 
 
 def cluster_entities(
-    entities: list[RecordedEntity],
+    entities: Iterable[RecordedEntity],
     threshold: float = 0.80,
     embedding_model: str | None = None,
 ) -> list[list[RecordedEntity]]:
     """Cluster entities by cosine similarity of their task descriptions.
 
+    ``entities`` is consumed once and may be a lazy iterator; only entities with
+    a task description are kept, so a streamed namespace is never held in full.
+
     Args:
         entities: Guideline entities with optional ``task_description`` in metadata.
         threshold: Cosine similarity threshold for clustering (0-1).
@@ -87,45 +120,44 @@ def cluster_entities(
 
         embedding_model = milvus_other_settings.embedding_model
 
-    # Filter to entities that have a task_description
-    filtered: list[tuple[int, RecordedEntity]] = []
-    for idx, entity in enumerate(entities):
+    # Keep only entities that have a task_description, up to MAX_CLUSTER_ENTITIES
+    filtered: list[RecordedEntity] = []
+    descriptions: list[str] = []
+    seen = 0
+    for entity in entities:
         td = (entity.metadata or {}).get("task_description")
-        if td:
-            filtered.append((idx, entity))
+        if not td:
+            continue
+        seen += 1
+        if len(filtered) < MAX_CLUSTER_ENTITIES:
+            filtered.append(entity)
+            descriptions.append(td)
 
     if len(filtered) < 2:
         return []
 
-    if len(filtered) > MAX_CLUSTER_ENTITIES:
+    if seen > MAX_CLUSTER_ENTITIES:
         logger.warning(
             "Too many entities for clustering (%d > %d). Truncating to first %d.",
-            len(filtered),
+            seen,
             MAX_CLUSTER_ENTITIES,
             MAX_CLUSTER_ENTITIES,
         )
-        filtered = filtered[:MAX_CLUSTER_ENTITIES]
-
-    descriptions = [e.metadata["task_description"] for _, e in filtered]
 
     model = _get_sentence_transformer(embedding_model)
-    embeddings = model.encode(descriptions, normalize_embeddings=True)
-    similarity_matrix = np.asarray(embeddings) @ np.asarray(embeddings).T
-
-    # Find pairs meeting threshold (vectorized upper-triangle extraction)
-    n = len(filtered)
-    mask = np.triu(similarity_matrix >= threshold, k=1)
-    rows, cols = np.where(mask)
-    pairs: list[tuple[int, int]] = list(zip(rows.tolist(), cols.tolist()))
+    embeddings = np.asarray(
+        model.encode(descriptions, normalize_embeddings=True, batch_size=_ENCODE_BATCH_SIZE, show_progress_bar=False),
+        dtype=np.float32,
+    )
 
-    groups = _union_find(n, pairs)
+    groups = _union_find(len(filtered), _similar_pairs(embeddings, threshold))
 
     # Convert index groups back to entity clusters, excluding singletons
     clusters: list[list[RecordedEntity]] = []
     for group in groups:
         if len(group) < 2:
             continue
-        clusters.append([filtered[i][1] for i in group])
+        clusters.append([filtered[i] for i in group])
 
     return clusters
 
@@ -238,39 +270,36 @@ def combine_cluster(entities: list[RecordedEntity], mode: str = "lossless") -> l
         EvolveException: If the LLM call fails after 3 attempts.
     """
     is_groq = llm_settings.custom_llm_provider == "groq" or llm_settings.guidelines_model.startswith("groq/")
-    supported_params = get_supported_openai_params(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
-    )
-    supports_response_format = bool(supported_params and "response_format" in supported_params)
-    response_schema_enabled = supports_response_schema(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
+    supports_response_format, response_schema_enabled = structured_output_support(
+        llm_settings.guidelines_model, llm_settings.custom_llm_provider
     )
     constrained_decoding_supported = not is_groq and supports_response_format and response_schema_enabled
 
-    # Deduplicate task descriptions
-    task_descriptions = list(
-        dict.fromkeys((e.metadata or {}).get("task_description", "") for e in entities if (e.metadata or {}).get("task_description"))
-    )
-
-    # Per-member support/evidence carried in metadata (defaults: support 1, evidence unknown).
-    member_support = [max(1, int((e.metadata or {}).get("support", 1) or 1)) for e in entities]
-    member_evidence: list[Evidence | None] = [(e.metadata or {}).get("evidence") for e in entities]
-
-    guidelines = [
-        {
-            "content": str(e.content),
-            "rationale": (e.metadata or {}).get("rationale", ""),
-            "category": (e.metadata or {}).get("category", "strategy"),
-            "trigger": (e.metadata or {}).get("trigger", ""),
-            "implementation_steps": _normalize_steps((e.metadata or {}).get("implementation_steps")),
-        }
-        for e in entities
-    ]
+    # One walk over the cluster collects the prompt inputs plus each member's
+    # support/evidence (defaults: support 1, evidence unknown); task descriptions are deduplicated.
+    task_descriptions: dict[str, None] = {}
+    member_support: list[int] = []
+    member_evidence: list[Evidence | None] = []
+    guidelines = []
+    for e in entities:
+        md = e.metadata or {}
+        task_description = md.get("task_description")
+        if task_description:
+            task_descriptions[task_description] = None
+        member_support.append(max(1, int(md.get("support", 1) or 1)))
+        member_evidence.append(md.get("evidence"))
+        guidelines.append(
+            {
+                "content": str(e.content),
+                "rationale": md.get("rationale", ""),
+                "category": md.get("category", "strategy"),
+                "trigger": md.get("trigger", ""),
+                "implementation_steps": _normalize_steps(md.get("implementation_steps")),
+            }
+        )
 
     prompt = _COMBINE_GUIDELINES_TEMPLATE.render(
-        task_descriptions=task_descriptions,
+        task_descriptions=list(task_descriptions),
         guidelines=guidelines,
         constrained_decoding_supported=constrained_decoding_supported,
         merge_style="aggressive" if mode == "lossy" else "conservative",
@@ -282,6 +311,20 @@ def combine_cluster(entities: list[RecordedEntity], mode: str = "lossless") -> l
         [{"role": "user", "content": prompt}], purpose="guideline_combination", model=llm_settings.guidelines_model
     )
 
+    cache_key = response_cache.request_key(
+        llm_settings.guidelines_model,
+        llm_settings.custom_llm_provider,
+        llm_messages,
+        ConsolidatedGuidelineResponse if constrained_decoding_supported else None,
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        try:
+            consolidated = ConsolidatedGuidelineResponse.model_validate(fast_json_loads(cached)).guidelines
+            return _attribute_support(entities, consolidated, member_support, member_evidence)
+        except Exception as e:
+            logger.warning(f"Ignoring unusable cached combine_cluster response: {e}")
+
     last_error: Exception | None = None
     for attempt in range(3):
         try:
@@ -313,11 +356,14 @@ def combine_cluster(entities: list[RecordedEntity], mode: str = "lossless") -> l
                     raise EvolveException("LLM returned None content for combine_cluster")
                 clean_response = clean_llm_response(content)
 
-            consolidated = ConsolidatedGuidelineResponse.model_validate(json.loads(clean_response)).guidelines
+            consolidated = ConsolidatedGuidelineResponse.model_validate(fast_json_loads(clean_response)).guidelines
+            response_cache.put(cache_key, clean_response)
             return _attribute_support(entities, consolidated, member_support, member_evidence)
         except Exception as e:
             last_error = e
             if attempt < 2:
+                if not wait_before_llm_retry(e, attempt):
+                    raise EvolveException("Failed to combine cluster guidelines: the LLM provider rejected the request") from e
                 continue
 
     raise EvolveException("Failed to combine cluster guidelines after 3 attempts") from last_error
@@ -12,6 +12,7 @@ from litellm import completion
 
 from altk_evolve.hooks.manager import dispatch_llm_pre_call
 from altk_evolve.schema.exceptions import EvolveException
+from altk_evolve.utils.utils import wait_before_llm_retry
 
 logger = logging.getLogger(__name__)
 
@@ -77,5 +78,7 @@ def get_response_sampling(
         except Exception as e:
             last_error = e
             logger.debug(f"Resampling attempt {attempt + 1}/3 failed for {model_id}: {e}")
+            if attempt < 2 and not wait_before_llm_retry(e, attempt):
+                raise EvolveException(f"Resampling failed for model {model_id}: the LLM provider rejected the request") from e
 
     raise EvolveException(f"Resampling failed after 3 attempts for model {model_id}") from last_error
@@ -8,7 +8,7 @@ from typing import Any, Optional
 import litellm
 import yaml
 from jinja2 import Template
-from litellm import completion, get_supported_openai_params, supports_response_schema
+from litellm import completion
 from pydantic import ValidationError
 
 from altk_evolve.llm.guidelines.consistency_analyzer.consistency_analysis import analyze_consistency
@@ -23,7 +23,7 @@ from altk_evolve.schema.guidelines import (
     GuidelineGenerationResponse,
     GuidelineGenerationResult,
 )
-from altk_evolve.utils.utils import clean_llm_response
+from altk_evolve.utils.utils import clean_llm_response, structured_output_support
 
 logger = logging.getLogger(__name__)
 
@@ -439,14 +439,8 @@ def generate_consistency_guidelines(
         else:
             _safe_write_debug(debug_dir / f"trajectory_{str(trace_id)[:8]}.json", trajectory)
 
-    supported_params = get_supported_openai_params(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
-    )
-    supports_response_format = supported_params and "response_format" in supported_params
-    response_schema_enabled = supports_response_schema(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
+    supports_response_format, response_schema_enabled = structured_output_support(
+        llm_settings.guidelines_model, llm_settings.custom_llm_provider
     )
     is_groq = llm_settings.custom_llm_provider == "groq" or llm_settings.guidelines_model.startswith("groq/")
     constrained_decoding_supported = bool(not is_groq and supports_response_format and response_schema_enabled)
@@ -1,23 +1,33 @@
-import json
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 from pathlib import Path
 
 import litellm
 from jinja2 import Template
-from litellm import completion, get_supported_openai_params, supports_response_schema
+from litellm import completion
 from pydantic import ValidationError
 
+from altk_evolve.utils.json import dumps as fast_json_dumps, loads as fast_json_loads
 from altk_evolve.config.evolve import evolve_config
 from altk_evolve.config.llm import llm_settings
 from altk_evolve.hooks.manager import dispatch_llm_pre_call
+from altk_evolve.llm import response_cache
 from altk_evolve.schema.exceptions import EvolveException
 from altk_evolve.schema.guidelines import DEFAULT_TASK_DESCRIPTION, GuidelineGenerationResponse, GuidelineGenerationResult
-from altk_evolve.utils.utils import clean_llm_response
+from altk_evolve.utils.utils import clean_llm_response, structured_output_support
 
 logger = logging.getLogger(__name__)
 
+# Concurrent per-subtask guideline-generation (LLM) calls for one trajectory.
+_SEGMENT_MAX_WORKERS = 8
+
 _GENERATE_GUIDELINES_TEMPLATE = Template((Path(__file__).parent / "prompts/generate_guidelines.jinja2").read_text())
+# Only the first _MAX_SUMMARY_STEPS agent steps are summarized, each truncated to _MAX_STEP_CHARS.
+_MAX_SUMMARY_STEPS = 50
+_MAX_STEP_CHARS = 2000
+_STEP_LABELS = {"reasoning": "Reasoning", "action": "Action"}
 
 
 def parse_openai_agents_trajectory(messages: list[dict]) -> dict:
@@ -37,16 +47,17 @@ def parse_openai_agents_trajectory(messages: list[dict]) -> dict:
     task_instruction: str | None = None
 
     for message in messages:
+        role = message.get("role")
         # Extract task instruction from first user message
-        if message.get("role") == "user" and task_instruction is None:
+        if role == "user" and task_instruction is None:
             if isinstance(message["content"], str):
                 task_instruction = message["content"]
             else:
                 raise EvolveException("First user message was not a task instruction.")
 
         # Extract assistant reasoning/messages
-        if message.get("role") == "assistant":
-            content = message.get("content", "")
+        if role == "assistant":
+            content = message.get("content")
             if isinstance(content, str) and content.strip():
                 agent_steps.append({"type": "reasoning", "content": content, "raw": message})
 
@@ -54,56 +65,46 @@ def parse_openai_agents_trajectory(messages: list[dict]) -> dict:
             elif isinstance(content, list):
                 for assistant_response in content:
                     if assistant_response["type"] == "function_call":
-                        function_call = {
-                            "type": "function_call",
-                            "name": assistant_response["function"]["name"],
-                            "arguments": assistant_response["function"]["arguments"],
-                            "call_id": assistant_response["id"],
-                            "raw": assistant_response,
-                        }
-                        function_calls.append(function_call)
+                        function = assistant_response["function"]
+                        name = function["name"]
+                        args_str = function["arguments"]
+                        function_calls.append(
+                            {
+                                "type": "function_call",
+                                "name": name,
+                                "arguments": args_str,
+                                "call_id": assistant_response["id"],
+                                "raw": assistant_response,
+                            }
+                        )
 
                         # Add to agent steps as an action
-                        args_str = assistant_response["function"]["arguments"]
                         try:
-                            args: dict = json.loads(args_str)
-                            args_display = ", ".join(f"{k}={json.dumps(v)}" for k, v in args.items())
-                            function_description = f"{assistant_response['function']['name']}({args_display})"
+                            args: dict = fast_json_loads(args_str)
+                            args_display = ", ".join(f"{k}={fast_json_dumps(v)}" for k, v in args.items())
+                            function_description = f"{name}({args_display})"
                         except JSONDecodeError:
-                            function_description = f"{assistant_response['function']['name']}({args_str})"
+                            function_description = f"{name}({args_str})"
 
-                        agent_steps.append(
-                            {
-                                "type": "action",
-                                "content": function_description,
-                                "raw": assistant_response,
-                            }
-                        )
+                        agent_steps.append({"type": "action", "content": function_description, "raw": assistant_response})
                     else:
                         raise EvolveException(f"Unhandled assistant content type in list `{assistant_response['type']}`")
-            else:
-                # Skip empty assistant messages (common from tool-calling patterns)
-                continue
+            # Anything else (e.g. empty assistant messages from tool-calling patterns) is skipped.
 
+    # Every agent step is a reasoning or an action step, so steps_list holds one entry per summarized step.
     steps_list = []
-    for i, step in enumerate(agent_steps[:50], 1):
-        step_type = step["type"]
+    for i, step in enumerate(agent_steps[:_MAX_SUMMARY_STEPS], 1):
         content = step["content"]
-        # Truncate long content
-        if len(content) > 2000:
-            content = content[:2000] + "..."
-
-        if step_type == "reasoning":
-            steps_list.append(f"**Step {i} - Reasoning:**\n{content}")
-        elif step_type == "action":
-            steps_list.append(f"**Step {i} - Action:**\n{content}")
+        if len(content) > _MAX_STEP_CHARS:
+            content = content[:_MAX_STEP_CHARS] + "..."
+        steps_list.append(f"**Step {i} - {_STEP_LABELS[step['type']]}:**\n{content}")
 
     return {
         "task_instruction": task_instruction or DEFAULT_TASK_DESCRIPTION,
         "trajectory_summary": "\n\n".join(steps_list),
         "steps_list": steps_list,
         "function_calls": function_calls,
-        "num_steps": len([s for s in agent_steps[:50] if s["type"] in ["action", "reasoning"]]),
+        "num_steps": len(steps_list),
     }
 
 
@@ -124,36 +125,47 @@ def _generate_guidelines_for_segment(
     llm_messages = dispatch_llm_pre_call(
         [{"role": "user", "content": prompt}], purpose="guideline_generation", model=llm_settings.guidelines_model
     )
-    if constrained_decoding_supported:
-        litellm.enable_json_schema_validation = True
-        raw = (
-            completion(
-                model=llm_settings.guidelines_model,
-                messages=llm_messages,
-                response_format=GuidelineGenerationResponse,
-                custom_llm_provider=llm_settings.custom_llm_provider,
+    cache_key = response_cache.request_key(
+        llm_settings.guidelines_model,
+        llm_settings.custom_llm_provider,
+        llm_messages,
+        GuidelineGenerationResponse if constrained_decoding_supported else None,
+    )
+    raw = response_cache.get(cache_key)
+    from_cache = raw is not None
+    if not from_cache:
+        if constrained_decoding_supported:
+            litellm.enable_json_schema_validation = True
+            raw = (
+                completion(
+                    model=llm_settings.guidelines_model,
+                    messages=llm_messages,
+                    response_format=GuidelineGenerationResponse,
+                    custom_llm_provider=llm_settings.custom_llm_provider,
+                )
+                .choices[0]
+                .message.content
             )
-            .choices[0]
-            .message.content
-        )
-    else:
-        litellm.enable_json_schema_validation = False
-        raw = (
-            completion(
-                model=llm_settings.guidelines_model,
-                messages=llm_messages,
-                custom_llm_provider=llm_settings.custom_llm_provider,
+        else:
+            litellm.enable_json_schema_validation = False
+            raw = (
+                completion(
+                    model=llm_settings.guidelines_model,
+                    messages=llm_messages,
+                    custom_llm_provider=llm_settings.custom_llm_provider,
+                )
+                .choices[0]
+                .message.content
             )
-            .choices[0]
-            .message.content
-        )
     clean_response = clean_llm_response(raw)
 
     if not clean_response:
         logger.warning(f"LLM returned empty response for guideline generation. Model: {llm_settings.guidelines_model}")
         return GuidelineGenerationResult(guidelines=[], task_description=task_description)
     try:
-        guidelines = GuidelineGenerationResponse.model_validate(json.loads(clean_response)).guidelines
+        guidelines = GuidelineGenerationResponse.model_validate(fast_json_loads(clean_response)).guidelines
+        if not from_cache:
+            response_cache.put(cache_key, clean_response)
         return GuidelineGenerationResult(guidelines=guidelines, task_description=task_description)
     except JSONDecodeError as e:
         logger.warning(f"Failed to parse LLM guideline generation response: {e}. Response: {repr(clean_response[:500])}")
@@ -176,14 +188,8 @@ def generate_guidelines(messages: list[dict]) -> list[GuidelineGenerationResult]
     trajectory when segmentation is disabled or produces fewer than 2 subtasks).
     """
     is_groq = llm_settings.custom_llm_provider == "groq" or llm_settings.guidelines_model.startswith("groq/")
-    supported_params = get_supported_openai_params(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
-    )
-    supports_response_format = supported_params and "response_format" in supported_params
-    response_schema_enabled = supports_response_schema(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
+    supports_response_format, response_schema_enabled = structured_output_support(
+        llm_settings.guidelines_model, llm_settings.custom_llm_provider
     )
     constrained_decoding_supported = bool(not is_groq and supports_response_format and response_schema_enabled)
 
@@ -197,7 +203,7 @@ def generate_guidelines(messages: list[dict]) -> list[GuidelineGenerationResult]
         from altk_evolve.llm.guidelines.segmentation import segment_trajectory  # avoid circular import
 
         try:
-            subtasks = segment_trajectory(messages)
+            subtasks = segment_trajectory(messages, trajectory_data=trajectory_data)
         except Exception as e:
             logger.warning(f"Trajectory segmentation failed, falling back to full trajectory: {e}")
             subtasks = []
@@ -213,15 +219,22 @@ def generate_guidelines(messages: list[dict]) -> list[GuidelineGenerationResult]
             valid_slices.append((subtask, steps_list[start:end]))
 
         if len(valid_slices) >= 2:
-            return [
-                _generate_guidelines_for_segment(
-                    task_description=subtask.generalized_description,
-                    trajectory_slice="\n\n".join(slice_steps),
-                    num_steps=len(slice_steps),
-                    constrained_decoding_supported=constrained_decoding_supported,
-                )
-                for subtask, slice_steps in valid_slices
-            ]
+            # The subtask calls are independent, so they run concurrently; each
+            # worker gets a copy of the caller's context (hook re-entrancy guards)
+            # and results are collected in subtask order.
+            with ThreadPoolExecutor(max_workers=min(_SEGMENT_MAX_WORKERS, len(valid_slices))) as executor:
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _generate_guidelines_for_segment,
+                        task_description=subtask.generalized_description,
+                        trajectory_slice="\n\n".join(slice_steps),
+                        num_steps=len(slice_steps),
+                        constrained_decoding_supported=constrained_decoding_supported,
+                    )
+                    for subtask, slice_steps in valid_slices
+                ]
+                return [future.result() for future in futures]
         # Fewer than 2 valid subtask slices — fall through to full-trajectory fallback.
 
     # Fallback: full trajectory (use segmented description if exactly 1 subtask was found)
@@ -5,20 +5,20 @@ from pathlib import Path
 
 import litellm
 from jinja2 import Template
-from litellm import completion, get_supported_openai_params, supports_response_schema
+from litellm import completion
 from pydantic import ValidationError
 
 from altk_evolve.config.llm import llm_settings
 from altk_evolve.hooks.manager import dispatch_llm_pre_call
 from altk_evolve.schema.guidelines import SegmentationResponse, SubtaskSegment
-from altk_evolve.utils.utils import clean_llm_response
+from altk_evolve.utils.utils import clean_llm_response, structured_output_support
 
 logger = logging.getLogger(__name__)
 
 _SEGMENT_TEMPLATE = Template((Path(__file__).parent / "prompts/segment_trajectory.jinja2").read_text())
 
 
-def segment_trajectory(messages: list[dict]) -> list[SubtaskSegment]:
+def segment_trajectory(messages: list[dict], trajectory_data: dict | None = None) -> list[SubtaskSegment]:
     """Segment a trajectory into logical subtasks with generalized descriptions.
 
     The returned start_step/end_step are 1-based indices into the filtered
@@ -26,21 +26,19 @@ def segment_trajectory(messages: list[dict]) -> list[SubtaskSegment]:
     NOT into raw messages. Callers must slice that same steps_list — slicing
     raw messages with these indices will misalign content.
 
+    Pass ``trajectory_data`` when the caller has already parsed ``messages``
+    with parse_openai_agents_trajectory, so they are not parsed twice.
+
     Returns an empty list on failure — callers fall back to full-trajectory guideline generation.
     """
-    # Import here to avoid circular import (guidelines.py imports this module)
-    from altk_evolve.llm.guidelines.guidelines import parse_openai_agents_trajectory
+    if trajectory_data is None:
+        # Import here to avoid circular import (guidelines.py imports this module)
+        from altk_evolve.llm.guidelines.guidelines import parse_openai_agents_trajectory
 
-    trajectory_data = parse_openai_agents_trajectory(messages)
+        trajectory_data = parse_openai_agents_trajectory(messages)
 
-    supported_params = get_supported_openai_params(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
-    )
-    supports_response_format = supported_params and "response_format" in supported_params
-    response_schema_enabled = supports_response_schema(
-        model=llm_settings.guidelines_model,
-        custom_llm_provider=llm_settings.custom_llm_provider,
+    supports_response_format, response_schema_enabled = structured_output_support(
+        llm_settings.guidelines_model, llm_settings.custom_llm_provider
     )
     constrained_decoding_supported = bool(supports_response_format and response_schema_enabled)
 
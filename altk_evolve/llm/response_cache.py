@@ -0,0 +1,88 @@
+"""
+Opt-in persistent cache of LLM response text.
+
+Guideline generation and cluster consolidation render their prompts purely from
+their inputs, so a recurring trajectory or cluster produces a byte-identical
+request. With ``EVOLVE_LLM_CACHE_PATH`` set, the raw response text of a request
+whose response parsed successfully is stored in a SQLite file under a SHA-256 of
+(model, provider, messages, response schema), and the next identical request is
+answered from disk instead of the LLM. Unset (the default), nothing is stored
+and every lookup misses.
+
+Conflict resolution keeps its own short-lived in-memory verdict cache instead
+(see ``conflict_resolution.py``): its answer depends on what is stored, which
+changes between writes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from pydantic import BaseModel
+
+from altk_evolve.config.llm import llm_settings
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE = "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+
+_connections: dict[str, sqlite3.Connection] = {}
+_lock = threading.Lock()
+
+
+def request_key(model: str, custom_llm_provider: str | None, messages: list[dict], response_format: type[BaseModel] | None = None) -> str:
+    """Hash everything that determines the response: model, provider, messages and the requested schema."""
+    schema = response_format.model_json_schema() if response_format is not None else None
+    payload = json.dumps([model, custom_llm_provider, messages, schema], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _connection() -> sqlite3.Connection | None:
+    """Return the shared connection for the configured cache file, or None when caching is off. Call with ``_lock`` held."""
+    path = llm_settings.llm_cache_path
+    if not path:
+        return None
+    path = os.path.expanduser(path)
+    connection = _connections.get(path)
+    if connection is None:
+        connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(_CREATE_TABLE)
+        _connections[path] = connection
+    return connection
+
+
+def get(key: str) -> str | None:
+    """Return the cached response text for ``key``, or None on a miss (or when caching is off)."""
+    with _lock:
+        try:
+            connection = _connection()
+            if connection is None:
+                return None
+            row = connection.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache read failed; calling the LLM: {e}")
+            return None
+    return row[0] if row else None
+
+
+def put(key: str, response: str) -> None:
+    """Store ``response`` under ``key``. Best effort: a failed write is logged and skipped."""
+    with _lock:
+        try:
+            connection = _connection()
+            if connection is not None:
+                connection.execute("INSERT OR REPLACE INTO llm_responses (key, response) VALUES (?, ?)", (key, response))
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+
+def close() -> None:
+    """Close every open cache connection (e.g. before deleting the cache file)."""
+    with _lock:
+        for connection in _connections.values():
+            connection.close()
+        _connections.clear()
@@ -12,7 +12,8 @@ class SimpleEntity(BaseModel):
 
     @staticmethod
     def from_recorded_entities(entities: list[RecordedEntity]) -> list["SimpleEntity"]:
-        return [SimpleEntity(id=entity.id, type=entity.type, content=entity.content) for entity in entities]
+        # The fields were validated when the RecordedEntity was built, so skip re-validating them.
+        return [SimpleEntity.model_construct(id=entity.id, type=entity.type, content=entity.content) for entity in entities]
 
 
 class EntityUpdate(BaseModel):
@@ -8,14 +8,18 @@ This module provides functionality to:
 4. Store trajectories and guidelines in the Evolve backend
 """
 
+import ast
 import json
 import logging
 import os
+import re
 import urllib.request
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from altk_evolve.utils.json import loads as fast_json_loads
 from altk_evolve.config.phoenix import phoenix_settings
 from altk_evolve.config.evolve import evolve_config
 from altk_evolve.frontend.client.evolve_client import EvolveClient
@@ -26,6 +30,8 @@ from altk_evolve.schema.exceptions import NamespaceNotFoundException
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("evolve.sync.phoenix")
 
+_SYSTEM_REMINDER = re.compile(r"<system-reminder>.*?</system-reminder>", re.DOTALL)
+
 
 @dataclass
 class SyncResult:
@@ -81,7 +87,7 @@ class PhoenixSync:
 
             try:
                 with urllib.request.urlopen(url, timeout=30) as response:
-                    data = json.loads(response.read().decode())
+                    data = fast_json_loads(response.read())
             except Exception as e:
                 logger.error(f"Failed to fetch spans from Phoenix: {e}")
                 raise
@@ -215,11 +221,10 @@ class PhoenixSync:
         """Parse content which may be a string representation of a list/dict."""
         if isinstance(content, str):
             try:
-                return json.loads(content)
+                return fast_json_loads(content)
             except json.JSONDecodeError:
+                # OpenTelemetry attributes are often Python reprs of lists/dicts rather than JSON.
                 try:
-                    import ast
-
                     return ast.literal_eval(content)
                 except (ValueError, SyntaxError):
                     return content
@@ -230,55 +235,16 @@ class PhoenixSync:
         attrs = span.get("attributes") or {}
         messages = []
 
-        # Determine which format is available per message side, preferring indexed over flat.
-        # Real OpenInference LLM spans often emit BOTH input.value and llm.input_messages.*
-        # keys simultaneously, so the source must be chosen independently per side to avoid
+        # One scan buckets every indexed attribute by side and message index. A side counts as
+        # indexed as soon as any key carries its prefix, preferring indexed over flat: real
+        # OpenInference LLM spans often emit BOTH input.value and llm.input_messages.* keys
+        # simultaneously, so the source must be chosen independently per side to avoid
         # double-counting the same messages when both formats are present.
-        has_indexed_input = any(k.startswith("llm.input_messages.") for k in attrs)
-        has_indexed_output = any(k.startswith("llm.output_messages.") for k in attrs)
+        indexed, gen_ai = self._bucket_indexed_attributes(attrs)
 
         # --- Input messages ---
-        if has_indexed_input:
-            input_indices: set[int] = set()
-            for key in attrs:
-                if key.startswith("llm.input_messages."):
-                    parts = key.split(".")
-                    if len(parts) >= 3 and parts[2].isdigit():
-                        input_indices.add(int(parts[2]))
-
-            for i in sorted(input_indices):
-                role = attrs.get(f"llm.input_messages.{i}.message.role")
-                content = attrs.get(f"llm.input_messages.{i}.message.content") or attrs.get(
-                    f"llm.input_messages.{i}.message.contents.0.message_content.text"
-                )
-                tool_call_id = attrs.get(f"llm.input_messages.{i}.message.tool_call_id")
-
-                # Collect indexed tool_calls: llm.input_messages.{i}.message.tool_calls.{j}.*
-                tc_indices: set[int] = set()
-                prefix = f"llm.input_messages.{i}.message.tool_calls."
-                for key in attrs:
-                    if key.startswith(prefix):
-                        parts = key[len(prefix) :].split(".")
-                        if parts and parts[0].isdigit():
-                            tc_indices.add(int(parts[0]))
-                tool_calls = []
-                for j in sorted(tc_indices):
-                    tc_prefix = f"llm.input_messages.{i}.message.tool_calls.{j}.tool_call."
-                    tool_calls.append(
-                        {
-                            "tool_call.id": attrs.get(f"{tc_prefix}id", ""),
-                            "tool_call.function.name": attrs.get(f"{tc_prefix}function.name", ""),
-                            "tool_call.function.arguments": attrs.get(f"{tc_prefix}function.arguments", "{}"),
-                        }
-                    )
-
-                if role:
-                    indexed_msg: dict = {"index": i, "type": "prompt", "role": role, "content": content}
-                    if tool_calls:
-                        indexed_msg["tool_calls"] = tool_calls
-                    if tool_call_id:
-                        indexed_msg["tool_call_id"] = tool_call_id
-                    messages.append(indexed_msg)
+        if "input_messages" in indexed:
+            messages.extend(self._indexed_messages(indexed["input_messages"], "prompt"))
         else:
             # Non-indexed: flat llm.input_messages list or input.value JSON
             input_msgs = attrs.get("llm.input_messages")
@@ -324,43 +290,8 @@ class PhoenixSync:
                             messages.append(mapped_msg)
 
         # --- Output messages ---
-        if has_indexed_output:
-            output_indices: set[int] = set()
-            for key in attrs:
-                if key.startswith("llm.output_messages."):
-                    parts = key.split(".")
-                    if len(parts) >= 3 and parts[2].isdigit():
-                        output_indices.add(int(parts[2]))
-
-            for i in sorted(output_indices):
-                role = attrs.get(f"llm.output_messages.{i}.message.role")
-                content = attrs.get(f"llm.output_messages.{i}.message.content") or attrs.get(
-                    f"llm.output_messages.{i}.message.contents.0.message_content.text"
-                )
-
-                tc_indices_out: set[int] = set()
-                prefix_out = f"llm.output_messages.{i}.message.tool_calls."
-                for key in attrs:
-                    if key.startswith(prefix_out):
-                        parts = key[len(prefix_out) :].split(".")
-                        if parts and parts[0].isdigit():
-                            tc_indices_out.add(int(parts[0]))
-                tool_calls_out = []
-                for j in sorted(tc_indices_out):
-                    tc_prefix_out = f"llm.output_messages.{i}.message.tool_calls.{j}.tool_call."
-                    tool_calls_out.append(
-                        {
-                            "tool_call.id": attrs.get(f"{tc_prefix_out}id", ""),
-                            "tool_call.function.name": attrs.get(f"{tc_prefix_out}function.name", ""),
-                            "tool_call.function.arguments": attrs.get(f"{tc_prefix_out}function.arguments", "{}"),
-                        }
-                    )
-
-                if role:
-                    mapped_msg_out: dict = {"index": i, "type": "completion", "role": role, "content": content}
-                    if tool_calls_out:
-                        mapped_msg_out["tool_calls"] = tool_calls_out
-                    messages.append(mapped_msg_out)
+        if "output_messages" in indexed:
+            messages.extend(self._indexed_messages(indexed["output_messages"], "completion"))
         else:
             # Non-indexed: flat llm.output_messages list or output.value
             output_msgs = attrs.get("llm.output_messages")
@@ -410,47 +341,86 @@ class PhoenixSync:
         if messages:
             return messages
 
-        # Fallback to GenAI semantic conventions (original code)
-        # Extract prompt messages
-        prompt_indices = set()
-        for key in attrs:
-            if key.startswith("gen_ai.prompt.") and key.endswith(".role"):
-                idx = int(key.split(".")[2])
-                prompt_indices.add(idx)
-
-        for i in sorted(prompt_indices):
-            role = attrs.get(f"gen_ai.prompt.{i}.role")
-            content = attrs.get(f"gen_ai.prompt.{i}.content")
-            if role and content is not None:
-                messages.append(
-                    {
-                        "index": i,
-                        "type": "prompt",
-                        "role": role,
-                        "content": self._parse_content(content),
-                    }
-                )
+        # Fallback to GenAI semantic conventions: gen_ai.{prompt,completion}.{i}.{role,content}
+        for message_type in ("prompt", "completion"):
+            fields_by_index = gen_ai[message_type]
+            for i in sorted(fields_by_index):
+                role = fields_by_index[i].get("role")
+                content = fields_by_index[i].get("content")
+                if role and content is not None:
+                    messages.append(
+                        {
+                            "index": i,
+                            "type": message_type,
+                            "role": role,
+                            "content": self._parse_content(content),
+                        }
+                    )
 
-        # Extract completion messages
-        completion_indices = set()
-        for key in attrs:
-            if key.startswith("gen_ai.completion.") and key.endswith(".role"):
-                idx = int(key.split(".")[2])
-                completion_indices.add(idx)
-
-        for i in sorted(completion_indices):
-            role = attrs.get(f"gen_ai.completion.{i}.role")
-            content = attrs.get(f"gen_ai.completion.{i}.content")
-            if role and content is not None:
-                messages.append(
+        return messages
+
+    @staticmethod
+    def _bucket_indexed_attributes(attrs: dict) -> tuple[dict[str, dict[int, dict[str, Any]]], dict[str, dict[int, dict[str, Any]]]]:
+        """Group indexed message attributes by side and message index in a single pass over ``attrs``.
+
+        Returns ``(indexed, gen_ai)``. ``indexed`` maps ``"input_messages"``/``"output_messages"``
+        to ``{i: {"message.role": ..., ...}}`` for ``llm.<side>.<i>.<field>`` keys, and has a
+        side's key whenever any ``llm.<side>.`` key exists. ``gen_ai`` maps ``"prompt"``/``"completion"``
+        to ``{i: {"role": ..., "content": ...}}`` for ``gen_ai.<kind>.<i>.<field>`` keys.
+        """
+        indexed: dict[str, dict[int, dict[str, Any]]] = {}
+        gen_ai: dict[str, dict[int, dict[str, Any]]] = {"prompt": {}, "completion": {}}
+        for key, value in attrs.items():
+            parts = key.split(".", 3)
+            if len(parts) < 3:
+                continue
+            if parts[0] == "llm" and parts[1] in ("input_messages", "output_messages"):
+                side = indexed.setdefault(parts[1], {})
+                if parts[2].isdigit():
+                    fields = side.setdefault(int(parts[2]), {})
+                    if len(parts) == 4:
+                        fields[parts[3]] = value
+            elif parts[0] == "gen_ai" and parts[1] in gen_ai and len(parts) == 4 and parts[2].isdigit():
+                gen_ai[parts[1]].setdefault(int(parts[2]), {})[parts[3]] = value
+        return indexed, gen_ai
+
+    @staticmethod
+    def _indexed_messages(fields_by_index: dict[int, dict[str, Any]], message_type: str) -> list[dict]:
+        """Build messages, in index order, from one side's bucketed ``llm.*_messages.<i>.*`` fields."""
+        messages = []
+        for i in sorted(fields_by_index):
+            fields = fields_by_index[i]
+            role = fields.get("message.role")
+            if not role:
+                continue
+            content = fields.get("message.content") or fields.get("message.contents.0.message_content.text")
+
+            # Indexed tool_calls: message.tool_calls.{j}.tool_call.*
+            tc_indices: set[int] = set()
+            for field in fields:
+                if field.startswith("message.tool_calls."):
+                    j = field[len("message.tool_calls.") :].split(".", 1)[0]
+                    if j.isdigit():
+                        tc_indices.add(int(j))
+            tool_calls = []
+            for j in sorted(tc_indices):
+                tc_prefix = f"message.tool_calls.{j}.tool_call."
+                tool_calls.append(
                     {
-                        "index": i,
-                        "type": "completion",
-                        "role": role,
-                        "content": self._parse_content(content),
+                        "tool_call.id": fields.get(f"{tc_prefix}id", ""),
+                        "tool_call.function.name": fields.get(f"{tc_prefix}function.name", ""),
+                        "tool_call.function.arguments": fields.get(f"{tc_prefix}function.arguments", "{}"),
                     }
                 )
 
+            message: dict = {"index": i, "type": message_type, "role": role, "content": content}
+            if tool_calls:
+                message["tool_calls"] = tool_calls
+            # Only input messages answer a tool call.
+            tool_call_id = fields.get("message.tool_call_id") if message_type == "prompt" else None
+            if tool_call_id:
+                message["tool_call_id"] = tool_call_id
+            messages.append(message)
         return messages
 
     def _convert_to_openai_format(self, content: Any, role: str) -> dict:
@@ -757,8 +727,6 @@ class PhoenixSync:
 
     def _clean_trajectory(self, trajectory: dict) -> dict:
         """Clean up a trajectory by removing system reminders."""
-        import re
-
         cleaned_messages = []
 
         for msg in trajectory.get("messages", []):
@@ -768,12 +736,7 @@ class PhoenixSync:
             if msg.get("content"):
                 content = msg["content"]
                 if isinstance(content, str):
-                    content = re.sub(
-                        r"<system-reminder>.*?</system-reminder>",
-                        "",
-                        content,
-                        flags=re.DOTALL,
-                    ).strip()
+                    content = _SYSTEM_REMINDER.sub("", content).strip()
                     if not content:
                         continue
                     msg = {**msg, "content": content}
@@ -782,19 +745,26 @@ class PhoenixSync:
 
         return {**trajectory, "messages": cleaned_messages}
 
-    def _process_trajectory(self, trajectory: dict) -> int:
-        """Process a single trajectory: store it and generate guidelines.
+    def _store_guidelines(self, guideline_entities: list[Entity]) -> None:
+        if guideline_entities:
+            self.client.update_entities(
+                namespace_id=self.namespace_id,
+                entities=guideline_entities,
+                enable_conflict_resolution=True,
+            )
 
-        The trajectory entity is written only after guideline generation succeeds,
-        so a generation failure leaves the trace unprocessed and eligible for retry.
+    def _generate_entities(self, trajectory: dict) -> tuple[Optional[Entity], list[Entity]]:
+        """Build the trajectory entity and generate its guideline entities without writing anything.
 
-        Returns the number of guidelines generated.
+        Holds no shared state, so it is safe to run for several trajectories concurrently.
         """
         messages = trajectory.get("messages", [])
 
         # Build trajectory entity but defer the write until after generation succeeds.
+        # Entities here are built from already-typed values (a JSON string, validated Guideline
+        # models), so model_construct skips re-validating them; spans from Phoenix never reach it directly.
         trajectory_entity = (
-            Entity(
+            Entity.model_construct(
                 type="trajectory",
                 content=json.dumps(messages),
                 metadata={
@@ -841,7 +811,7 @@ class PhoenixSync:
                 except Exception as e:
                     logger.warning(f"Debug write failed for trace {trajectory['trace_id']}: {e} — production path unaffected")
             guideline_entities += [
-                Entity(
+                Entity.model_construct(
                     type="guideline",
                     content=guideline.content,
                     metadata={
@@ -864,7 +834,7 @@ class PhoenixSync:
             try:
                 consistency_results = generate_consistency_guidelines(trajectory)
                 guideline_entities += [
-                    Entity(
+                    Entity.model_construct(
                         type="guideline",
                         content=guideline.content,
                         metadata={
@@ -887,34 +857,31 @@ class PhoenixSync:
                     f"Consistency guideline generation failed for trace {trajectory['trace_id']}, "
                     f"skipping consistency results (regular guidelines unaffected): {e}"
                 )
-        # Write trajectory entity only after generation succeeded so a generation
-        # failure leaves the trace unprocessed and eligible for retry on the next run.
-        if trajectory_entity:
-            self.client.update_entities(
-                namespace_id=self.namespace_id,
-                entities=[trajectory_entity],
-                enable_conflict_resolution=False,
-            )
-        if guideline_entities:
-            self.client.update_entities(
-                namespace_id=self.namespace_id,
-                entities=guideline_entities,
-                enable_conflict_resolution=True,
-            )
 
-        return len(guideline_entities)
+        return trajectory_entity, guideline_entities
 
     def sync(
         self,
         limit: int = 100,
         include_errors: bool = False,
+        batch_size: int = 64,
+        concurrency: int = 8,
     ) -> SyncResult:
         """
         Fetch new trajectories from Phoenix and generate guidelines.
 
+        Traces are handled in batches of ``batch_size``. Within a batch, guideline
+        generation (the LLM-bound step) runs on up to ``concurrency`` worker threads
+        while the previous batch is being written, guidelines are written trace by
+        trace so conflict resolution still sees guidelines stored earlier in the run,
+        and the batch's trajectory entities are then stored with a single bulk
+        ``update_entities`` call.
+
         Args:
             limit: Maximum number of spans to fetch from Phoenix
             include_errors: Whether to include failed/error spans
+            batch_size: Number of traces generated and stored per batch
+            concurrency: Maximum number of trajectories generated in parallel
 
         Returns:
             SyncResult with counts of processed, skipped, and guidelines generated
@@ -959,23 +926,83 @@ class PhoenixSync:
         spans_by_trace = self._group_spans_by_trace(candidate_spans)
         logger.info(f"Selected {len(spans_by_trace)} traces from {len(candidate_spans)} candidate spans")
 
+        trajectories: list[tuple[str, dict]] = []
         for trace_id, trace_spans in spans_by_trace.items():
             try:
                 trajectory = self._build_trajectory_for_trace(trace_id, trace_spans)
                 if trajectory is None:
                     continue
                 trajectory = self._clean_trajectory(trajectory)
-
                 if trajectory["messages"]:
-                    guidelines_count = self._process_trajectory(trajectory)
-                    processed += 1
-                    guidelines_generated += guidelines_count
-                    logger.info(f"Processed trace {trajectory['trace_id'][:12]}... - generated {guidelines_count} guidelines")
+                    trajectories.append((trace_id, trajectory))
             except Exception as e:
                 error_msg = f"Error processing trace {trace_id}: {e}"
                 logger.exception(error_msg)
                 errors.append(error_msg)
 
+        batch_size = max(1, batch_size)
+        batches = [trajectories[start : start + batch_size] for start in range(0, len(trajectories), batch_size)]
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+
+            def submit(batch: list[tuple[str, dict]]) -> list:
+                return [executor.submit(self._generate_entities, trajectory) for _, trajectory in batch]
+
+            next_futures = submit(batches[0]) if batches else []
+            for index, batch in enumerate(batches):
+                futures = next_futures
+                # Generation reads only its own trajectory, so the next batch is generated
+                # while this one is being stored.
+                next_futures = submit(batches[index + 1]) if index + 1 < len(batches) else []
+
+                generated: list[tuple[str, dict, Optional[Entity], list[Entity]]] = []
+                for (trace_id, trajectory), future in zip(batch, futures):
+                    try:
+                        trajectory_entity, guideline_entities = future.result()
+                    except Exception as e:
+                        error_msg = f"Error processing trace {trace_id}: {e}"
+                        logger.exception(error_msg)
+                        errors.append(error_msg)
+                        continue
+                    generated.append((trace_id, trajectory, trajectory_entity, guideline_entities))
+
+                # Guidelines are stored trace by trace so conflict resolution sees those
+                # stored earlier in the run.
+                stored: list[tuple[str, dict, Optional[Entity], list[Entity]]] = []
+                for trace_id, trajectory, trajectory_entity, guideline_entities in generated:
+                    try:
+                        self._store_guidelines(guideline_entities)
+                    except Exception as e:
+                        error_msg = f"Error processing trace {trace_id}: {e}"
+                        logger.exception(error_msg)
+                        errors.append(error_msg)
+                        continue
+                    stored.append((trace_id, trajectory, trajectory_entity, guideline_entities))
+
+                # A stored trajectory entity marks its trace as done, so the batch's
+                # trajectories are written last, and only for traces whose guidelines
+                # were stored. An interrupted or failed batch is regenerated on the next
+                # run (conflict resolution absorbs the repeated guidelines) instead of
+                # being skipped forever.
+                trajectory_entities = [entity for _, _, entity, _ in stored if entity is not None]
+                if trajectory_entities:
+                    try:
+                        self.client.update_entities(
+                            namespace_id=self.namespace_id,
+                            entities=trajectory_entities,
+                            enable_conflict_resolution=False,
+                        )
+                    except Exception as e:
+                        for trace_id, *_ in stored:
+                            error_msg = f"Error processing trace {trace_id}: {e}"
+                            logger.exception(error_msg)
+                            errors.append(error_msg)
+                        continue
+
+                for _, trajectory, _, guideline_entities in stored:
+                    processed += 1
+                    guidelines_generated += len(guideline_entities)
+                    logger.info(f"Processed trace {trajectory['trace_id'][:12]}... - generated {len(guideline_entities)} guidelines")
+
         result = SyncResult(
             processed=processed,
             skipped=skipped,
@@ -0,0 +1,38 @@
+"""JSON helpers: orjson when it is importable, the stdlib otherwise.
+
+orjson arrives with arize-phoenix (or the ``fast`` extra), so it is normally
+present; the fallback keeps the CLI, LLM parsing and sync working in
+trimmed-down installs.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# Both raise a json.JSONDecodeError subclass on malformed input.
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def dumps(value: Any) -> str:
+    """Serialize ``value`` compactly (no whitespace between tokens)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"))
+
+
+def dumps_pretty(value: Any) -> str:
+    """Serialize ``value`` with two-space indentation, like ``json.dumps(value, indent=2)``."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # orjson rejects what the stdlib accepts, e.g. integers beyond 64 bits or non-str keys.
+            pass
+    return json.dumps(value, indent=2)
@@ -1,5 +1,15 @@
 import json
-import re
+import string
+import time
+from functools import lru_cache
+
+# Provider 4xx statuses a retry can fix: request timeout, conflict and rate limit.
+_RETRIABLE_CLIENT_STATUS_CODES = frozenset({408, 409, 429})
+_LLM_RETRY_BASE_DELAY = 0.5
+
+_FENCE_LANGUAGE_CHARS = frozenset(string.ascii_letters + string.digits)
+_REASONING_OPENERS = ("<think>", "<thinking>", "<reflection>")
+_REASONING_CLOSERS = ("</think>", "</thinking>", "</reflection>")
 
 
 def serialize_content(content: str | list | dict) -> str:
@@ -25,7 +35,94 @@ def clean_llm_response(content: str) -> str:
     - Returns the inner content of a Markdown code block.
     - If Markdown code blocks are not present, remove thought and reasoning blocks entirely.
     """
-    pattern = r"^```[a-zA-Z0-9]*\n(.*?)\n```$"
-    match = re.match(pattern, content.strip(), flags=re.MULTILINE | re.DOTALL)
-    match_res = match.group(1).strip() if match else content.strip()
-    return re.sub(r"<(?:think(?:ing)?|reflection)>.*?</(?:think(?:ing)?|reflection)>", "", match_res, flags=re.DOTALL).strip()
+    stripped = content.strip()
+    fenced = _fenced_block(stripped)
+    match_res = fenced.strip() if fenced is not None else stripped
+    return _strip_reasoning_blocks(match_res).strip()
+
+
+def _fenced_block(text: str) -> str | None:
+    """Return the body of a Markdown code block that opens ``text``, or None.
+
+    The block opens with three backticks, an optional alphanumeric language tag and a newline,
+    and ends at the first newline followed by three backticks that end a line; anything after
+    it is dropped. A linear scan, so no regex backtracking on long responses.
+    """
+    if not text.startswith("```"):
+        return None
+    body_start = 3
+    while body_start < len(text) and text[body_start] in _FENCE_LANGUAGE_CHARS:
+        body_start += 1
+    if body_start == len(text) or text[body_start] != "\n":
+        return None
+    body_start += 1
+    search_from = body_start
+    while (close := text.find("\n```", search_from)) != -1:
+        after = close + 4
+        if after == len(text) or text[after] == "\n":
+            return text[body_start:close]
+        search_from = close + 1
+    return None
+
+
+def _strip_reasoning_blocks(text: str) -> str:
+    """Remove every ``<think>``/``<thinking>``/``<reflection>`` block, each ending at the first closing tag of any kind.
+
+    Scans left to right with ``str.find``, remembering the next position of every tag so each
+    search resumes where the last one stopped: linear in ``len(text)``. An opener with no
+    closing tag after it is kept, together with the rest of the text.
+    """
+    next_at = {tag: text.find(tag) for tag in _REASONING_OPENERS + _REASONING_CLOSERS}
+
+    def first_of(tags: tuple[str, ...], start: int) -> tuple[int, str] | None:
+        found = []
+        for tag in tags:
+            if 0 <= next_at[tag] < start:
+                next_at[tag] = text.find(tag, start)
+            if next_at[tag] >= 0:
+                found.append((next_at[tag], tag))
+        return min(found) if found else None
+
+    kept: list[str] = []
+    pos = 0
+    while (opener := first_of(_REASONING_OPENERS, pos)) is not None:
+        opened_at, opening_tag = opener
+        closer = first_of(_REASONING_CLOSERS, opened_at + len(opening_tag))
+        if closer is None:
+            break
+        closed_at, closing_tag = closer
+        kept.append(text[pos:opened_at])
+        pos = closed_at + len(closing_tag)
+    kept.append(text[pos:])
+    return "".join(kept)
+
+
+@lru_cache(maxsize=32)
+def structured_output_support(model: str, custom_llm_provider: str | None) -> tuple[bool, bool]:
+    """Return ``(supports response_format, supports a response schema)`` for ``model``, probed once per process.
+
+    The litellm probes walk its model metadata on every call yet only depend on the model and provider.
+    ``structured_output_support.cache_clear()`` forgets the probed answers.
+    """
+    from litellm import get_supported_openai_params, supports_response_schema
+
+    supported_params = get_supported_openai_params(model=model, custom_llm_provider=custom_llm_provider)
+    supports_response_format = bool(supported_params and "response_format" in supported_params)
+    return supports_response_format, bool(supports_response_schema(model=model, custom_llm_provider=custom_llm_provider))
+
+
+def wait_before_llm_retry(error: BaseException, attempt: int) -> bool:
+    """Return whether an LLM call whose 0-based ``attempt`` raised ``error`` is worth retrying.
+
+    Provider errors carry an HTTP ``status_code``: any other 4xx (bad request, auth, unknown
+    model, context window exceeded) fails the same way again, so it is not retried, while rate
+    limits, timeouts and 5xx sleep 0.5s, 1s, 2s, ... first. Anything else, such as a response that
+    does not parse or validate, is retried at once, since a fresh sample may.
+    """
+    status_code = getattr(error, "status_code", None)
+    if not isinstance(status_code, int):
+        return True
+    if 400 <= status_code < 500 and status_code not in _RETRIABLE_CLIENT_STATUS_CODES:
+        return False
+    time.sleep(_LLM_RETRY_BASE_DELAY * 2**attempt)
+    return True
@@ -28,6 +28,24 @@ def mock_sentence_transformer(request):
         yield None
 
 
+@pytest.fixture(autouse=True)
+def clear_conflict_resolution_cache():
+    """Conflict-resolution LLM verdicts are cached per process; start every test with an empty cache."""
+    from altk_evolve.llm.conflict_resolution.conflict_resolution import clear_conflict_resolution_cache
+
+    clear_conflict_resolution_cache()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_structured_output_support_cache():
+    """litellm structured-output probes are cached per process; start every test with an empty cache."""
+    from altk_evolve.utils.utils import structured_output_support
+
+    structured_output_support.cache_clear()
+    yield
+
+
 def pytest_addoption(parser):
     """Add custom command line options."""
     parser.addoption(
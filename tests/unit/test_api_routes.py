@@ -0,0 +1,193 @@
+import asyncio
+import datetime
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fastapi import Response
+
+from altk_evolve.frontend.api import routes
+from altk_evolve.frontend.api.routes import (
+    EntityCreateRequest,
+    clear_dashboard_cache,
+    create_namespace_entity,
+    delete_namespace,
+    get_dashboard,
+    list_namespace_entities,
+)
+from altk_evolve.schema.core import Namespace, RecordedEntity
+
+pytestmark = pytest.mark.unit
+
+
+def _namespace(ns_id: str, num_entities: int) -> Namespace:
+    return Namespace(id=ns_id, created_at=datetime.datetime(2025, 1, 1), num_entities=num_entities)
+
+
+def _entity(entity_id: str, entity_type: str, minute: int) -> RecordedEntity:
+    return RecordedEntity(
+        id=entity_id,
+        type=entity_type,
+        content=f"content {entity_id}",
+        created_at=datetime.datetime(2025, 1, 1, 12, minute),
+    )
+
+
+@pytest.fixture
+def mock_get_client():
+    clear_dashboard_cache()
+    client = MagicMock()
+    client.config.backend = "filesystem"
+    yield client
+    clear_dashboard_cache()
+
+
+def _dashboard(client: MagicMock, response: Response | None = None) -> dict:
+    return asyncio.run(get_dashboard(response or Response(), client=client))
+
+
+def test_dashboard_aggregates_all_namespaces(mock_get_client):
+    mock_get_client.ready.return_value = True
+    mock_get_client.all_namespaces.return_value = [_namespace("a", 3), _namespace("b", 5)]
+    samples = {
+        "a": [_entity("1", "guideline", 1), _entity("2", "fact", 3)],
+        "b": [_entity("3", "guideline", 2)],
+    }
+    mock_get_client.get_entities_batch.side_effect = lambda ns_ids, limit_per: {ns_id: samples[ns_id] for ns_id in ns_ids}
+
+    payload = _dashboard(mock_get_client)
+
+    assert payload["health"] is True
+    assert payload["namespace_count"] == 2
+    assert payload["total_entities"] == 8
+    breakdown = {row["type"]: row["count"] for row in payload["approximate_type_breakdown"]}
+    assert breakdown == {"guideline": 2, "fact": 1}
+    assert [e["id"] for e in payload["recent_entities"]] == ["2", "3", "1"]
+    assert {e["id"]: e["namespace"] for e in payload["recent_entities"]} == {"1": "a", "2": "a", "3": "b"}
+
+
+def test_dashboard_keeps_the_newest_entities(mock_get_client):
+    mock_get_client.all_namespaces.return_value = [_namespace("a", 12), _namespace("b", 12)]
+    samples = {
+        "a": [_entity(f"a{minute}", "guideline", minute) for minute in range(0, 24, 2)],
+        "b": [_entity(f"b{minute}", "guideline", minute) for minute in range(1, 24, 2)],
+    }
+    mock_get_client.get_entities_batch.side_effect = lambda ns_ids, limit_per: {ns_id: samples[ns_id] for ns_id in ns_ids}
+
+    payload = _dashboard(mock_get_client)
+
+    expected = [f"{'a' if minute % 2 == 0 else 'b'}{minute}" for minute in range(23, 13, -1)]
+    assert [e["id"] for e in payload["recent_entities"]] == expected
+
+
+def test_dashboard_survives_a_failing_batch_read(mock_get_client):
+    mock_get_client.ready.return_value = True
+    mock_get_client.all_namespaces.return_value = [_namespace("ok", 1), _namespace("broken", 4)]
+    mock_get_client.get_entities_batch.side_effect = RuntimeError("backend down")
+
+    payload = _dashboard(mock_get_client)
+
+    assert payload["namespace_count"] == 2
+    assert payload["total_entities"] == 5
+    assert payload["recent_entities"] == []
+
+
+def test_snippet_truncates_long_and_non_string_content():
+    assert routes._snippet("x" * 100) == "x" * 100
+    assert routes._snippet("x" * 101) == "x" * 100 + "..."
+    assert routes._snippet({"k": "v" * 200}).endswith("...")
+    assert routes._snippet(["a"]) == "['a']"
+
+
+def test_dashboard_is_cached_until_a_write(mock_get_client):
+    mock_get_client.all_namespaces.return_value = [_namespace("a", 1)]
+    mock_get_client.get_entities_batch.return_value = {"a": [_entity("1", "guideline", 1)]}
+
+    response = Response()
+    first = _dashboard(mock_get_client, response)
+    second = _dashboard(mock_get_client)
+
+    assert second == first
+    assert mock_get_client.all_namespaces.call_count == 1
+    assert response.headers["Cache-Control"] == "private, max-age=0, must-revalidate"
+
+    delete_namespace("a", client=mock_get_client)
+    _dashboard(mock_get_client)
+    assert mock_get_client.all_namespaces.call_count == 2
+
+
+def test_dashboard_concurrent_misses_share_one_computation(mock_get_client):
+    release = threading.Event()
+    mock_get_client.get_entities_batch.return_value = {}
+
+    def all_namespaces(limit):
+        release.wait(timeout=5)
+        return [_namespace("a", 1)]
+
+    mock_get_client.all_namespaces.side_effect = all_namespaces
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(_dashboard(mock_get_client))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while len(routes._dashboard_inflight) == 0:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(results) == 4
+    assert mock_get_client.all_namespaces.call_count == 1
+
+
+def test_list_namespace_entities_clamps_limit(mock_get_client):
+    mock_get_client.get_all_entities.return_value = [_entity("1", "guideline", 1)]
+
+    result = asyncio.run(list_namespace_entities("a", type="guideline", limit=10_000, client=mock_get_client))
+
+    assert [e["id"] for e in result] == ["1"]
+    mock_get_client.get_all_entities.assert_called_once_with("a", filters={"type": "guideline"}, limit=routes.MAX_ENTITY_LIMIT)
+
+
+def test_create_namespace_entity_inserts_off_the_event_loop(mock_get_client):
+    loop_thread = threading.get_ident()
+    insert_threads = []
+
+    def update_entities(namespace_id, entities, enable_conflict_resolution):
+        insert_threads.append(threading.get_ident())
+        return [MagicMock(id="42")]
+
+    mock_get_client.update_entities.side_effect = update_entities
+    req = EntityCreateRequest(content="Prefer pathlib", type="guideline")
+
+    assert asyncio.run(create_namespace_entity("a", req, client=mock_get_client)) == {"success": True, "id": "42"}
+    assert insert_threads and insert_threads[0] != loop_thread
+
+
+def test_routes_resolve_the_shared_client_through_the_dependency():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.include_router(routes.router)
+    with (
+        patch("altk_evolve.frontend.mcp.mcp_server.get_initialized_client", return_value=None),
+        patch("altk_evolve.frontend.mcp.mcp_server.get_client") as get_client,
+    ):
+        get_client.return_value.all_namespaces_lite.return_value = [("a", 2)]
+        response = TestClient(app).get("/namespaces")
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": "a", "amount_of_entities": 2}]
+    get_client.assert_called_once_with()
+
+
+def test_client_dependency_skips_the_threadpool_once_initialized():
+    client = MagicMock()
+    with (
+        patch("altk_evolve.frontend.mcp.mcp_server.get_initialized_client", return_value=client),
+        patch("altk_evolve.frontend.mcp.mcp_server.get_client") as get_client,
+    ):
+        assert asyncio.run(routes._client_dep()) is client
+
+    get_client.assert_not_called()
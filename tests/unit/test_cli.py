@@ -1,13 +1,16 @@
 """Tests for Evolve CLI commands."""
 
 import datetime
+import json
+import os
+import zipfile
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.exceptions import Exit
 from typer.testing import CliRunner
 
-from altk_evolve.cli.cli import app, consolidate_entities
+from altk_evolve.cli.cli import _fmt_dt, app, consolidate_entities
 from altk_evolve.schema.core import Namespace, RecordedEntity
 from altk_evolve.schema.conflict_resolution import EntityUpdate
 from altk_evolve.schema.exceptions import (
@@ -98,6 +101,40 @@ class TestNamespacesCreate:
         assert "already exists" in result.stdout
 
 
+@pytest.mark.unit
+class TestNamespacesCreateBulk:
+    """Tests for 'evolve namespaces create-bulk' command."""
+
+    def test_create_bulk_from_file(self, mock_client, tmp_path):
+        source = tmp_path / "namespaces.txt"
+        source.write_text("ns_a\n\nns_b\nns_a\n")
+        created_at = datetime.datetime.now(datetime.UTC)
+        mock_client.create_namespaces.side_effect = lambda ids: [Namespace(id=i, created_at=created_at) for i in ids]
+
+        result = runner.invoke(app, ["namespaces", "create-bulk", "--file", str(source)])
+
+        assert result.exit_code == 0
+        assert "Created 2 namespaces" in result.stdout
+        mock_client.create_namespaces.assert_called_once_with(["ns_a", "ns_b"])
+
+    def test_create_bulk_skip_existing(self, mock_client):
+        mock_client.namespace_exists.side_effect = lambda namespace_id: namespace_id == "old"
+        mock_client.create_namespaces.return_value = []
+
+        result = runner.invoke(app, ["namespaces", "create-bulk", "--skip-existing"], input="old\nnew\n")
+
+        assert result.exit_code == 0
+        mock_client.create_namespaces.assert_called_once_with(["new"])
+
+    def test_create_bulk_already_exists(self, mock_client):
+        mock_client.create_namespaces.side_effect = NamespaceAlreadyExistsException("One of the namespaces already exists")
+
+        result = runner.invoke(app, ["namespaces", "create-bulk"], input="ns_a\n")
+
+        assert result.exit_code == 1
+        assert "already exists" in result.stdout
+
+
 @pytest.mark.unit
 class TestNamespacesDelete:
     """Tests for 'evolve namespaces delete' command."""
@@ -181,7 +218,7 @@ class TestEntitiesList:
 
     def test_list_entities_empty(self, mock_client):
         """Test listing entities when none exist."""
-        mock_client.get_all_entities.return_value = []
+        mock_client.iter_all_entities.return_value = iter([])
 
         result = runner.invoke(app, ["entities", "list", "my_namespace"])
 
@@ -191,10 +228,12 @@ class TestEntitiesList:
     def test_list_entities_with_results(self, mock_client):
         """Test listing entities with results."""
         created_at = datetime.datetime(2024, 1, 15, 10, 30, 0, tzinfo=datetime.UTC)
-        mock_client.get_all_entities.return_value = [
-            RecordedEntity(id="1", type="guideline", content="Always test your code", created_at=created_at),
-            RecordedEntity(id="2", type="fact", content="Python is awesome", created_at=created_at),
-        ]
+        mock_client.iter_all_entities.return_value = iter(
+            [
+                RecordedEntity(id="1", type="guideline", content="Always test your code", created_at=created_at),
+                RecordedEntity(id="2", type="fact", content="Python is awesome", created_at=created_at),
+            ]
+        )
 
         result = runner.invoke(app, ["entities", "list", "my_namespace"])
 
@@ -202,18 +241,19 @@ class TestEntitiesList:
         assert "guideline" in result.stdout
         assert "Always test your code" in result.stdout
         assert "fact" in result.stdout
+        assert "Total: 2 entities" in result.stdout
 
     def test_list_entities_with_type_filter(self, mock_client):
         """Test listing entities with type filter."""
-        mock_client.get_all_entities.return_value = []
+        mock_client.iter_all_entities.return_value = iter([])
 
         runner.invoke(app, ["entities", "list", "my_namespace", "--type", "guideline"])
 
-        mock_client.get_all_entities.assert_called_once_with("my_namespace", filters={"type": "guideline"}, limit=100)
+        mock_client.iter_all_entities.assert_called_once_with("my_namespace", filters={"type": "guideline"}, limit=100)
 
     def test_list_entities_namespace_not_found(self, mock_client):
         """Test listing entities from non-existent namespace."""
-        mock_client.get_all_entities.side_effect = NamespaceNotFoundException()
+        mock_client.iter_all_entities.side_effect = NamespaceNotFoundException()
 
         result = runner.invoke(app, ["entities", "list", "nonexistent"])
 
@@ -224,9 +264,11 @@ class TestEntitiesList:
         """Test that long content is truncated in the list view."""
         created_at = datetime.datetime.now(datetime.UTC)
         long_content = "A" * 100  # Content longer than 60 chars
-        mock_client.get_all_entities.return_value = [
-            RecordedEntity(id="1", type="guideline", content=long_content, created_at=created_at),
-        ]
+        mock_client.iter_all_entities.return_value = iter(
+            [
+                RecordedEntity(id="1", type="guideline", content=long_content, created_at=created_at),
+            ]
+        )
 
         result = runner.invoke(app, ["entities", "list", "my_namespace"])
 
@@ -264,8 +306,9 @@ class TestEntitiesAdd:
         assert "Entity ADD" in result.stdout
         assert "123" in result.stdout
 
-    def test_add_entity_creates_namespace(self, mock_client):
+    def test_add_entity_creates_namespace(self, mock_client, monkeypatch):
         """Test that adding entity prompts to create namespace if it doesn't exist."""
+        monkeypatch.setattr("altk_evolve.cli.cli._stdin_is_interactive", lambda: True)
         mock_client.namespace_exists.return_value = False
         mock_client.update_entities.return_value = [EntityUpdate(id="1", type="guideline", content="Test", event="ADD")]
 
@@ -285,8 +328,9 @@ class TestEntitiesAdd:
         assert result.exit_code == 0
         mock_client.create_namespace.assert_called_once_with("new_namespace")
 
-    def test_add_entity_declined_namespace_creation(self, mock_client):
+    def test_add_entity_declined_namespace_creation(self, mock_client, monkeypatch):
         """Test declining namespace creation."""
+        monkeypatch.setattr("altk_evolve.cli.cli._stdin_is_interactive", lambda: True)
         mock_client.namespace_exists.return_value = False
 
         result = runner.invoke(
@@ -298,6 +342,33 @@ class TestEntitiesAdd:
         assert result.exit_code == 1
         mock_client.create_namespace.assert_not_called()
 
+    def test_add_entity_create_namespace_flag_skips_prompt(self, mock_client):
+        mock_client.namespace_exists.return_value = False
+        mock_client.update_entities.return_value = [EntityUpdate(id="1", type="guideline", content="Test", event="ADD")]
+
+        result = runner.invoke(
+            app, ["entities", "add", "new_namespace", "--content", "Test", "--create-namespace", "--no-conflict-resolution"]
+        )
+
+        assert result.exit_code == 0
+        mock_client.create_namespace.assert_called_once_with("new_namespace")
+
+    def test_add_entity_non_interactive_missing_namespace_fails(self, mock_client):
+        mock_client.namespace_exists.return_value = False
+
+        result = runner.invoke(app, ["entities", "add", "new_namespace", "--content", "Test", "--no-conflict-resolution"])
+
+        assert result.exit_code == 1
+        assert "--create-namespace" in result.stdout
+        mock_client.create_namespace.assert_not_called()
+
+    def test_add_entity_non_interactive_requires_content(self, mock_client):
+        result = runner.invoke(app, ["entities", "add", "my_namespace"])
+
+        assert result.exit_code == 1
+        assert "Pass --content" in result.stdout
+        mock_client.update_entities.assert_not_called()
+
     def test_add_entity_with_metadata(self, mock_client):
         """Test adding entity with JSON metadata."""
         mock_client.namespace_exists.return_value = True
@@ -357,8 +428,9 @@ class TestEntitiesAdd:
         assert result.exit_code == 0
         assert "filtered by conflict resolution" in result.stdout
 
-    def test_add_entity_prompts_for_content(self, mock_client):
+    def test_add_entity_prompts_for_content(self, mock_client, monkeypatch):
         """Test that CLI prompts for content if not provided."""
+        monkeypatch.setattr("altk_evolve.cli.cli._stdin_is_interactive", lambda: True)
         mock_client.namespace_exists.return_value = True
         mock_client.update_entities.return_value = [EntityUpdate(id="1", type="guideline", content="Prompted content", event="ADD")]
 
@@ -374,6 +446,54 @@ class TestEntitiesAdd:
         assert entity.content == "Prompted content"
 
 
+@pytest.mark.unit
+class TestEntitiesAddBulk:
+    """Tests for 'evolve entities add-bulk' command."""
+
+    @staticmethod
+    def _echo_updates(namespace, entities, enable_conflict_resolution):
+        return [EntityUpdate(id=str(i), type=e.type, content=e.content, event="ADD") for i, e in enumerate(entities)]
+
+    def test_add_bulk_batches_per_type(self, mock_client, tmp_path):
+        lines = [json.dumps({"content": f"g{i}"}) for i in range(5)]
+        lines += [json.dumps({"content": "a fact", "type": "fact", "metadata": {"k": "v"}}), ""]
+        source = tmp_path / "entities.jsonl"
+        source.write_text("\n".join(lines))
+        mock_client.namespace_exists.return_value = True
+        mock_client.update_entities.side_effect = self._echo_updates
+
+        result = runner.invoke(
+            app, ["entities", "add-bulk", "my_namespace", "--file", str(source), "--batch-size", "2", "--no-conflict-resolution"]
+        )
+
+        assert result.exit_code == 0
+        assert "ADD 6" in result.stdout
+        batches = [(c.args[1][0].type, len(c.args[1])) for c in mock_client.update_entities.call_args_list]
+        assert batches == [("guideline", 2), ("guideline", 2), ("guideline", 1), ("fact", 1)]
+        assert all(c.kwargs["enable_conflict_resolution"] is False for c in mock_client.update_entities.call_args_list)
+        assert mock_client.update_entities.call_args_list[-1].args[1][0].metadata == {"k": "v"}
+
+    def test_add_bulk_reads_stdin_and_creates_namespace(self, mock_client):
+        mock_client.namespace_exists.return_value = False
+        mock_client.update_entities.side_effect = self._echo_updates
+
+        result = runner.invoke(app, ["entities", "add-bulk", "new_ns"], input='{"content": "one"}\n{"content": "two"}\n')
+
+        assert result.exit_code == 0
+        mock_client.create_namespace.assert_called_once_with("new_ns")
+        mock_client.update_entities.assert_called_once()
+        assert [e.content for e in mock_client.update_entities.call_args.args[1]] == ["one", "two"]
+
+    def test_add_bulk_rejects_invalid_line(self, mock_client):
+        mock_client.namespace_exists.return_value = True
+
+        result = runner.invoke(app, ["entities", "add-bulk", "my_namespace"], input='{"content": "ok"}\n{"type": "fact"}\n')
+
+        assert result.exit_code == 1
+        assert "Invalid entity on line 2" in result.stdout
+        mock_client.update_entities.assert_not_called()
+
+
 @pytest.mark.unit
 class TestEntitiesDelete:
     """Tests for 'evolve entities delete' command."""
@@ -456,19 +576,19 @@ class TestEntitiesShow:
     def test_show_entity_success(self, mock_client):
         """Test showing entity details successfully."""
         created_at = datetime.datetime(2024, 1, 15, 10, 30, 0, tzinfo=datetime.UTC)
-        mock_client.get_all_entities.return_value = [
-            RecordedEntity(
-                id="123",
-                type="guideline",
-                content="Full entity content here",
-                created_at=created_at,
-                metadata={"source": "test"},
-            ),
-        ]
+        mock_client.get_entity_by_id.return_value = RecordedEntity(
+            id="123",
+            type="guideline",
+            content="Full entity content here",
+            created_at=created_at,
+            metadata={"source": "test"},
+        )
 
         result = runner.invoke(app, ["entities", "show", "my_namespace", "123"])
 
         assert result.exit_code == 0
+        mock_client.get_entity_by_id.assert_called_once_with("my_namespace", "123")
+        mock_client.get_all_entities.assert_not_called()
         assert "123" in result.stdout
         assert "guideline" in result.stdout
         assert "Full entity content here" in result.stdout
@@ -476,7 +596,7 @@ class TestEntitiesShow:
 
     def test_show_entity_not_found(self, mock_client):
         """Test showing non-existent entity."""
-        mock_client.get_all_entities.return_value = []
+        mock_client.get_entity_by_id.return_value = None
 
         result = runner.invoke(app, ["entities", "show", "my_namespace", "nonexistent"])
 
@@ -485,7 +605,7 @@ class TestEntitiesShow:
 
     def test_show_entity_namespace_not_found(self, mock_client):
         """Test showing entity from non-existent namespace."""
-        mock_client.get_all_entities.side_effect = NamespaceNotFoundException()
+        mock_client.get_entity_by_id.side_effect = NamespaceNotFoundException()
 
         result = runner.invoke(app, ["entities", "show", "nonexistent", "123"])
 
@@ -495,9 +615,9 @@ class TestEntitiesShow:
     def test_show_entity_without_metadata(self, mock_client):
         """Test showing entity without metadata."""
         created_at = datetime.datetime(2024, 1, 15, 10, 30, 0, tzinfo=datetime.UTC)
-        mock_client.get_all_entities.return_value = [
-            RecordedEntity(id="123", type="guideline", content="Content without metadata", created_at=created_at),
-        ]
+        mock_client.get_entity_by_id.return_value = RecordedEntity(
+            id="123", type="guideline", content="Content without metadata", created_at=created_at
+        )
 
         result = runner.invoke(app, ["entities", "show", "my_namespace", "123"])
 
@@ -576,7 +696,7 @@ class TestSyncPhoenix:
             result = runner.invoke(app, ["sync", "phoenix"])
 
             assert result.exit_code == 0
-            mock_syncer.sync.assert_called_once_with(limit=100, include_errors=False)
+            mock_syncer.sync.assert_called_once_with(limit=100, include_errors=False, batch_size=64, concurrency=8)
 
     def test_sync_phoenix_with_custom_url(self):
         """Test sync phoenix with custom Phoenix URL."""
@@ -636,7 +756,7 @@ class TestSyncPhoenix:
             result = runner.invoke(app, ["sync", "phoenix", "--limit", "50"])
 
             assert result.exit_code == 0
-            mock_syncer.sync.assert_called_once_with(limit=50, include_errors=False)
+            mock_syncer.sync.assert_called_once_with(limit=50, include_errors=False, batch_size=64, concurrency=8)
 
     def test_sync_phoenix_with_include_errors(self):
         """Test sync phoenix with include-errors flag."""
@@ -651,7 +771,22 @@ class TestSyncPhoenix:
             result = runner.invoke(app, ["sync", "phoenix", "--include-errors"])
 
             assert result.exit_code == 0
-            mock_syncer.sync.assert_called_once_with(limit=100, include_errors=True)
+            mock_syncer.sync.assert_called_once_with(limit=100, include_errors=True, batch_size=64, concurrency=8)
+
+    def test_sync_phoenix_with_batch_size_and_concurrency(self):
+        """Test sync phoenix forwards batching options."""
+        with patch("altk_evolve.sync.phoenix_sync.PhoenixSync") as MockSync:
+            mock_syncer = MagicMock()
+            mock_syncer.phoenix_url = "http://localhost:6006"
+            mock_syncer.project = "default"
+            mock_syncer.namespace_id = "test_ns"
+            mock_syncer.sync.return_value = MagicMock(processed=0, skipped=0, guidelines_generated=0, errors=[])
+            MockSync.return_value = mock_syncer
+
+            result = runner.invoke(app, ["sync", "phoenix", "--batch-size", "16", "--concurrency", "2"])
+
+            assert result.exit_code == 0
+            mock_syncer.sync.assert_called_once_with(limit=100, include_errors=False, batch_size=16, concurrency=2)
 
     def test_sync_phoenix_displays_results(self):
         """Test sync phoenix displays results in output."""
@@ -779,4 +914,153 @@ class TestSyncPhoenixMore:
 
             assert result.exit_code == 0
             MockSync.assert_called_once_with(phoenix_url="http://custom:9000", namespace_id="production", project="prod")
-            mock_syncer.sync.assert_called_once_with(limit=500, include_errors=True)
+            mock_syncer.sync.assert_called_once_with(limit=500, include_errors=True, batch_size=64, concurrency=8)
+
+
+# =============================================================================
+# Embeddings Commands Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestEmbeddingsDaemon:
+    """Tests for 'evolve embeddings daemon' and 'evolve embeddings stop'."""
+
+    def test_daemon_defaults_to_configured_model(self, monkeypatch):
+        monkeypatch.setattr("altk_evolve.config.evolve.evolve_config.backend", "postgres")
+        monkeypatch.setattr("altk_evolve.config.postgres.postgres_db_settings.embedding_model", "pg-model")
+        with patch("altk_evolve.backend.embedding_daemon.serve") as mock_serve:
+            result = runner.invoke(app, ["embeddings", "daemon"])
+
+        assert result.exit_code == 0
+        mock_serve.assert_called_once()
+        assert mock_serve.call_args.args[0] == "pg-model"
+        assert mock_serve.call_args.kwargs == {"idle_timeout": 900.0}
+
+    def test_daemon_zero_idle_timeout_disables_timeout(self, tmp_path):
+        with patch("altk_evolve.backend.embedding_daemon.serve") as mock_serve:
+            result = runner.invoke(
+                app, ["embeddings", "daemon", "--model", "m", "--socket", str(tmp_path / "e.sock"), "--idle-timeout", "0"]
+            )
+
+        assert result.exit_code == 0
+        mock_serve.assert_called_once_with("m", tmp_path / "e.sock", idle_timeout=None)
+
+    def test_stop_without_running_daemon(self, tmp_path):
+        result = runner.invoke(app, ["embeddings", "stop", "--model", "m", "--socket", str(tmp_path / "e.sock")])
+
+        assert result.exit_code == 0
+        assert "No embedding daemon running" in result.stdout
+
+
+# =============================================================================
+# Skills Commands Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSkillsPackage:
+    """Tests for 'evolve skills package' command."""
+
+    @staticmethod
+    def _make_skills(source, names):
+        for name in names:
+            skill = source / name
+            (skill / "assets").mkdir(parents=True)
+            (skill / "SKILL.md").write_text(f"# {name}\n" * 50)
+            (skill / "assets" / "logo.png").write_bytes(b"\x89PNG" + bytes(range(256)) * 8)
+
+    def test_package_skills_in_parallel(self, tmp_path):
+        source, output = tmp_path / "skills", tmp_path / "dist"
+        self._make_skills(source, ["alpha", "beta", "gamma"])
+
+        result = runner.invoke(app, ["skills", "package", "-s", str(source), "-o", str(output), "--workers", "3"])
+
+        assert result.exit_code == 0
+        assert "Successfully packaged 3/3 skill(s)" in result.stdout
+        with zipfile.ZipFile(output / "beta.skill") as zf:
+            assert zf.testzip() is None
+            infos = {info.filename: info for info in zf.infolist()}
+            assert zf.read("beta/SKILL.md") == (source / "beta" / "SKILL.md").read_bytes()
+        assert set(infos) == {"beta/SKILL.md", "beta/assets/logo.png"}
+        assert infos["beta/SKILL.md"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["beta/SKILL.md"].compress_size < infos["beta/SKILL.md"].file_size
+        assert infos["beta/assets/logo.png"].compress_type == zipfile.ZIP_STORED
+
+    def test_package_skills_reports_failures(self, tmp_path):
+        source, output = tmp_path / "skills", tmp_path / "dist"
+        self._make_skills(source, ["alpha", "beta"])
+        output.mkdir()
+        # A directory where beta's archive should go makes that one skill fail.
+        (output / "beta.skill").mkdir()
+
+        result = runner.invoke(app, ["skills", "package", "-s", str(source), "-o", str(output)])
+
+        assert result.exit_code == 1
+        assert "Failed to package beta" in result.stdout
+        assert "Packaged 1/2 skill(s); 1 failed" in result.stdout
+        assert zipfile.is_zipfile(output / "alpha.skill")
+
+    def test_package_skills_reproducible_archives_are_byte_identical(self, tmp_path):
+        source = tmp_path / "skills"
+        self._make_skills(source, ["alpha"])
+        (source / "alpha" / "b.txt").write_text("b")
+        (source / "alpha" / "a.txt").write_text("a")
+
+        archives = []
+        for run in range(2):
+            output = tmp_path / f"dist{run}"
+            os.utime(source / "alpha" / "SKILL.md", (1_000_000_000 + run, 1_000_000_000 + run))
+            result = runner.invoke(app, ["skills", "package", "-s", str(source), "-o", str(output), "--reproducible"])
+            assert result.exit_code == 0
+            archives.append((output / "alpha.skill").read_bytes())
+
+        assert archives[0] == archives[1]
+        with zipfile.ZipFile(tmp_path / "dist0" / "alpha.skill") as zf:
+            names = zf.namelist()
+            assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        assert names == sorted(names)
+
+    def test_package_skills_dry_run_counts_nested_files(self, tmp_path):
+        source, output = tmp_path / "skills", tmp_path / "dist"
+        self._make_skills(source, ["alpha"])
+        (source / "alpha" / "assets" / "deep").mkdir()
+        (source / "alpha" / "assets" / "deep" / "notes.txt").write_text("x")
+
+        result = runner.invoke(app, ["skills", "package", "-s", str(source), "-o", str(output), "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "│ alpha │     3 │" in result.stdout
+        assert not output.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("dt", [datetime.datetime(2024, 1, 5, 9, 7, 3, tzinfo=datetime.UTC), datetime.datetime(999, 12, 31, 23, 59, 59)])
+def test_fmt_dt_matches_strftime(dt):
+    assert _fmt_dt(dt) == f"{dt.year:04d}" + dt.strftime("-%m-%d %H:%M")
+    assert _fmt_dt(dt, seconds=True) == f"{dt.year:04d}" + dt.strftime("-%m-%d %H:%M:%S")
+
+
+@pytest.mark.unit
+def test_json_helpers_match_stdlib():
+    from altk_evolve.utils import json as fast_json
+
+    value = {"tags": ["a", "b"], "nested": {"n": 1.5, "ok": True, "none": None}}
+    assert fast_json.dumps_pretty(value) == json.dumps(value, indent=2)
+    assert fast_json.dumps_pretty({"big": 2**70}) == json.dumps({"big": 2**70}, indent=2)
+    assert json.loads(fast_json.dumps(value)) == value
+    assert fast_json.dumps({"big": 2**70}) == json.dumps({"big": 2**70}, separators=(",", ":"))
+    assert fast_json.loads('{"k": [1, 2]}') == {"k": [1, 2]}
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads("{not json")
+
+
+@pytest.mark.unit
+def test_cli_import_does_not_load_client_stack():
+    import subprocess
+    import sys
+
+    heavy = ("altk_evolve.frontend.client.evolve_client", "numpy")
+    code = f"import sys, altk_evolve.cli.cli; print(sorted(m for m in {heavy!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -188,6 +188,23 @@ def test_get_all_entities(evolve_client: EvolveClient, monkeypatch):
     assert result[0].created_at == created_at
 
 
+@pytest.mark.unit
+def test_iter_all_entities(evolve_client: EvolveClient, monkeypatch):
+    # Client should flatten backend pages into a lazy stream of entities
+    created_at = datetime.datetime.now(datetime.UTC)
+    entities = [RecordedEntity(id=str(i), type="fact", created_at=created_at, content=f"Fact {i}") for i in range(5)]
+
+    def search_entities_impl(self, namespace_id, query=None, filters=None, limit=10) -> list[RecordedEntity]:
+        return entities[:limit]
+
+    monkeypatch.setattr(
+        evolve_client.backend, "_search_entities_impl", search_entities_impl.__get__(evolve_client.backend, BaseEntityBackend)
+    )
+    pages = list(evolve_client.backend.iter_entities("foobar", limit=4, page_size=3))
+    assert [len(page) for page in pages] == [3, 1]
+    assert [e.id for e in evolve_client.iter_all_entities("foobar", limit=4, page_size=3)] == ["0", "1", "2", "3"]
+
+
 @pytest.mark.unit
 def test_delete_entity(evolve_client: EvolveClient, monkeypatch):
     # Function should successfully be called in backend; essentially a no-op test.
@@ -196,3 +213,53 @@ def test_delete_entity(evolve_client: EvolveClient, monkeypatch):
 
     monkeypatch.setattr(evolve_client.backend, "delete_entity_by_id", delete_entity_by_id.__get__(evolve_client.backend, BaseEntityBackend))
     evolve_client.delete_entity_by_id(namespace_id="foobar", entity_id="1")
+
+
+@pytest.mark.unit
+def test_ready_reuses_a_healthy_result(evolve_client: EvolveClient, monkeypatch):
+    calls = []
+
+    def counting_ready() -> bool:
+        calls.append(1)
+        return True
+
+    evolve_client.invalidate_ready_cache()
+    monkeypatch.setattr(evolve_client.backend, "ready", counting_ready)
+    assert evolve_client.ready() and evolve_client.ready()
+    assert len(calls) == 1
+
+    evolve_client.invalidate_ready_cache()
+    assert evolve_client.ready()
+    assert len(calls) == 2
+
+    def failing_ready() -> bool:
+        raise ConnectionError("backend down")
+
+    evolve_client.invalidate_ready_cache()
+    monkeypatch.setattr(evolve_client.backend, "ready", failing_ready)
+    with pytest.raises(ConnectionError):
+        evolve_client.ready()
+    monkeypatch.setattr(evolve_client.backend, "ready", counting_ready)
+    assert evolve_client.ready()
+    assert len(calls) == 3
+
+
+@pytest.mark.unit
+def test_backend_class_is_resolved_once(evolve_client: EvolveClient):
+    from altk_evolve.frontend.client import evolve_client as client_module
+
+    assert client_module._BACKEND_CLASSES["filesystem"][0] is type(evolve_client.backend)
+    assert client_module._backend_classes("filesystem") is client_module._BACKEND_CLASSES["filesystem"]
+    with pytest.raises(NotImplementedError):
+        client_module._backend_classes("nope")
+
+
+@pytest.mark.unit
+def test_close_releases_backend_connections(monkeypatch):
+    client = EvolveClient(config=EvolveConfig(backend="filesystem"))
+    closed = []
+    monkeypatch.setattr(client.backend, "close", lambda: closed.append(True))
+
+    client.close()
+
+    assert closed == [True]
@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient
+from altk_evolve.llm.guidelines import clustering
 from altk_evolve.llm.guidelines.clustering import _union_find, cluster_entities
 from altk_evolve.schema.core import RecordedEntity
 
@@ -24,6 +26,19 @@ def _make_entity(entity_id: str, task_description: str | None = None) -> Recorde
     )
 
 
+@pytest.mark.unit
+def test_sentence_transformer_uses_embedding_daemon_when_enabled():
+    with (
+        patch.object(clustering.evolve_config, "embedding_daemon", True),
+        patch.object(clustering, "SentenceTransformer") as sentence_transformer,
+    ):
+        model = clustering._get_sentence_transformer("some-model")
+
+    assert isinstance(model, EmbeddingDaemonClient)
+    assert model.model_name == "some-model"
+    sentence_transformer.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _union_find tests
 # ---------------------------------------------------------------------------
@@ -57,13 +72,35 @@ class TestUnionFind:
         sizes = sorted(len(g) for g in groups)
         assert sizes == [2, 2]
 
+    def test_array_pairs_group_in_index_order(self):
+        groups = _union_find(6, np.array([[3, 5], [0, 4], [4, 5]]))
+        assert groups == [[0, 3, 4, 5], [1], [2]]
+
+    def test_no_elements(self):
+        assert _union_find(0, []) == []
+
+
+@pytest.mark.unit
+def test_similar_pairs_matches_full_matrix_across_blocks():
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(7, 4)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    rows, cols = np.nonzero(np.triu(embeddings @ embeddings.T >= 0.2, k=1))
+    expected = sorted(zip(rows.tolist(), cols.tolist()))
+
+    with patch.object(clustering, "_SIMILARITY_BLOCK_ROWS", 3):
+        pairs = clustering._similar_pairs(embeddings, 0.2)
+
+    assert pairs.shape == (len(expected), 2)
+    assert sorted(map(tuple, pairs.tolist())) == expected
+
 
 # ---------------------------------------------------------------------------
 # cluster_entities tests
 # ---------------------------------------------------------------------------
 
 
-def _mock_encode(descriptions, normalize_embeddings=True):
+def _mock_encode(descriptions, normalize_embeddings=True, **kwargs):
     """Return controlled embeddings: identical vectors for similar, orthogonal for different."""
     vectors = []
     for desc in descriptions:
@@ -133,6 +170,20 @@ class TestClusterEntities:
         cluster_ids = {e.id for e in clusters[0]}
         assert cluster_ids == {"1", "3"}
 
+    def test_accepts_a_lazy_iterator(self, mock_st_cls):
+        mock_model = MagicMock()
+        mock_model.encode = _mock_encode
+        mock_st_cls.return_value = mock_model
+
+        entities = (
+            _make_entity(str(i), desc)
+            for i, desc in enumerate(["Improve error handling in API", None, "Better error handling for edge cases"])
+        )
+
+        clusters = cluster_entities(entities, threshold=0.9, embedding_model="test-model")
+
+        assert [{e.id for e in c} for c in clusters] == [{"0", "2"}]
+
     def test_empty_input(self, mock_st_cls):
         clusters = cluster_entities([], threshold=0.8, embedding_model="test-model")
         assert clusters == []
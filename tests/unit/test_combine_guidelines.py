@@ -1,6 +1,7 @@
 """Unit tests for guideline combining and consolidation logic."""
 
 import json
+import threading
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -70,8 +71,8 @@ SAMPLE_GUIDELINES = [
 @pytest.mark.unit
 class TestCombineCluster:
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=False)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=[])
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
     def test_combine_cluster_returns_guidelines(self, _mock_params, _mock_schema, mock_completion):
         mock_completion.return_value = _mock_completion_response(SAMPLE_GUIDELINES)
 
@@ -89,8 +90,8 @@ class TestCombineCluster:
         mock_completion.assert_called_once()
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=False)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=[])
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
     def test_combine_cluster_sums_support_and_merges_evidence(self, _mock_params, _mock_schema, mock_completion):
         # One consolidated guideline subsumes both inputs -> support 2+3=5, evidence success+failure=both.
         mock_completion.return_value = _mock_completion_response([_cg("Merged rule", "strategy", [0, 1])])
@@ -107,8 +108,8 @@ class TestCombineCluster:
         assert result[0].evidence == "both"
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=False)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=[])
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
     def test_combine_cluster_carries_uncovered_members(self, _mock_params, _mock_schema, mock_completion):
         # Model only covers index 0; index 1 must survive as its own guideline (lossless fail-safe).
         mock_completion.return_value = _mock_completion_response([_cg("Merged rule", "strategy", [0])])
@@ -128,8 +129,8 @@ class TestCombineCluster:
         assert carried.evidence == "failure"
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=False)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=[])
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
     def test_combine_cluster_dedupes_repeated_source_indices(self, _mock_params, _mock_schema, mock_completion):
         # A repeated index within one guideline's source_indices must not double-count support.
         mock_completion.return_value = _mock_completion_response([_cg("Merged rule", "strategy", [0, 0, 1])])
@@ -147,8 +148,8 @@ class TestCombineCluster:
         assert sum(g.support for g in result) == 5
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=False)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=[])
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
     def test_combine_cluster_lossy_uses_aggressive_prompt(self, _mock_params, _mock_schema, mock_completion):
         mock_completion.return_value = _mock_completion_response([_cg("Merged", "strategy", [0, 1])])
 
@@ -160,8 +161,8 @@ class TestCombineCluster:
         assert "Merge liberally" in prompt
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=False)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=[])
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
     def test_combine_cluster_retries_on_failure(self, _mock_params, _mock_schema, mock_completion):
         mock_completion.side_effect = [
             ValueError("bad json"),
@@ -177,8 +178,8 @@ class TestCombineCluster:
         assert mock_completion.call_count == 3
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=False)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=[])
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
     def test_combine_cluster_raises_after_max_retries(self, _mock_params, _mock_schema, mock_completion):
         mock_completion.side_effect = ValueError("always fails")
 
@@ -190,8 +191,8 @@ class TestCombineCluster:
         assert mock_completion.call_count == 3
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=True)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=["response_format"])
+    @patch("litellm.supports_response_schema", return_value=True)
+    @patch("litellm.get_supported_openai_params", return_value=["response_format"])
     def test_combine_cluster_uses_structured_output(self, _mock_params, _mock_schema, mock_completion, monkeypatch):
         monkeypatch.setattr(clustering_module.llm_settings, "guidelines_model", "gpt-4o")
         monkeypatch.setattr(clustering_module.llm_settings, "custom_llm_provider", "openai")
@@ -206,8 +207,8 @@ class TestCombineCluster:
         assert "response_format" in kwargs
 
     @patch("altk_evolve.llm.guidelines.clustering.completion")
-    @patch("altk_evolve.llm.guidelines.clustering.supports_response_schema", return_value=True)
-    @patch("altk_evolve.llm.guidelines.clustering.get_supported_openai_params", return_value=["response_format"])
+    @patch("litellm.supports_response_schema", return_value=True)
+    @patch("litellm.get_supported_openai_params", return_value=["response_format"])
     def test_combine_cluster_uses_json_prompt_for_groq_even_when_schema_is_reported(
         self,
         _mock_params,
@@ -284,15 +285,14 @@ class TestConsolidateGuidelines:
         assert new_entities[0].metadata["support"] == 2
         assert enable_cr is False
 
-        # Verify deletes were called for each original entity
-        assert mock_backend.delete_entity_by_id.call_count == 2
-        mock_backend.delete_entity_by_id.assert_any_call("test-ns", "1")
-        mock_backend.delete_entity_by_id.assert_any_call("test-ns", "2")
+        # Verify the original entities were deleted in one batch
+        mock_backend.delete_entities_by_ids.assert_called_once_with("test-ns", ["1", "2"])
+        mock_backend.delete_entity_by_id.assert_not_called()
 
         # Verify insert happened before deletes
         call_names = [str(c) for c in mock_backend.mock_calls]
         insert_idx = next(i for i, c in enumerate(call_names) if "update_entities" in c)
-        first_delete_idx = next(i for i, c in enumerate(call_names) if "delete_entity_by_id" in c)
+        first_delete_idx = next(i for i, c in enumerate(call_names) if "delete_entities_by_ids" in c)
         assert insert_idx < first_delete_idx
 
     @patch("altk_evolve.llm.guidelines.clustering.combine_cluster")
@@ -325,6 +325,31 @@ class TestConsolidateGuidelines:
         assert result.support_before == 5
         assert result.support_after == 5
 
+    @patch("altk_evolve.llm.guidelines.clustering.combine_cluster")
+    def test_consolidate_guidelines_combines_clusters_concurrently(self, mock_combine):
+        # Both LLM calls must be in flight at once to get past the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def combine(cluster, mode):
+            barrier.wait()
+            return [Guideline(content=f"C-{cluster[0].id}", rationale="R", category="strategy", trigger="T", support=len(cluster))]
+
+        mock_combine.side_effect = combine
+        cluster1 = [_make_entity(f"c1-{i}", f"Guideline {i}", "task A") for i in range(2)]
+        cluster2 = [_make_entity(f"c2-{i}", f"Guideline {i}", "task B") for i in range(2)]
+
+        mock_backend = MagicMock()
+        mock_backend._search_entities_impl.return_value = cluster1 + cluster2
+        client = _make_client(mock_backend)
+
+        with patch.object(client, "_cluster_guideline_entities", return_value=[cluster1, cluster2]):
+            result = client.consolidate_guidelines("test-ns")
+
+        assert result.clusters_found == 2
+        # Write-back stays in cluster order.
+        inserted = [c.args[1][0].content for c in mock_backend.update_entities.call_args_list]
+        assert inserted == ["C-c1-0", "C-c2-0"]
+
     def test_consolidate_guidelines_none_mode_is_noop(self):
         mock_backend = MagicMock()
         client = _make_client(mock_backend, mode="none")
@@ -333,4 +358,4 @@ class TestConsolidateGuidelines:
 
         assert result == ConsolidationResult(clusters_found=0, guidelines_before=0, guidelines_after=0)
         mock_backend.update_entities.assert_not_called()
-        mock_backend.delete_entity_by_id.assert_not_called()
+        mock_backend.delete_entities_by_ids.assert_not_called()
@@ -4,14 +4,18 @@ import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import litellm
 import pytest
 
+from altk_evolve.config.llm import llm_settings
 from altk_evolve.llm.conflict_resolution.conflict_resolution import (
+    clear_conflict_resolution_cache,
     resolve_conflicts,
     get_update_entities_messages,
 )
 from altk_evolve.schema.conflict_resolution import SimpleEntity
 from altk_evolve.schema.core import RecordedEntity
+from altk_evolve.schema.exceptions import EvolveException
 
 
 # =============================================================================
@@ -19,6 +23,15 @@ from altk_evolve.schema.core import RecordedEntity
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def no_verdict_cache(monkeypatch):
+    """Tests swap the mocked LLM verdict between identical prompts, so caching is off unless a test enables it."""
+    monkeypatch.setattr(llm_settings, "conflict_resolution_cache_ttl", 0)
+    clear_conflict_resolution_cache()
+    yield
+    clear_conflict_resolution_cache()
+
+
 @pytest.fixture
 def sample_recorded_entities():
     """Create sample RecordedEntity objects for testing."""
@@ -241,6 +254,18 @@ def test_get_update_entities_messages_default_prompt():
     assert "New content" in prompt
 
 
+@pytest.mark.unit
+def test_get_update_entities_messages_serializes_entities_as_indented_json():
+    """Entity lists are rendered as the same 4-space-indented JSON the LLM prompt has always used."""
+    old_entities = [SimpleEntity(id="1", type="guideline", content={"steps": ["a", "b"], "note": 'say "hi"'})]
+    new_entities = [SimpleEntity(id="2", type="guideline", content="New content")]
+
+    prompt = get_update_entities_messages(old_entities, new_entities)
+
+    assert json.dumps([entity.model_dump(mode="json") for entity in old_entities], indent=4) in prompt
+    assert json.dumps([entity.model_dump(mode="json") for entity in new_entities], indent=4) in prompt
+
+
 # =============================================================================
 # resolve_conflicts() Tests
 # =============================================================================
@@ -401,6 +426,48 @@ def test_resolve_conflicts_retry_logic(
     assert mock_completion.call_count == 3
 
 
+@pytest.mark.unit
+@patch("altk_evolve.utils.utils.time.sleep")
+@patch("altk_evolve.llm.conflict_resolution.conflict_resolution.completion")
+def test_resolve_conflicts_backs_off_on_rate_limit(
+    mock_completion,
+    mock_sleep,
+    sample_recorded_entities,
+    sample_new_recorded_entities,
+    mock_llm_response_add,
+):
+    """Rate-limited calls are retried after an exponentially growing pause."""
+    mock_response_success = Mock()
+    mock_response_success.choices = [Mock()]
+    mock_response_success.choices[0].message.content = mock_llm_response_add
+    rate_limited = litellm.RateLimitError("slow down", llm_provider="openai", model="gpt-4o")
+    mock_completion.side_effect = [rate_limited, rate_limited, mock_response_success]
+
+    result = resolve_conflicts(sample_recorded_entities, sample_new_recorded_entities)
+
+    assert len(result) == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
+@pytest.mark.unit
+@patch("altk_evolve.utils.utils.time.sleep")
+@patch("altk_evolve.llm.conflict_resolution.conflict_resolution.completion")
+def test_resolve_conflicts_does_not_retry_rejected_requests(
+    mock_completion,
+    mock_sleep,
+    sample_recorded_entities,
+    sample_new_recorded_entities,
+):
+    """A provider error a retry cannot fix (here: bad credentials) fails on the first attempt."""
+    mock_completion.side_effect = litellm.AuthenticationError("bad key", llm_provider="openai", model="gpt-4o")
+
+    with pytest.raises(EvolveException, match="the LLM provider rejected the request"):
+        resolve_conflicts(sample_recorded_entities, sample_new_recorded_entities)
+
+    assert mock_completion.call_count == 1
+    mock_sleep.assert_not_called()
+
+
 @pytest.mark.unit
 @patch("altk_evolve.llm.conflict_resolution.conflict_resolution.completion")
 def test_resolve_conflicts_edge_cases(
@@ -529,3 +596,41 @@ def test_resolve_conflicts_update_unions_generation_methods(mock_completion):
     assert result[0].metadata.get("generation_method") == "regular"
     assert "generation_methods" not in result[0].metadata
     assert result[0].metadata.get("category") == "style"
+
+
+@pytest.mark.unit
+@patch("altk_evolve.llm.conflict_resolution.conflict_resolution.completion")
+def test_resolve_conflicts_reuses_cached_verdict_for_identical_prompt(
+    mock_completion, monkeypatch, sample_recorded_entities, sample_new_recorded_entities, mock_llm_response_add
+):
+    """An identical prompt within the TTL reuses the verdict; metadata is still threaded per call."""
+    monkeypatch.setattr(llm_settings, "conflict_resolution_cache_ttl", 300.0)
+    mock_response = Mock()
+    mock_response.choices = [Mock()]
+    mock_response.choices[0].message.content = mock_llm_response_add
+    mock_completion.return_value = mock_response
+
+    first = resolve_conflicts(sample_recorded_entities, sample_new_recorded_entities)
+    retagged = [entity.model_copy(update={"metadata": {"run": 2}}) for entity in sample_new_recorded_entities]
+    second = resolve_conflicts(sample_recorded_entities, retagged)
+
+    assert mock_completion.call_count == 1
+    assert [u.id for u in second] == [u.id for u in first]
+    assert all(u.metadata == {"run": 2} for u in second if u.event == "ADD")
+    assert second[0] is not first[0]
+
+
+@pytest.mark.unit
+@patch("altk_evolve.llm.conflict_resolution.conflict_resolution.completion")
+def test_resolve_conflicts_cache_disabled_with_zero_ttl(
+    mock_completion, monkeypatch, sample_recorded_entities, sample_new_recorded_entities, mock_llm_response_add
+):
+    mock_response = Mock()
+    mock_response.choices = [Mock()]
+    mock_response.choices[0].message.content = mock_llm_response_add
+    mock_completion.return_value = mock_response
+
+    resolve_conflicts(sample_recorded_entities, sample_new_recorded_entities)
+    resolve_conflicts(sample_recorded_entities, sample_new_recorded_entities)
+
+    assert mock_completion.call_count == 2
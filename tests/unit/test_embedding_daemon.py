@@ -0,0 +1,148 @@
+"""Tests for the embedding daemon client/server round trip."""
+
+import asyncio
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient, _serve, default_socket_path
+from altk_evolve.schema.exceptions import EvolveException
+
+
+class FakeModel:
+    def get_sentence_embedding_dimension(self):
+        return 4
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=False):
+        if "boom" in texts:
+            raise RuntimeError("boom")
+        return np.array([[len(t), 1.0, 2.0, 3.0] for t in texts], dtype=np.float64)
+
+
+@contextmanager
+def running_daemon(socket_path, **serve_kwargs):
+    """Run ``_serve`` on its own event loop in a background thread."""
+    loop = asyncio.new_event_loop()
+    task = loop.create_task(_serve(FakeModel(), socket_path, **serve_kwargs))
+
+    def run():
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    try:
+        yield thread
+    finally:
+        if not task.done():
+            loop.call_soon_threadsafe(task.cancel)
+        thread.join(timeout=5)
+        loop.close()
+
+
+@pytest.fixture
+def daemon_socket(tmp_path):
+    socket_path = tmp_path / "embed.sock"
+    with running_daemon(socket_path):
+        yield socket_path
+
+
+@pytest.mark.unit
+class TestEmbeddingDaemon:
+    def test_encode_single_string_returns_vector(self, daemon_socket):
+        client = EmbeddingDaemonClient("fake-model", socket_path=daemon_socket, spawn=False)
+        embedding = client.encode("hello")
+        assert embedding.dtype == np.float32
+        assert embedding.tolist() == [5.0, 1.0, 2.0, 3.0]
+
+    def test_encode_list_returns_matrix(self, daemon_socket):
+        client = EmbeddingDaemonClient("fake-model", socket_path=daemon_socket, spawn=False)
+        embeddings = client.encode(["a", "abc"])
+        assert embeddings.shape == (2, 4)
+        assert embeddings[:, 0].tolist() == [1.0, 3.0]
+
+    def test_dimension(self, daemon_socket):
+        client = EmbeddingDaemonClient("fake-model", socket_path=daemon_socket, spawn=False)
+        assert client.get_sentence_embedding_dimension() == 4
+
+    def test_server_errors_are_raised(self, daemon_socket):
+        client = EmbeddingDaemonClient("fake-model", socket_path=daemon_socket, spawn=False)
+        with pytest.raises(EvolveException, match="boom"):
+            client.encode(["boom"])
+        # The daemon keeps serving after a failed request.
+        assert client.encode("ok").shape == (4,)
+
+    def test_missing_daemon_without_spawn_raises(self, tmp_path):
+        client = EmbeddingDaemonClient("fake-model", socket_path=tmp_path / "missing.sock", spawn=False)
+        with pytest.raises(EvolveException, match="not running"):
+            client.encode("hello")
+
+    def test_default_socket_path_is_per_model(self):
+        assert default_socket_path("model-a") != default_socket_path("model-b")
+        assert default_socket_path("model-a").suffix == ".sock"
+
+    def test_stop_request_shuts_down_daemon(self, tmp_path):
+        socket_path = tmp_path / "embed.sock"
+        with running_daemon(socket_path) as thread:
+            client = EmbeddingDaemonClient("fake-model", socket_path=socket_path, spawn=False)
+            assert client.stop() is True
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+        assert not socket_path.exists()
+        assert client.stop() is False
+
+    def test_daemon_exits_after_idle_timeout(self, tmp_path):
+        socket_path = tmp_path / "embed.sock"
+        with running_daemon(socket_path, idle_timeout=0.2) as thread:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+        assert not socket_path.exists()
+
+    def test_second_daemon_leaves_live_socket_alone(self, daemon_socket):
+        asyncio.run(_serve(FakeModel(), daemon_socket))
+        client = EmbeddingDaemonClient("fake-model", socket_path=daemon_socket, spawn=False)
+        assert client.encode("still up").shape == (4,)
+
+    def test_spawn_failure_raises_with_exit_code(self, tmp_path, monkeypatch):
+        process = MagicMock()
+        process.poll.return_value = 1
+        popen = MagicMock(return_value=process)
+        monkeypatch.setattr("altk_evolve.backend.embedding_daemon.subprocess.Popen", popen)
+        client = EmbeddingDaemonClient("fake-model", socket_path=tmp_path / "embed.sock", startup_timeout=30)
+
+        with pytest.raises(EvolveException, match="exited with code 1") as exc_info:
+            client.encode("hello")
+
+        assert str(client.log_path) in str(exc_info.value)
+        assert client.log_path.exists()
+        popen.assert_called_once()
+        command = popen.call_args.args[0]
+        assert command[-5:] == ["daemon", "--model", "fake-model", "--socket", str(tmp_path / "embed.sock")]
+
+    def test_spawns_daemon_on_first_use(self, tmp_path, monkeypatch):
+        socket_path = tmp_path / "embed.sock"
+        with ExitStack() as stack:
+
+            def fake_popen(*args, **kwargs):
+                stack.enter_context(running_daemon(socket_path))
+                process = MagicMock()
+                process.poll.return_value = None
+                return process
+
+            popen = MagicMock(side_effect=fake_popen)
+            monkeypatch.setattr("altk_evolve.backend.embedding_daemon.subprocess.Popen", popen)
+            client = EmbeddingDaemonClient("fake-model", socket_path=socket_path)
+
+            assert client.encode("hello").tolist() == [5.0, 1.0, 2.0, 3.0]
+            assert client.encode("again").shape == (4,)
+            popen.assert_called_once()
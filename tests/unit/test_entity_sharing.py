@@ -1,10 +1,12 @@
 """Tests for Phase 1A + 1B entity sharing: visibility, publish, unpublish, get_public."""
 
 import json
+import threading
 import pytest
+from concurrent.futures import Future
 from unittest.mock import patch
 
-from altk_evolve.frontend.mcp.mcp_server import create_entity, publish_entity, unpublish_entity, get_entities
+from altk_evolve.frontend.mcp.mcp_server import create_entity, create_entities_bulk, publish_entity, unpublish_entity, get_entities
 from altk_evolve.schema.conflict_resolution import EntityUpdate
 from altk_evolve.schema.core import RecordedEntity
 import datetime
@@ -58,6 +60,35 @@ def test_create_entity_no_owner_id_omitted(mock_get_client):
 # ── publish_entity ─────────────────────────────────────────────────────────────
 
 
+def test_create_entities_bulk_writes_once(mock_get_client):
+    mock_get_client.update_entities.return_value = [
+        EntityUpdate(id="1", type="guideline", content="a", event="ADD", metadata={"visibility": "private"}),
+        EntityUpdate(id="2", type="note", content="b", event="ADD", metadata={"visibility": "public", "owner_id": "alice"}),
+    ]
+    items = [
+        {"content": "a", "entity_type": "guideline", "metadata": {"visibility": "public", "source": "x"}},
+        {"content": "b", "entity_type": "note", "visibility": "public", "owner_id": "alice"},
+    ]
+
+    result = json.loads(create_entities_bulk(items=json.dumps(items)))
+
+    mock_get_client.update_entities.assert_called_once()
+    entities = mock_get_client.update_entities.call_args[1]["entities"]
+    assert entities[0].metadata == {"source": "x", "creation_mode": "manual", "visibility": "private"}
+    assert entities[1].metadata["owner_id"] == "alice"
+    assert [update["id"] for update in result] == ["1", "2"]
+
+
+def test_create_entities_bulk_rejects_whole_batch_on_invalid_item(mock_get_client):
+    items = [{"content": "a", "entity_type": "guideline"}, {"content": "b", "entity_type": "note", "visibility": "public"}]
+
+    result = json.loads(create_entities_bulk(items=json.dumps(items)))
+
+    assert result["error"] == "Missing owner_id"
+    assert result["index"] == 1
+    mock_get_client.update_entities.assert_not_called()
+
+
 def _make_entity(entity_id="42", visibility="private", owner_id=None):
     meta = {"visibility": visibility}
     if owner_id:
@@ -151,6 +182,18 @@ def test_get_entities_include_public_annotates_results(mock_get_client):
     mock_get_client.get_public_entities.assert_called_once()
 
 
+def test_get_entities_response_format(mock_get_client):
+    mock_get_client.search_entities.return_value = [_make_entity(entity_id="1"), _make_entity(entity_id="2")]
+    mock_get_client.get_public_entities.return_value = [_make_entity(entity_id="3", visibility="public", owner_id="bob")]
+
+    assert get_entities(task="deploy", include_public=True) == (
+        "# Guidelines for: deploy\n\n1. tip content\n2. tip content\n3. [public: bob] tip content"
+    )
+
+    mock_get_client.search_entities.return_value = []
+    assert get_entities(task="deploy") == "# Guidelines for: deploy\n"
+
+
 def test_get_entities_no_include_public_skips_cross_namespace(mock_get_client):
     mock_get_client.search_entities.return_value = []
 
@@ -159,6 +202,39 @@ def test_get_entities_no_include_public_skips_cross_namespace(mock_get_client):
     mock_get_client.get_public_entities.assert_not_called()
 
 
+def test_get_entities_runs_public_search_alongside_private(mock_get_client):
+    public_started = threading.Event()
+
+    def private_search(**kwargs):
+        # Only returns if the public search is already running in parallel.
+        assert public_started.wait(timeout=5)
+        return []
+
+    def public_search(**kwargs):
+        public_started.set()
+        return [_make_entity(entity_id="2", visibility="public", owner_id="bob")]
+
+    mock_get_client.search_entities.side_effect = private_search
+    mock_get_client.get_public_entities.side_effect = public_search
+
+    result = get_entities(task="some task", include_public=True)
+
+    assert "[public: bob]" in result
+
+
+def test_get_entities_cancels_public_search_when_private_fails(mock_get_client):
+    pending = Future()
+    mock_get_client.search_entities.side_effect = RuntimeError("backend down")
+
+    with (
+        patch("altk_evolve.frontend.mcp.mcp_server._submit_background", return_value=pending),
+        pytest.raises(RuntimeError, match="backend down"),
+    ):
+        get_entities(task="some task", include_public=True)
+
+    assert pending.cancelled()
+
+
 def test_get_entities_deduplicates_public_already_in_private(mock_get_client):
     """Entity returned by both private search and public search should appear only once."""
     entity = _make_entity(entity_id="1", visibility="public", owner_id="alice")
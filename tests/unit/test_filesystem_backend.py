@@ -1,4 +1,5 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -6,6 +7,9 @@ from altk_evolve.backend.filesystem import FilesystemEntityBackend
 from altk_evolve.config.evolve import EvolveConfig
 from altk_evolve.config.filesystem import FilesystemSettings
 from altk_evolve.frontend.client.evolve_client import EvolveClient
+from altk_evolve.schema.conflict_resolution import EntityUpdate
+from altk_evolve.schema.core import Entity
+from altk_evolve.schema.exceptions import EvolveException
 
 
 @pytest.fixture
@@ -67,3 +71,140 @@ def test_save_tolerates_stale_shared_tmp(backend: FilesystemEntityBackend, tmp_p
 
     target = tmp_path / "ns_busy.json"
     assert target.exists() and target.stat().st_size > 0
+
+
+@pytest.mark.unit
+def test_update_entities_hands_temporary_records_to_conflict_resolution(backend: FilesystemEntityBackend):
+    backend.create_namespace("ns")
+    seen = []
+
+    def fake_resolve_conflicts(old_entities, new_entities):
+        seen.extend(new_entities)
+        return [EntityUpdate(id=e.id, type=e.type, content=e.content, event="ADD", metadata=e.metadata) for e in new_entities]
+
+    with patch("altk_evolve.llm.conflict_resolution.conflict_resolution.resolve_conflicts", fake_resolve_conflicts):
+        updates = backend.update_entities(
+            "ns",
+            [Entity(content="a", type="note"), Entity(content={"k": "v"}, type="note", metadata={"m": 1})],
+            enable_conflict_resolution=True,
+        )
+
+    assert [e.id for e in seen] == ["Unprocessed_Entity_0", "Unprocessed_Entity_1"]
+    assert [e.metadata for e in seen] == [{}, {"m": 1}]
+    assert [u.content for u in updates] == ["a", {"k": "v"}]
+    assert all(not u.id.startswith("Unprocessed_Entity_") for u in updates)
+
+
+@pytest.mark.unit
+def test_update_entities_rejects_mixed_types(backend: FilesystemEntityBackend):
+    backend.create_namespace("ns")
+
+    with pytest.raises(EvolveException, match="All entities must have the same type"):
+        backend.update_entities(
+            "ns", [Entity(content="a", type="note"), Entity(content="b", type="fact")], enable_conflict_resolution=False
+        )
+
+
+@pytest.mark.unit
+def test_update_entities_single_entity_without_neighbours_skips_conflict_resolution(backend: FilesystemEntityBackend):
+    backend.create_namespace("ns")
+
+    with patch("altk_evolve.llm.conflict_resolution.conflict_resolution.resolve_conflicts") as resolve:
+        updates = backend.update_entities("ns", [Entity(content="first", type="note", metadata={"m": 1})], enable_conflict_resolution=True)
+
+    resolve.assert_not_called()
+    assert [(u.event, u.content, u.metadata) for u in updates] == [("ADD", "first", {"m": 1})]
+    assert [e.content for e in backend.search_entities("ns", limit=10)] == ["first"]
+
+
+@pytest.mark.unit
+def test_get_all_entities_id_in(client: EvolveClient):
+    client.create_namespace("ns")
+    ids = [
+        u.id
+        for u in client.update_entities("ns", [Entity(type="fact", content=f"f{i}") for i in range(4)], enable_conflict_resolution=False)
+    ]
+
+    selected = client.get_all_entities("ns", id_in=[ids[1], ids[3], "missing"])
+
+    assert sorted(e.id for e in selected) == sorted([ids[1], ids[3]])
+    assert client.get_all_entities("ns", id_in=[]) == []
+    assert [e.id for e in client.iter_all_entities("ns", id_in=[ids[0]])] == [ids[0]]
+
+
+@pytest.mark.unit
+def test_update_entities_exact_duplicate_skips_conflict_resolution(backend: FilesystemEntityBackend):
+    backend.create_namespace("ns")
+    (stored,) = backend.update_entities("ns", [Entity(content="keep tests green", type="note")], enable_conflict_resolution=False)
+
+    with patch("altk_evolve.llm.conflict_resolution.conflict_resolution.resolve_conflicts") as resolve:
+        updates = backend.update_entities("ns", [Entity(content="keep tests green", type="note")], enable_conflict_resolution=True)
+
+    resolve.assert_not_called()
+    assert [(u.id, u.event) for u in updates] == [(stored.id, "NONE")]
+    assert len(backend.search_entities("ns", limit=10)) == 1
+
+
+@pytest.mark.unit
+def test_update_entities_sends_only_non_duplicates_to_conflict_resolution(backend: FilesystemEntityBackend):
+    backend.create_namespace("ns")
+    backend.update_entities("ns", [Entity(content="keep tests green", type="note")], enable_conflict_resolution=False)
+    seen = []
+
+    def fake_resolve_conflicts(old_entities, new_entities):
+        seen.extend(new_entities)
+        return [EntityUpdate(id=e.id, type=e.type, content=e.content, event="ADD", metadata=e.metadata) for e in new_entities]
+
+    with patch("altk_evolve.llm.conflict_resolution.conflict_resolution.resolve_conflicts", fake_resolve_conflicts):
+        updates = backend.update_entities(
+            "ns",
+            [Entity(content="keep tests green", type="note"), Entity(content="keep tests green and fast", type="note")],
+            enable_conflict_resolution=True,
+        )
+
+    assert [e.content for e in seen] == ["keep tests green and fast"]
+    assert [u.event for u in updates] == ["NONE", "ADD"]
+
+
+@pytest.mark.unit
+def test_get_entities_batch_skips_missing_namespaces(client: EvolveClient):
+    for namespace_id, count in (("a", 3), ("b", 1)):
+        client.create_namespace(namespace_id)
+        client.update_entities(
+            namespace_id, [Entity(type="fact", content=f"{namespace_id}{i}") for i in range(count)], enable_conflict_resolution=False
+        )
+
+    batch = client.get_entities_batch(["b", "missing", "a"], limit_per=2)
+
+    assert list(batch) == ["b", "a"]
+    assert [e.content for e in batch["b"]] == ["b0"]
+    assert len(batch["a"]) == 2
+    assert client.get_entities_batch([]) == {}
+
+
+@pytest.mark.unit
+def test_all_namespaces_lite_returns_ids_and_counts(client: EvolveClient):
+    for namespace_id, count in (("a", 2), ("b", 0)):
+        client.create_namespace(namespace_id)
+        client.update_entities(
+            namespace_id, [Entity(type="fact", content=f"{namespace_id}{i}") for i in range(count)], enable_conflict_resolution=False
+        )
+
+    assert sorted(client.all_namespaces_lite(limit=10)) == [("a", 2), ("b", 0)]
+    assert sorted(client.all_namespaces_lite(limit=10)) == sorted((ns.id, ns.num_entities) for ns in client.all_namespaces(limit=10))
+    assert len(client.all_namespaces_lite(limit=1)) == 1
+
+
+@pytest.mark.unit
+def test_delete_entities_by_ids_ignores_missing_ids(client: EvolveClient):
+    client.create_namespace("ns")
+    ids = [
+        u.id
+        for u in client.update_entities("ns", [Entity(type="fact", content=f"f{i}") for i in range(3)], enable_conflict_resolution=False)
+    ]
+
+    assert client.delete_entities_by_ids("ns", [ids[0], "missing", ids[2]]) == [ids[0], "missing", ids[2]]
+
+    assert [e.id for e in client.get_all_entities("ns")] == [ids[1]]
+    assert client.get_namespace_details("ns").num_entities == 1
+    assert client.delete_entities_by_ids("ns", []) == []
@@ -5,8 +5,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from altk_evolve.llm import response_cache
 from altk_evolve.llm.guidelines import guidelines as guidelines_module
 from altk_evolve.llm.guidelines.guidelines import generate_guidelines, parse_openai_agents_trajectory
+from altk_evolve.utils.utils import clean_llm_response
 
 
 def _mock_completion_response(payload: dict) -> MagicMock:
@@ -36,8 +38,8 @@ class TestParseOpenaiAgentsTrajectory:
         assert result["task_instruction"] == "Task description unknown"
 
     @patch("altk_evolve.llm.guidelines.guidelines.completion")
-    @patch("altk_evolve.llm.guidelines.guidelines.supports_response_schema", return_value=True)
-    @patch("altk_evolve.llm.guidelines.guidelines.get_supported_openai_params", return_value=["response_format"])
+    @patch("litellm.supports_response_schema", return_value=True)
+    @patch("litellm.get_supported_openai_params", return_value=["response_format"])
     def test_generate_guidelines_uses_json_prompt_for_groq_even_when_schema_is_reported(
         self,
         _mock_params,
@@ -69,3 +71,61 @@ class TestParseOpenaiAgentsTrajectory:
         assert "response_format" not in kwargs
         assert kwargs["custom_llm_provider"] == "groq"
         assert "Output Format (JSON)" in kwargs["messages"][0]["content"]
+
+    @patch("altk_evolve.llm.guidelines.guidelines.completion")
+    @patch("litellm.supports_response_schema", return_value=False)
+    @patch("litellm.get_supported_openai_params", return_value=[])
+    def test_generate_guidelines_reuses_cached_response_for_identical_prompt(
+        self,
+        _mock_params,
+        _mock_schema,
+        mock_completion,
+        monkeypatch,
+        tmp_path,
+    ):
+        monkeypatch.setattr(guidelines_module.llm_settings, "llm_cache_path", str(tmp_path / "llm.sqlite"))
+        monkeypatch.setattr(guidelines_module.evolve_config, "segmentation_enabled", False)
+        mock_completion.return_value = _mock_completion_response(
+            {
+                "guidelines": [
+                    {
+                        "content": "Validate files before parsing",
+                        "rationale": "Avoids parser crashes on empty inputs",
+                        "category": "strategy",
+                        "trigger": "Before reading user-provided CSV files",
+                    }
+                ]
+            }
+        )
+        trajectory = [{"role": "user", "content": "Fix CSV parsing"}]
+
+        try:
+            first = generate_guidelines(trajectory)
+            second = generate_guidelines(trajectory)
+            generate_guidelines([{"role": "user", "content": "Fix JSON parsing"}])
+        finally:
+            response_cache.close()
+
+        assert first[0].guidelines == second[0].guidelines
+        assert mock_completion.call_count == 2
+
+
+@pytest.mark.unit
+class TestCleanLlmResponse:
+    def test_returns_body_of_leading_code_block(self):
+        assert clean_llm_response('  ```json\n{"a": 1}\n```\nTrailing remarks') == '{"a": 1}'
+
+    def test_code_block_ends_at_first_line_closing_fence(self):
+        assert clean_llm_response("```\nx = '```inline'\n````\ny\n```") == "x = '```inline'\n````\ny"
+
+    def test_removes_reasoning_blocks(self):
+        response = '<thinking>plan</thinking>{"a": 1}<reflection>ok</think> <think>more</think>'
+        assert clean_llm_response(response) == '{"a": 1}'
+
+    def test_keeps_unclosed_reasoning_block(self):
+        assert clean_llm_response('{"a": 1} <think>unfinished') == '{"a": 1} <think>unfinished'
+
+    def test_unclosed_openers_are_linear(self):
+        # A backtracking regex would be quadratic here.
+        response = "<think>" * 200_000 + "{}"
+        assert clean_llm_response(response) == response
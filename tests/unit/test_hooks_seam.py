@@ -247,6 +247,8 @@ def test_pre_write_fires_and_transform_applies(client: EvolveClient):
 def test_pre_write_transform_runs_before_conflict_resolution(client: EvolveClient):
     enable_hooks(UppercaseWriter())
     client.create_namespace("ns")
+    # A stored neighbour, so the single-entity write goes through conflict resolution.
+    _write(client, "ns", "existing note")
     seen: list[str] = []
 
     def fake_resolve_conflicts(old_entities, new_entities):
@@ -663,6 +665,24 @@ def test_legal_hold_on_external_delete_raises_and_preserves_entity(client: Evolv
     assert client.get_entity_by_id("ns", other.id) is None
 
 
+@pytest.mark.unit
+def test_legal_hold_veto_skips_only_that_entity_in_a_batch_delete(client: EvolveClient, caplog):
+    enable_hooks(LegalHold())
+    client.create_namespace("ns")
+    _write(client, "ns", "keep me", {"legal_hold": True})
+    _write(client, "ns", "expendable")
+    held = client.search_entities("ns", query="keep me", limit=1)[0]
+    other = client.search_entities("ns", query="expendable", limit=1)[0]
+
+    with caplog.at_level(logging.WARNING, logger="entities-db"):
+        deleted = client.delete_entities_by_ids("ns", [held.id, other.id])
+
+    assert deleted == [other.id]
+    assert client.get_entity_by_id("ns", held.id) is not None
+    assert client.get_entity_by_id("ns", other.id) is None
+    assert held.id in caplog.text
+
+
 @pytest.mark.unit
 def test_external_delete_payload_carries_fetched_metadata(client: EvolveClient):
     from altk_evolve.schema.exceptions import EvolveException
@@ -931,7 +951,15 @@ def test_backend_subclass_override_cannot_bypass_hooks(tmp_path: Path):
 
 @pytest.mark.unit
 def test_backends_do_not_override_public_template_methods():
-    template_methods = ("search_entities", "delete_entity_by_id", "_guarded_delete", "delete_namespace", "update_entity_metadata")
+    template_methods = (
+        "search_entities",
+        "delete_entity_by_id",
+        "delete_entities_by_ids",
+        "_guarded_delete",
+        "delete_namespace",
+        "update_entity_metadata",
+        "get_entities_batch",
+    )
     backend_classes = [FilesystemEntityBackend]
     try:
         from altk_evolve.backend.milvus import MilvusEntityBackend
@@ -1039,8 +1067,8 @@ def test_llm_pre_call_fires_at_guideline_combination_call_site():
     response.choices = [Mock(message=Mock(content=json.dumps({"guidelines": []})))]
     with (
         patch.object(clustering, "completion", return_value=response) as mock_completion,
-        patch.object(clustering, "get_supported_openai_params", return_value=[]),
-        patch.object(clustering, "supports_response_schema", return_value=False),
+        patch("litellm.get_supported_openai_params", return_value=[]),
+        patch("litellm.supports_response_schema", return_value=False),
     ):
         clustering.combine_cluster([_tagged_recorded_entity("1", "a"), _tagged_recorded_entity("2", "b")])
 
@@ -1057,8 +1085,8 @@ def test_llm_pre_call_fires_at_segmentation_call_site():
     response.choices = [Mock(message=Mock(content=json.dumps({"subtasks": []})))]
     with (
         patch.object(segmentation, "completion", return_value=response) as mock_completion,
-        patch.object(segmentation, "get_supported_openai_params", return_value=[]),
-        patch.object(segmentation, "supports_response_schema", return_value=False),
+        patch("litellm.get_supported_openai_params", return_value=[]),
+        patch("litellm.supports_response_schema", return_value=False),
     ):
         segmentation.segment_trajectory([{"role": "user", "content": "do"}, {"role": "assistant", "content": "done"}])
 
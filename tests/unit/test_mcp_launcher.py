@@ -1,3 +1,5 @@
+import asyncio
+import sys
 import tomllib
 from pathlib import Path
 
@@ -15,48 +17,61 @@ def test_pyproject_exports_mcp_launcher_script() -> None:
     assert parsed["project"]["scripts"]["evolve-mcp"] == "altk_evolve.frontend.mcp.__main__:main"
 
 
-def test_stdio_launcher_starts_ui_thread(monkeypatch) -> None:
-    thread_calls: list[tuple[object, bool]] = []
-    run_calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+def test_stdio_launcher_runs_mcp_and_ui_on_one_loop(monkeypatch) -> None:
+    events: list[str] = []
 
-    class FakeThread:
-        def __init__(self, target, daemon):
-            thread_calls.append((target, daemon))
+    async def fake_serve(self) -> None:
+        events.append("ui started")
+        while not self.should_exit:
+            await asyncio.sleep(0)
+        events.append("ui stopped")
 
-        def start(self) -> None:
-            thread_calls.append(("started", True))
+    async def fake_run_async(*args, **kwargs) -> None:
+        await asyncio.sleep(0)
+        events.append("mcp done")
 
-    monkeypatch.setattr(launcher.threading, "Thread", FakeThread)
-    monkeypatch.setattr(launcher.mcp, "run", lambda *args, **kwargs: run_calls.append((args, kwargs)))
+    monkeypatch.setattr(launcher.uvicorn.Server, "serve", fake_serve)
+    monkeypatch.setattr(launcher.mcp, "run_async", fake_run_async)
     monkeypatch.setattr(launcher.sys, "argv", ["evolve-mcp"])
 
     launcher.main()
 
-    assert thread_calls[0] == (launcher.run_api_server, True)
-    assert thread_calls[1] == ("started", True)
-    assert run_calls == [((), {})]
+    assert events == ["ui started", "mcp done", "ui stopped"]
 
 
-def test_sse_launcher_skips_ui_thread(monkeypatch) -> None:
-    thread_called = False
-    sse_calls: list[tuple[str, int]] = []
+def test_stdio_launcher_survives_ui_startup_failure(monkeypatch) -> None:
+    mcp_calls: list[bool] = []
+
+    async def failing_serve(self) -> None:
+        sys.exit(1)
+
+    async def fake_run_async(*args, **kwargs) -> None:
+        await asyncio.sleep(0)
+        mcp_calls.append(True)
+
+    monkeypatch.setattr(launcher.uvicorn.Server, "serve", failing_serve)
+    monkeypatch.setattr(launcher.mcp, "run_async", fake_run_async)
 
-    class FakeThread:
-        def __init__(self, target, daemon):
-            nonlocal thread_called
-            thread_called = True
+    asyncio.run(launcher.run_stdio_server())
+
+    assert mcp_calls == [True]
+
+
+def test_sse_launcher_skips_stdio_server(monkeypatch) -> None:
+    stdio_called = False
+    sse_calls: list[tuple[str, int]] = []
 
-        def start(self) -> None:
-            nonlocal thread_called
-            thread_called = True
+    async def fake_run_stdio_server() -> None:
+        nonlocal stdio_called
+        stdio_called = True
 
-    monkeypatch.setattr(launcher.threading, "Thread", FakeThread)
+    monkeypatch.setattr(launcher, "run_stdio_server", fake_run_stdio_server)
     monkeypatch.setattr(launcher, "run_sse_server", lambda host, port: sse_calls.append((host, port)))
     monkeypatch.setattr(launcher.sys, "argv", ["evolve-mcp", "--transport", "sse", "--host", "0.0.0.0", "--port", "9300"])
 
     launcher.main()
 
-    assert thread_called is False
+    assert stdio_called is False
     assert sse_calls == [("0.0.0.0", 9300)]
 
 
@@ -1,6 +1,10 @@
+import contextvars
 import datetime
 import json
+import threading
 import uuid
+from concurrent.futures import Future
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -57,6 +61,22 @@ def test_save_trajectory_metadata_injection(mock_get_client):
         assert guideline_entity.metadata["creation_mode"] == "auto-mcp"
 
 
+def test_save_trajectory_does_not_duplicate_message_text_in_metadata(mock_get_client):
+    tool_call = {"id": "call_1", "type": "function", "function": {"name": "search", "arguments": "{}"}}
+    messages = [
+        {"role": "assistant", "content": "Searching now.", "tool_calls": [tool_call]},
+        {"role": "user", "content": [{"type": "text", "text": "hi"}]},
+    ]
+    with patch("altk_evolve.frontend.mcp.mcp_server.generate_guidelines", return_value=[]):
+        save_trajectory(trajectory_data=json.dumps(messages), task_id="task-slim")
+
+    text_entity, structured_entity = mock_get_client.update_entities.call_args_list[0][1]["entities"]
+    assert text_entity.metadata["message"] == {"role": "assistant", "tool_calls": [tool_call]}
+    assert {**text_entity.metadata["message"], "content": text_entity.content} == messages[0]
+    # Non-string content is stored stringified, so the original message is kept whole.
+    assert structured_entity.metadata["message"] == messages[1]
+
+
 def test_create_entity_metadata_injection_manual_guideline(mock_get_client):
     mock_update = EntityUpdate(id="123", type="guideline", content="docstrings", event="ADD", metadata={"creation_mode": "manual"})
     mock_get_client.update_entities.return_value = [mock_update]
@@ -135,6 +155,19 @@ def test_get_client_uses_idempotent_namespace_bootstrap(monkeypatch):
         mcp_server_module._initialized_namespaces.update(original_namespaces)
 
 
+def test_get_client_skips_the_lock_once_initialized(monkeypatch):
+    fake_client = MagicMock()
+    lock = MagicMock()
+    monkeypatch.setattr(mcp_server_module, "_client", fake_client)
+    monkeypatch.setattr(mcp_server_module, "_initialized_namespaces", {mcp_server_module.evolve_config.namespace_id})
+    monkeypatch.setattr(mcp_server_module, "_client_init_lock", lock)
+
+    assert mcp_server_module.get_client() is fake_client
+
+    lock.__enter__.assert_not_called()
+    fake_client.ensure_namespace.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Multi-user / multi-namespace tests
 # ---------------------------------------------------------------------------
@@ -286,6 +319,69 @@ def _mock_guideline_result(content="Write clear code."):
     return GuidelineGenerationResult(guidelines=[g], task_description="some task")
 
 
+def test_save_trajectory_writes_trajectory_while_generating_guidelines(mock_get_client):
+    """The trajectory write overlaps guideline generation but still lands before the guideline write."""
+    generating = threading.Event()
+
+    def update_entities(namespace_id, entities, enable_conflict_resolution):
+        if entities[0].type == "trajectory":
+            # Only returns if guideline generation is running at the same time.
+            assert generating.wait(timeout=5)
+        return []
+
+    def generate(messages):
+        generating.set()
+        return [_mock_guideline_result()]
+
+    mock_get_client.update_entities.side_effect = update_entities
+    with patch("altk_evolve.frontend.mcp.mcp_server.generate_guidelines", side_effect=generate):
+        save_trajectory(trajectory_data=json.dumps([{"role": "user", "content": "hi"}]), task_id="task-overlap")
+
+    written = [c.kwargs["entities"][0].type for c in mock_get_client.update_entities.call_args_list]
+    assert written == ["trajectory", "guideline"]
+
+
+def test_save_trajectory_failed_write_skips_guideline_generation(mock_get_client):
+    """A trajectory write that has already failed is raised before any guideline LLM call."""
+
+    def submit_now(fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    mock_get_client.update_entities.side_effect = RuntimeError("disk full")
+    with (
+        patch("altk_evolve.frontend.mcp.mcp_server._submit_background", side_effect=submit_now),
+        patch("altk_evolve.frontend.mcp.mcp_server.generate_guidelines") as mock_gen,
+        pytest.raises(RuntimeError, match="disk full"),
+    ):
+        save_trajectory(trajectory_data=json.dumps([{"role": "user", "content": "hi"}]), task_id="task-fail")
+
+    mock_gen.assert_not_called()
+
+
+def test_save_trajectory_write_sees_caller_contextvars(mock_get_client):
+    request_id = contextvars.ContextVar("request_id", default=None)
+    seen = []
+
+    def update_entities(namespace_id, entities, enable_conflict_resolution):
+        seen.append((entities[0].type, request_id.get()))
+        return []
+
+    mock_get_client.update_entities.side_effect = update_entities
+    token = request_id.set("req-1")
+    try:
+        with patch("altk_evolve.frontend.mcp.mcp_server.generate_guidelines", return_value=[]):
+            save_trajectory(trajectory_data=json.dumps([{"role": "user", "content": "hi"}]), task_id="task-ctx")
+    finally:
+        request_id.reset(token)
+
+    assert seen == [("trajectory", "req-1")]
+
+
 def test_save_trajectory_regular_mode_default(mock_get_client):
     """Default guidelines_mode='regular' calls generate_guidelines and tags generation_method."""
     with patch("altk_evolve.frontend.mcp.mcp_server.generate_guidelines") as mock_gen:
@@ -345,6 +441,24 @@ def test_save_trajectory_both_mode_calls_both_pipelines(mock_get_client):
         assert methods == {"regular", "consistency"}
 
 
+def test_save_trajectory_generates_guidelines_under_the_concurrency_cap(mock_get_client):
+    slots = threading.BoundedSemaphore(1)
+
+    def generate(messages):
+        # The single slot is held for the duration of the LLM call.
+        assert not slots.acquire(blocking=False)
+        return [_mock_guideline_result()]
+
+    with (
+        patch("altk_evolve.frontend.mcp.mcp_server._guideline_generation_slots", slots),
+        patch("altk_evolve.frontend.mcp.mcp_server.generate_guidelines", side_effect=generate) as mock_gen,
+    ):
+        save_trajectory(trajectory_data=json.dumps([{"role": "user", "content": "hi"}]), task_id="task-cap")
+
+    mock_gen.assert_called_once()
+    assert slots.acquire(blocking=False)
+
+
 def test_save_trajectory_both_mode_merges_into_single_update_entities_call(mock_get_client):
     """Both pipelines' entities are merged and sent in a single update_entities call."""
     with (
@@ -507,3 +621,100 @@ def test_retrieve_user_facts_empty_when_limit_not_positive(mock_get_client):
     assert result["matched_count"] == 0
     assert result["categories"] == {}
     mock_get_client.search_entities.assert_not_called()
+
+
+def test_api_responses_are_gzipped():
+    from fastapi.testclient import TestClient
+
+    from altk_evolve.frontend.api.routes import _client_dep
+    from altk_evolve.frontend.mcp.mcp_server import app
+
+    client = MagicMock()
+    client.all_namespaces_lite.return_value = [(f"namespace_{i}", i) for i in range(200)]
+    app.dependency_overrides[_client_dep] = lambda: client
+    try:
+        response = TestClient(app).get("/api/namespaces", headers={"Accept-Encoding": "gzip"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 200
+
+
+@pytest.fixture
+def ui_client(tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<html>evolve</html>")
+    (tmp_path / "favicon.svg").write_text("<svg/>")
+    (tmp_path / "assets" / "app.js").write_text("console.log('evolve');")
+    app = FastAPI()
+    mcp_server_module._setup_ui_routes(app, str(tmp_path))
+    return TestClient(app)
+
+
+def test_spa_serves_index_with_etag_and_revalidates(ui_client):
+    first = ui_client.get("/ui/some/route")
+    assert first.status_code == 200
+    assert first.text == "<html>evolve</html>"
+    etag = first.headers["etag"]
+
+    again = ui_client.get("/ui/some/route", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    assert ui_client.get("/ui/favicon.svg").text == "<svg/>"
+
+
+def test_spa_index_is_read_once_at_setup(ui_client, tmp_path):
+    (tmp_path / "index.html").write_text("<html>rebuilt</html>")
+
+    response = ui_client.get("/ui/")
+
+    assert response.text == "<html>evolve</html>"
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_spa_path_lookups_are_cached(ui_client, tmp_path):
+    with patch("altk_evolve.frontend.mcp.mcp_server.os.path.realpath", wraps=mcp_server_module.os.path.realpath) as realpath:
+        assert ui_client.get("/ui/favicon.svg").text == "<svg/>"
+        assert ui_client.get("/ui/favicon.svg").text == "<svg/>"
+        assert ui_client.get("/ui/unknown/route").text == "<html>evolve</html>"
+        assert ui_client.get("/ui/unknown/route").text == "<html>evolve</html>"
+
+    assert realpath.call_count == 2
+
+
+def test_hashed_assets_are_cached_as_immutable(ui_client, tmp_path):
+    (tmp_path / "assets" / "index-Ab3_x9Zq.js").write_text("console.log('hashed');")
+
+    hashed = ui_client.get("/assets/index-Ab3_x9Zq.js", headers={"Accept-Encoding": "identity"})
+    assert hashed.status_code == 200
+    assert hashed.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    unhashed = ui_client.get("/assets/app.js")
+    assert "immutable" not in unhashed.headers.get("cache-control", "")
+
+
+def test_assets_are_served_precompressed(ui_client, tmp_path):
+    import gzip
+
+    gz_file = tmp_path / "assets" / "app.js.gz"
+    assert gzip.decompress(gz_file.read_bytes()) == b"console.log('evolve');"
+
+    compressed = ui_client.get("/assets/app.js", headers={"Accept-Encoding": "gzip, deflate"})
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"].startswith("text/javascript")
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.text == "console.log('evolve');"
+
+    plain = ui_client.get("/assets/app.js", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert plain.text == "console.log('evolve');"
@@ -4,9 +4,11 @@ Tests all methods with mocked Milvus client, SQLiteManager, and embedding model.
 """
 
 import datetime
+import numpy as np
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 
+from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient
 from altk_evolve.backend.milvus import MilvusEntityBackend, parse_milvus_entity
 from altk_evolve.schema.core import Entity, Namespace, RecordedEntity
 from altk_evolve.schema.conflict_resolution import EntityUpdate
@@ -16,11 +18,17 @@ from altk_evolve.schema.exceptions import NamespaceNotFoundException, EvolveExce
 @pytest.fixture(scope="module")
 def milvus_backend() -> MilvusEntityBackend:
     """Create a MilvusEntityBackend instance for testing."""
-    with patch("altk_evolve.backend.milvus.MilvusClient"), patch("altk_evolve.backend.milvus.SentenceTransformer"):
+    with patch("altk_evolve.backend.milvus.MilvusClient"), patch("sentence_transformers.SentenceTransformer"):
         backend = MilvusEntityBackend()
         return backend
 
 
+@pytest.fixture(autouse=True)
+def no_search_cache(milvus_backend, monkeypatch):
+    """The backend fixture is module-scoped and tests remock search results per query, so cached searches would leak across tests."""
+    monkeypatch.setattr(milvus_backend.search_cache, "size", 0)
+
+
 @pytest.fixture
 def db_manager():
     """Create a mock SQLiteManager for testing."""
@@ -55,10 +63,21 @@ def arbitrary_collection_stats(collection_name: str):
     return {"row_count": 42}
 
 
-def arbitrary_embedding(text: str):
+def arbitrary_embedding(text: str, **kwargs):
     return [0.1] * 384
 
 
+@pytest.mark.unit
+def test_uses_embedding_daemon_client_when_enabled(monkeypatch):
+    monkeypatch.setattr("altk_evolve.config.evolve.evolve_config.embedding_daemon", True)
+    with patch("altk_evolve.backend.milvus.MilvusClient"), patch("sentence_transformers.SentenceTransformer") as mock_transformer:
+        backend = MilvusEntityBackend()
+
+    assert isinstance(backend.embedding_model, EmbeddingDaemonClient)
+    assert backend.embedding_model.model_name == backend.config.embedding_model
+    mock_transformer.assert_not_called()
+
+
 @pytest.mark.unit
 def test_ready(milvus_backend: MilvusEntityBackend, monkeypatch):
     """Test the ready() health check method."""
@@ -91,6 +110,26 @@ def test_create_namespace(milvus_backend: MilvusEntityBackend, db_manager, monke
     assert isinstance(result.created_at, datetime.datetime)
 
 
+@pytest.mark.unit
+def test_create_namespaces_registers_batch_once(milvus_backend: MilvusEntityBackend, db_manager, monkeypatch):
+    created_collections = []
+    monkeypatch.setattr(milvus_backend.milvus, "has_collection", never_has_collection)
+    monkeypatch.setattr(
+        milvus_backend.milvus, "create_collection", lambda collection_name, **kwargs: created_collections.append(collection_name)
+    )
+    monkeypatch.setattr(milvus_backend, "_ensure_embedding_index", lambda namespace_id: None)
+    db_manager.create_namespaces = Mock(
+        side_effect=lambda ids: [Namespace(id=i, created_at=datetime.datetime.now(datetime.UTC)) for i in ids]
+    )
+
+    with patch("altk_evolve.backend.milvus.SQLiteManager", return_value=db_manager):
+        result = milvus_backend.create_namespaces(["ns_a", "ns_b"])
+
+    assert [ns.id for ns in result] == ["ns_a", "ns_b"]
+    assert created_collections == ["ns_a", "ns_b"]
+    db_manager.create_namespaces.assert_called_once_with(["ns_a", "ns_b"])
+
+
 @pytest.mark.unit
 def test_get_namespace_details(milvus_backend: MilvusEntityBackend, db_manager, monkeypatch):
     """Test retrieving namespace details."""
@@ -161,20 +200,19 @@ def test_update_entities(milvus_backend: MilvusEntityBackend, monkeypatch):
     def insert(collection_name, data):
         return {"ids": [12345]}
 
-    def resolve_conflicts(old_entities, new_entities):
-        return [entity_update]
-
     monkeypatch.setattr(milvus_backend.milvus, "has_collection", always_has_collection)
     monkeypatch.setattr(milvus_backend.milvus, "insert", insert)
     monkeypatch.setattr(milvus_backend.embedding_model, "encode", arbitrary_embedding)
     monkeypatch.setattr(milvus_backend, "_search_entities_impl", _search_entities_impl.__get__(milvus_backend, MilvusEntityBackend))
 
-    with patch("altk_evolve.llm.conflict_resolution.conflict_resolution.resolve_conflicts", resolve_conflicts):
+    with patch("altk_evolve.llm.conflict_resolution.conflict_resolution.resolve_conflicts") as resolve_conflicts:
         entities = [Entity(type=entity_update.type, content=entity_update.content, metadata={"key": "value"})]
         result = milvus_backend.update_entities(namespace_id="test_namespace", entities=entities, enable_conflict_resolution=True)
 
+    # A single entity with no stored neighbours is added without an LLM round trip.
+    resolve_conflicts.assert_not_called()
     assert len(result) == 1
-    assert result[0] == entity_update
+    assert result[0] == entity_update.model_copy(update={"metadata": {"key": "value"}})
 
 
 @pytest.mark.unit
@@ -250,6 +288,89 @@ def test_search_entities(milvus_backend: MilvusEntityBackend, monkeypatch):
     assert result_3[0].content == "Test content"
 
 
+@pytest.mark.unit
+def test_add_entity_passes_float32_embedding(milvus_backend: MilvusEntityBackend, monkeypatch):
+    """Embeddings reach pymilvus as contiguous float32 arrays, not lists or float64."""
+    insert = Mock(return_value={"ids": [7]})
+    monkeypatch.setattr(milvus_backend.milvus, "insert", insert)
+    monkeypatch.setattr(milvus_backend.embedding_model, "encode", lambda text, **kwargs: np.full(384, 0.5, dtype=np.float64))
+
+    entity_id = milvus_backend._add_entity("test_namespace", "fact", "content", 0, {})
+
+    assert entity_id == "7"
+    embedding = insert.call_args[1]["data"]["embedding"]
+    assert isinstance(embedding, np.ndarray)
+    assert embedding.dtype == np.float32
+    assert embedding.flags["C_CONTIGUOUS"]
+    assert embedding.shape == (384,)
+
+
+@pytest.mark.unit
+def test_update_entities_without_conflict_resolution_batches_encode_and_insert(milvus_backend: MilvusEntityBackend, monkeypatch):
+    """Without conflict resolution, a batch is embedded with one encode call and written with one insert."""
+    insert = Mock(return_value={"ids": [1, 2, 3]})
+
+    def encode_to_tensor(texts, **kwargs):
+        tensor = Mock()
+        tensor.float.return_value.cpu.return_value.numpy.return_value = np.ones((len(texts), 384))
+        return tensor
+
+    encode = Mock(side_effect=encode_to_tensor)
+    monkeypatch.setattr(milvus_backend.milvus, "has_collection", always_has_collection)
+    monkeypatch.setattr(milvus_backend.milvus, "insert", insert)
+    monkeypatch.setattr(milvus_backend.milvus, "flush", Mock())
+    monkeypatch.setattr(milvus_backend.milvus, "load_collection", Mock())
+    monkeypatch.setattr(milvus_backend.embedding_model, "encode", encode)
+
+    entities = [Entity(type="fact", content=f"Content {i}") for i in range(3)]
+    result = milvus_backend.update_entities(namespace_id="test_namespace", entities=entities, enable_conflict_resolution=False)
+
+    assert [update.id for update in result] == ["1", "2", "3"]
+    assert all(update.event == "ADD" for update in result)
+    encode.assert_called_once()
+    assert encode.call_args.args[0] == ["Content 0", "Content 1", "Content 2"]
+    assert encode.call_args.kwargs["convert_to_tensor"] is True
+    insert.assert_called_once()
+    rows = insert.call_args.kwargs["data"]
+    assert len(rows) == 3
+    assert all(row["embedding"].dtype == np.float32 for row in rows)
+
+
+@pytest.mark.unit
+def test_iter_entities_pages_with_query_iterator(milvus_backend: MilvusEntityBackend, monkeypatch):
+    """iter_entities streams pages from query_iterator and applies metadata filters client-side."""
+    rows = [
+        {"id": i, "type": "fact", "content": f"c{i}", "created_at": 0, "metadata": {"user_id": "u" if i % 2 else "x"}} for i in range(1, 7)
+    ]
+    iterator = Mock()
+    iterator.next.side_effect = [rows[:3], rows[3:], []]
+    query_iterator = Mock(return_value=iterator)
+    monkeypatch.setattr(milvus_backend.milvus, "has_collection", always_has_collection)
+    monkeypatch.setattr(milvus_backend.milvus, "query_iterator", query_iterator)
+
+    pages = list(milvus_backend.iter_entities("test_namespace", filters={"type": "fact", "metadata.user_id": "u"}, limit=2, page_size=3))
+
+    assert [[e.id for e in page] for page in pages] == [["1", "3"]]
+    assert query_iterator.call_args.kwargs["limit"] == -1
+    assert query_iterator.call_args.kwargs["batch_size"] == 3
+    assert query_iterator.call_args.kwargs["filter"] == 'id > 0 AND type == "fact"'
+    iterator.close.assert_called_once()
+
+
+@pytest.mark.unit
+def test_iter_entities_returns_nothing_on_raw_data_assertion(milvus_backend: MilvusEntityBackend, monkeypatch):
+    """The HasRawData assertion yields no pages, matching _search_entities_impl's empty-result fallback."""
+    from pymilvus.exceptions import MilvusException
+
+    iterator = Mock()
+    iterator.next.side_effect = MilvusException(message="HasRawData assertion failed")
+    monkeypatch.setattr(milvus_backend.milvus, "has_collection", always_has_collection)
+    monkeypatch.setattr(milvus_backend.milvus, "query_iterator", Mock(return_value=iterator))
+
+    assert list(milvus_backend.iter_entities("test_namespace")) == []
+    iterator.close.assert_called_once()
+
+
 @pytest.mark.unit
 def test_split_filters_skips_none_values(milvus_backend: MilvusEntityBackend):
     """Test _split_filters ignores None values while preserving schema/metadata routing."""
@@ -486,3 +607,22 @@ def test_parse_milvus_entity_accepts_epoch_zero_created_at():
     )
 
     assert parsed.created_at == datetime.datetime.fromtimestamp(0, datetime.UTC)
+
+
+@pytest.mark.unit
+def test_search_entities_pushes_down_id_list(milvus_backend: MilvusEntityBackend, monkeypatch):
+    """An ``id`` list becomes an ``id in [...]`` expression and no longer forces a 1000-row overfetch."""
+    calls = []
+
+    def query(collection_name, filter="", output_fields=None, limit=None, **kwargs):
+        calls.append((filter, limit))
+        now = int(datetime.datetime.now(datetime.UTC).timestamp())
+        return [{"id": i, "type": "fact", "content": f"c{i}", "created_at": now, "metadata": {}} for i in (3, 7)]
+
+    monkeypatch.setattr(milvus_backend.milvus, "has_collection", always_has_collection)
+    monkeypatch.setattr(milvus_backend.milvus, "query", query)
+
+    result = milvus_backend.search_entities("test_namespace", filters={"id": ["7", "3", "nope"]}, limit=5)
+
+    assert calls == [("id > 0 AND id in [3, 7]", 5)]
+    assert [e.id for e in result] == ["3", "7"]
@@ -1,6 +1,7 @@
 """Tests for Phoenix Sync functionality."""
 
 import json
+import threading
 import warnings
 from unittest.mock import MagicMock, patch, Mock
 
@@ -198,6 +199,33 @@ class TestExtractMessagesFromSpan:
         assert completions[0]["role"] == "assistant"
         assert completions[0]["content"] == "20"
 
+    def test_extract_indexed_tool_calls_in_index_order(self, phoenix_sync):
+        """Indexed tool calls and tool results are attached to their own message, ordered numerically."""
+        span = {
+            "attributes": {
+                "llm.input_messages.10.message.role": "tool",
+                "llm.input_messages.10.message.content": "sunny",
+                "llm.input_messages.10.message.tool_call_id": "call_1",
+                "llm.input_messages.2.message.role": "assistant",
+                "llm.input_messages.2.message.tool_calls.1.tool_call.id": "call_2",
+                "llm.input_messages.2.message.tool_calls.1.tool_call.function.name": "get_time",
+                "llm.input_messages.2.message.tool_calls.0.tool_call.id": "call_1",
+                "llm.input_messages.2.message.tool_calls.0.tool_call.function.name": "get_weather",
+                "llm.input_messages.2.message.tool_calls.0.tool_call.function.arguments": '{"city": "Paris"}',
+                "llm.output_messages.0.message.role": "assistant",
+                "llm.output_messages.0.message.contents.0.message_content.text": "It is sunny.",
+            }
+        }
+        messages = phoenix_sync._extract_messages_from_span(span)
+
+        assert [(m["type"], m["index"]) for m in messages] == [("prompt", 2), ("prompt", 10), ("completion", 0)]
+        assert messages[0]["tool_calls"] == [
+            {"tool_call.id": "call_1", "tool_call.function.name": "get_weather", "tool_call.function.arguments": '{"city": "Paris"}'},
+            {"tool_call.id": "call_2", "tool_call.function.name": "get_time", "tool_call.function.arguments": "{}"},
+        ]
+        assert messages[1]["tool_call_id"] == "call_1"
+        assert messages[2]["content"] == "It is sunny."
+
 
 # =============================================================================
 # _convert_to_openai_format() Tests
@@ -627,7 +655,9 @@ class TestSync:
         phoenix_sync.client.update_entities.assert_called()
 
         # Verify provenance metadata is persisted in guideline entities
-        guideline_update_call = phoenix_sync.client.update_entities.call_args_list[-1]
+        guideline_update_call = next(
+            c for c in phoenix_sync.client.update_entities.call_args_list if c.kwargs["enable_conflict_resolution"]
+        )
         guideline_entities = guideline_update_call.kwargs["entities"]
         assert all(e.metadata.get("task_description") == "Hello" for e in guideline_entities)
         assert all(e.metadata.get("source_task_id") == "t1" for e in guideline_entities)
@@ -725,6 +755,148 @@ class TestSync:
         assert len(result.errors) == 1
         assert "Guideline generation failed" in result.errors[0]
 
+    @patch("altk_evolve.sync.phoenix_sync.urllib.request.urlopen")
+    @patch("altk_evolve.sync.phoenix_sync.generate_guidelines")
+    def test_sync_batches_trajectory_writes(self, mock_generate_guidelines, mock_urlopen, phoenix_sync):
+        """Trajectories in one batch are stored with a single update_entities call."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(
+            {
+                "data": [
+                    {
+                        "name": "litellm_request",
+                        "context": {"trace_id": f"t{i}", "span_id": f"s{i}"},
+                        "start_time": "2024-01-15T10:00:00Z",
+                        "attributes": {
+                            "gen_ai.request.model": "claude-3",
+                            "gen_ai.prompt.0.role": "user",
+                            "gen_ai.prompt.0.content": f"Message {i}",
+                        },
+                    }
+                    for i in range(3)
+                ],
+                "next_cursor": None,
+            }
+        ).encode()
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        phoenix_sync.client.search_entities.return_value = []
+        mock_guideline = MagicMock()
+        mock_guideline.content = "Guideline content"
+        mock_generate_guidelines.return_value = [GuidelineGenerationResult(guidelines=[mock_guideline], task_description="task")]
+
+        with patch("altk_evolve.config.guidelines.guidelines_settings.guidelines_mode", "regular"):
+            result = phoenix_sync.sync(limit=10, batch_size=2, concurrency=2)
+
+        assert result.processed == 3
+        assert result.guidelines_generated == 3
+        assert result.errors == []
+        trajectory_calls = [c for c in phoenix_sync.client.update_entities.call_args_list if not c.kwargs["enable_conflict_resolution"]]
+        assert [len(c.kwargs["entities"]) for c in trajectory_calls] == [2, 1]
+        guideline_calls = [c for c in phoenix_sync.client.update_entities.call_args_list if c.kwargs["enable_conflict_resolution"]]
+        assert len(guideline_calls) == 3
+
+    @patch("altk_evolve.sync.phoenix_sync.urllib.request.urlopen")
+    @patch("altk_evolve.sync.phoenix_sync.generate_guidelines")
+    def test_sync_generates_next_batch_while_storing(self, mock_generate_guidelines, mock_urlopen, phoenix_sync):
+        """The next batch's guideline generation overlaps with the current batch's writes."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(
+            {
+                "data": [
+                    {
+                        "name": "litellm_request",
+                        "context": {"trace_id": f"t{i}", "span_id": f"s{i}"},
+                        "start_time": "2024-01-15T10:00:00Z",
+                        "attributes": {
+                            "gen_ai.request.model": "claude-3",
+                            "gen_ai.prompt.0.role": "user",
+                            "gen_ai.prompt.0.content": f"Message {i}",
+                        },
+                    }
+                    for i in range(2)
+                ],
+                "next_cursor": None,
+            }
+        ).encode()
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        second_batch_generating = threading.Event()
+        overlapped = []
+        mock_guideline = MagicMock()
+        mock_guideline.content = "Guideline content"
+
+        def generate(messages):
+            if messages[0]["content"] == "Message 1":
+                second_batch_generating.set()
+            return [GuidelineGenerationResult(guidelines=[mock_guideline], task_description="task")]
+
+        def update_entities(namespace_id, entities, enable_conflict_resolution):
+            if enable_conflict_resolution and not overlapped:
+                overlapped.append(second_batch_generating.wait(timeout=5))
+
+        mock_generate_guidelines.side_effect = generate
+        phoenix_sync.client.search_entities.return_value = []
+        phoenix_sync.client.update_entities.side_effect = update_entities
+
+        with patch("altk_evolve.config.guidelines.guidelines_settings.guidelines_mode", "regular"):
+            result = phoenix_sync.sync(limit=10, batch_size=1, concurrency=2)
+
+        assert result.processed == 2
+        assert overlapped == [True]
+
+    @patch("altk_evolve.sync.phoenix_sync.urllib.request.urlopen")
+    @patch("altk_evolve.sync.phoenix_sync.generate_guidelines")
+    def test_sync_skips_trajectory_write_when_guideline_write_fails(self, mock_generate_guidelines, mock_urlopen, phoenix_sync):
+        """A trace whose guidelines fail to store keeps no trajectory entity, so the next run retries it."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(
+            {
+                "data": [
+                    {
+                        "name": "litellm_request",
+                        "context": {"trace_id": f"t{i}", "span_id": f"s{i}"},
+                        "start_time": "2024-01-15T10:00:00Z",
+                        "attributes": {
+                            "gen_ai.request.model": "claude-3",
+                            "gen_ai.prompt.0.role": "user",
+                            "gen_ai.prompt.0.content": f"Message {i}",
+                        },
+                    }
+                    for i in range(2)
+                ],
+                "next_cursor": None,
+            }
+        ).encode()
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        phoenix_sync.client.search_entities.return_value = []
+        mock_guideline = MagicMock()
+        mock_guideline.content = "Guideline content"
+        mock_generate_guidelines.return_value = [GuidelineGenerationResult(guidelines=[mock_guideline], task_description="task")]
+
+        def update_entities(namespace_id, entities, enable_conflict_resolution):
+            if enable_conflict_resolution and phoenix_sync.client.update_entities.call_count == 1:
+                raise RuntimeError("write failed")
+            return []
+
+        phoenix_sync.client.update_entities.side_effect = update_entities
+
+        with patch("altk_evolve.config.guidelines.guidelines_settings.guidelines_mode", "regular"):
+            result = phoenix_sync.sync(limit=10, concurrency=1)
+
+        assert result.processed == 1
+        assert len(result.errors) == 1
+        trajectory_call = phoenix_sync.client.update_entities.call_args_list[-1]
+        assert trajectory_call.kwargs["enable_conflict_resolution"] is False
+        assert [e.metadata["trace_id"] for e in trajectory_call.kwargs["entities"]] == ["t1"]
+
 
 # =============================================================================
 # _ensure_namespace() Tests
@@ -1117,7 +1289,7 @@ class TestBuildTrajectoryForTrace:
 
 
 # =============================================================================
-# _process_trajectory guidelines_mode Tests
+# _generate_entities guidelines_mode Tests
 # =============================================================================
 
 SAMPLE_TRAJECTORY = {
@@ -1149,7 +1321,7 @@ def _make_guideline_result(content="Always test your code."):
 
 @pytest.mark.unit
 class TestProcessTrajectoryGuidelinesMode:
-    """Tests for the EVOLVE_GUIDELINES_MODE dispatch in _process_trajectory."""
+    """Tests for the EVOLVE_GUIDELINES_MODE dispatch in _generate_entities."""
 
     def _make_sync(self):
         with patch("altk_evolve.sync.phoenix_sync.EvolveClient") as mock_client_class:
@@ -1163,6 +1335,12 @@ class TestProcessTrajectoryGuidelinesMode:
             sync.client = mock_client
             return sync, mock_client
 
+    @staticmethod
+    def _process(sync, trajectory):
+        _, guideline_entities = sync._generate_entities(trajectory)
+        sync._store_guidelines(guideline_entities)
+        return len(guideline_entities)
+
     def test_regular_mode_calls_only_generate_guidelines(self):
         sync, mock_client = self._make_sync()
         with (
@@ -1172,7 +1350,7 @@ class TestProcessTrajectoryGuidelinesMode:
         ):
             mock_regular.return_value = [_make_guideline_result()]
 
-            sync._process_trajectory(SAMPLE_TRAJECTORY)
+            self._process(sync, SAMPLE_TRAJECTORY)
 
             mock_regular.assert_called_once()
             mock_consistency.assert_not_called()
@@ -1185,7 +1363,7 @@ class TestProcessTrajectoryGuidelinesMode:
         ):
             mock_regular.return_value = [_make_guideline_result()]
 
-            sync._process_trajectory(SAMPLE_TRAJECTORY)
+            self._process(sync, SAMPLE_TRAJECTORY)
 
             guideline_call = mock_client.update_entities.call_args_list[-1][1]
             entities = guideline_call["entities"]
@@ -1202,7 +1380,7 @@ class TestProcessTrajectoryGuidelinesMode:
         ):
             mock_consistency.return_value = [_make_guideline_result("Use deterministic prompts.")]
 
-            sync._process_trajectory(SAMPLE_TRAJECTORY)
+            self._process(sync, SAMPLE_TRAJECTORY)
 
             mock_regular.assert_not_called()
             mock_consistency.assert_called_once()
@@ -1215,7 +1393,7 @@ class TestProcessTrajectoryGuidelinesMode:
         ):
             mock_consistency.return_value = [_make_guideline_result("Use deterministic prompts.")]
 
-            sync._process_trajectory(SAMPLE_TRAJECTORY)
+            self._process(sync, SAMPLE_TRAJECTORY)
 
             guideline_call = mock_client.update_entities.call_args_list[-1][1]
             entities = guideline_call["entities"]
@@ -1233,7 +1411,7 @@ class TestProcessTrajectoryGuidelinesMode:
             mock_regular.return_value = [_make_guideline_result("Write tests.")]
             mock_consistency.return_value = [_make_guideline_result("Use deterministic prompts.")]
 
-            sync._process_trajectory(SAMPLE_TRAJECTORY)
+            self._process(sync, SAMPLE_TRAJECTORY)
 
             mock_regular.assert_called_once()
             mock_consistency.assert_called_once()
@@ -1248,7 +1426,7 @@ class TestProcessTrajectoryGuidelinesMode:
             mock_regular.return_value = [_make_guideline_result("Write tests.")]
             mock_consistency.return_value = [_make_guideline_result("Use deterministic prompts.")]
 
-            count = sync._process_trajectory(SAMPLE_TRAJECTORY)
+            count = self._process(sync, SAMPLE_TRAJECTORY)
 
             assert count == 2
             guideline_call = mock_client.update_entities.call_args_list[-1][1]
@@ -1267,9 +1445,12 @@ class TestProcessTrajectoryGuidelinesMode:
             mock_regular.return_value = [_make_guideline_result("Write tests.")]
             mock_consistency.return_value = [_make_guideline_result("Use deterministic prompts.")]
 
-            sync._process_trajectory(SAMPLE_TRAJECTORY)
+            trajectory_entity, _ = sync._generate_entities(SAMPLE_TRAJECTORY)
+            mock_client.update_entities.reset_mock()
+            self._process(sync, SAMPLE_TRAJECTORY)
 
-            # update_entities is called twice total: once for trajectory storage, once for all guidelines
-            assert mock_client.update_entities.call_count == 2
+            # Both pipelines merge into one guideline write; the trajectory entity is returned for the caller to store
+            assert trajectory_entity is not None and trajectory_entity.type == "trajectory"
+            assert mock_client.update_entities.call_count == 1
             guideline_call = mock_client.update_entities.call_args_list[-1][1]
             assert guideline_call["enable_conflict_resolution"] is True
@@ -7,6 +7,7 @@ import datetime
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 
+from altk_evolve.backend.embedding_daemon import EmbeddingDaemonClient
 from altk_evolve.backend.postgres import PostgresEntityBackend
 from altk_evolve.config.postgres import PostgresDBSettings
 from altk_evolve.schema.core import Entity, Namespace, RecordedEntity
@@ -21,7 +22,7 @@ def postgres_backend() -> PostgresEntityBackend:
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector"),
-        patch("altk_evolve.backend.postgres.SentenceTransformer") as mock_transformer,
+        patch("sentence_transformers.SentenceTransformer") as mock_transformer,
     ):
         mock_conn = MagicMock()
         mock_conn.closed = False
@@ -31,6 +32,12 @@ def postgres_backend() -> PostgresEntityBackend:
         return backend
 
 
+@pytest.fixture(autouse=True)
+def no_search_cache(postgres_backend, monkeypatch):
+    """The backend fixture is module-scoped and tests remock search results per query, so cached searches would leak across tests."""
+    monkeypatch.setattr(postgres_backend.search_cache, "size", 0)
+
+
 @pytest.fixture
 def db_manager():
     """Create a mock SQLiteManager for testing."""
@@ -92,7 +99,7 @@ def test_postgres_backend_initialization_ensures_extension_before_registering_ve
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector", side_effect=lambda _conn: call_order.append("register_vector")),
-        patch("altk_evolve.backend.postgres.SentenceTransformer") as mock_transformer,
+        patch("sentence_transformers.SentenceTransformer") as mock_transformer,
         patch.object(
             PostgresEntityBackend,
             "_ensure_pgvector_extension",
@@ -146,7 +153,7 @@ def test_postgres_backend_initialization_auto_creates_missing_database():
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector", side_effect=lambda _conn: call_order.append("register_vector")),
-        patch("altk_evolve.backend.postgres.SentenceTransformer") as mock_transformer,
+        patch("sentence_transformers.SentenceTransformer") as mock_transformer,
         patch.object(
             PostgresEntityBackend,
             "_ensure_pgvector_extension",
@@ -205,7 +212,7 @@ def test_postgres_backend_initialization_auto_creates_with_fallback_bootstrap_db
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector", side_effect=lambda _conn: call_order.append("register_vector")),
-        patch("altk_evolve.backend.postgres.SentenceTransformer") as mock_transformer,
+        patch("sentence_transformers.SentenceTransformer") as mock_transformer,
         patch.object(
             PostgresEntityBackend,
             "_ensure_pgvector_extension",
@@ -276,7 +283,7 @@ def test_postgres_backend_initialization_handles_database_creation_race_conditio
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector"),
-        patch("altk_evolve.backend.postgres.SentenceTransformer") as mock_transformer,
+        patch("sentence_transformers.SentenceTransformer") as mock_transformer,
         patch.object(PostgresEntityBackend, "_ensure_pgvector_extension", autospec=True),
     ):
         # First call: try to connect to target db (fails - doesn't exist)
@@ -314,7 +321,7 @@ def test_postgres_backend_initialization_missing_database_without_auto_create_ra
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector"),
-        patch("altk_evolve.backend.postgres.SentenceTransformer"),
+        patch("sentence_transformers.SentenceTransformer"),
         patch.object(PostgresEntityBackend, "_ensure_pgvector_extension", autospec=True),
     ):
         mock_psycopg.connect.side_effect = MissingDatabaseError("database does not exist")
@@ -339,7 +346,7 @@ def test_postgres_backend_initialization_closes_connection_on_setup_failure():
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector", side_effect=RuntimeError("register failed")),
-        patch("altk_evolve.backend.postgres.SentenceTransformer"),
+        patch("sentence_transformers.SentenceTransformer"),
         patch.object(PostgresEntityBackend, "_ensure_pgvector_extension", autospec=True),
     ):
         mock_conn = MagicMock()
@@ -366,7 +373,7 @@ def test_postgres_backend_initialization_rejects_invalid_embedding_dimension():
     with (
         patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
         patch("altk_evolve.backend.postgres.register_vector"),
-        patch("altk_evolve.backend.postgres.SentenceTransformer") as mock_transformer,
+        patch("sentence_transformers.SentenceTransformer") as mock_transformer,
         patch.object(PostgresEntityBackend, "_ensure_pgvector_extension", autospec=True),
     ):
         mock_conn = MagicMock()
@@ -411,6 +418,30 @@ def test_create_namespace(postgres_backend: PostgresEntityBackend, db_manager, m
     assert any(call.args == (postgres_backend.embedding_dim,) for call in mock_literal.call_args_list)
 
 
+@pytest.mark.unit
+def test_create_table_builds_hnsw_index_and_search_uses_ef_search():
+    backend = PostgresEntityBackend.__new__(PostgresEntityBackend)
+    backend._settings = PostgresDBSettings(hnsw_m=24, hnsw_ef_construction=96, hnsw_ef_search=48)
+    backend.embedding_dim = 384
+    backend.conn = MagicMock()
+    mock_cursor = backend.conn.cursor.return_value.__enter__.return_value
+    original_identifier, original_literal = sql.Identifier, sql.Literal
+
+    with (
+        patch("altk_evolve.backend.postgres.sql.Identifier", side_effect=lambda value: original_identifier(value)) as mock_identifier,
+        patch("altk_evolve.backend.postgres.sql.Literal", side_effect=lambda value: original_literal(value)) as mock_literal,
+    ):
+        backend._create_table("ns1")
+        backend._configure_search(backend.conn)
+
+    table = backend._table_name("ns1")
+    assert mock_cursor.execute.call_count == 2
+    assert any(call.args == (f"{table}_embedding_hnsw_idx",) for call in mock_identifier.call_args_list)
+    literals = [call.args for call in mock_literal.call_args_list]
+    assert (24,) in literals and (96,) in literals and (48,) in literals
+    backend.conn.execute.assert_called_once()
+
+
 @pytest.mark.unit
 def test_get_namespace_details(postgres_backend: PostgresEntityBackend, db_manager, monkeypatch):
     """Test retrieving namespace details."""
@@ -471,6 +502,29 @@ def test_search_namespaces(postgres_backend: PostgresEntityBackend, db_manager,
     assert result[1].num_entities == 42
 
 
+@pytest.mark.unit
+def test_search_namespaces_lite_counts_in_one_query(postgres_backend: PostgresEntityBackend, db_manager):
+    """Counts for every existing table come from one UNION ALL statement; missing tables count as zero."""
+    created_at = datetime.datetime.now(datetime.UTC)
+    db_manager.search_namespaces = Mock(return_value=[Namespace(id=ns, created_at=created_at) for ns in ("a", "missing", "b")])
+
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.side_effect = [[("ns_a",), ("ns_b",)], [("a", 3), ("b", 0)]]
+    mock_cursor_context = MagicMock()
+    mock_cursor_context.__enter__ = Mock(return_value=mock_cursor)
+    mock_cursor_context.__exit__ = Mock(return_value=False)
+
+    with (
+        patch.object(postgres_backend.conn, "cursor", return_value=mock_cursor_context),
+        patch("altk_evolve.backend.postgres.SQLiteManager", return_value=db_manager),
+    ):
+        result = postgres_backend.search_namespaces_lite(limit=10)
+
+    assert result == [("a", 3), ("missing", 0), ("b", 0)]
+    assert mock_cursor.execute.call_count == 2
+    assert isinstance(mock_cursor.execute.call_args_list[1].args[0], sql.Composed)
+
+
 @pytest.mark.unit
 def test_delete_namespace(postgres_backend: PostgresEntityBackend, db_manager, monkeypatch):
     """Test deleting a namespace."""
@@ -580,6 +634,57 @@ def test_search_entities(postgres_backend: PostgresEntityBackend, monkeypatch):
         assert result_3[0].id == "123"
 
 
+@pytest.mark.unit
+def test_type_filtered_search_keeps_recall_in_mixed_type_namespace(postgres_backend: PostgresEntityBackend, monkeypatch):
+    """A type-filtered search scans the matching rows exactly instead of filtering the HNSW candidates.
+
+    The fake cursor plays pgvector: a statement that orders the table itself by distance is served by
+    the index, which yields only ``ef_search`` candidates before WHERE applies; any other statement is exact.
+    """
+    import numpy as np
+
+    ef_search = 4
+    # Eight trajectories sit nearer the query than any guideline.
+    rows = [("trajectory", 0.1 * i) for i in range(8)] + [("guideline", 1.0 + 0.1 * i) for i in range(3)]
+    now_dt = datetime.datetime.now(datetime.UTC)
+    statements: list[str] = []
+    original_sql = sql.SQL
+
+    def capture_sql(text):
+        statements.append(text)
+        return original_sql(text)
+
+    def execute(stmt, params):
+        text = next(t for t in reversed(statements) if "<=>" in t)
+        served_by_index = text.lstrip().startswith("SELECT") and "WHERE" in text.split("ORDER BY")[0]
+        ranked = sorted(range(len(rows)), key=lambda i: rows[i][1])
+        if served_by_index:
+            ranked = ranked[:ef_search]
+        wanted_type = params[0] if len(params) > 2 else None
+        matches = [i for i in ranked if wanted_type is None or rows[i][0] == wanted_type][: params[-1]]
+        mock_cursor.fetchall.return_value = [
+            RecordedEntity(id=str(i), type=rows[i][0], content=f"row {i}", created_at=now_dt, metadata={}) for i in matches
+        ]
+
+    monkeypatch.setattr(postgres_backend, "_table_exists", make_table_exists(True))
+    monkeypatch.setattr(postgres_backend.embedding_model, "encode", lambda text: np.array([0.1] * 384))
+    mock_cursor = MagicMock()
+    mock_cursor.execute.side_effect = execute
+    mock_cursor_context = MagicMock()
+    mock_cursor_context.__enter__ = Mock(return_value=mock_cursor)
+    mock_cursor_context.__exit__ = Mock(return_value=False)
+
+    with (
+        patch.object(postgres_backend.conn, "cursor", return_value=mock_cursor_context),
+        patch("altk_evolve.backend.postgres.sql.SQL", side_effect=capture_sql),
+    ):
+        guidelines = postgres_backend.search_entities(namespace_id="test_namespace", query="q", filters={"type": "guideline"}, limit=3)
+        nearest = postgres_backend.search_entities(namespace_id="test_namespace", query="q", limit=3)
+
+    assert [entity.type for entity in guidelines] == ["guideline"] * 3
+    assert [entity.id for entity in nearest] == ["0", "1", "2"]
+
+
 @pytest.mark.unit
 def test_search_entities_routes_prefixed_metadata_filters(postgres_backend: PostgresEntityBackend, monkeypatch):
     """Test that metadata filters require and honor the metadata. prefix."""
@@ -719,3 +824,115 @@ def test_update_entity_metadata_rejects_non_numeric_id(postgres_backend: Postgre
     """Raises EvolveException immediately for non-numeric entity IDs."""
     with pytest.raises(EvolveException, match="must be numeric"):
         postgres_backend.update_entity_metadata("test_namespace", "not-an-id", {"visibility": "public"})
+
+
+@pytest.mark.unit
+def test_postgres_backend_uses_embedding_daemon_client_when_enabled(monkeypatch):
+    monkeypatch.setattr("altk_evolve.config.evolve.evolve_config.embedding_daemon", True)
+    config = PostgresDBSettings(
+        host="127.0.0.2",
+        port=6543,
+        user="postgres",
+        password="postgres",  # pragma: allowlist secret
+        dbname="evolve",
+        embedding_model="custom-model",
+    )
+
+    with (
+        patch("altk_evolve.backend.postgres.psycopg") as mock_psycopg,
+        patch("altk_evolve.backend.postgres.register_vector"),
+        patch("sentence_transformers.SentenceTransformer") as mock_transformer,
+        patch.object(EmbeddingDaemonClient, "get_sentence_embedding_dimension", return_value=384),
+        patch.object(PostgresEntityBackend, "_ensure_pgvector_extension", autospec=True),
+    ):
+        mock_conn = MagicMock()
+        mock_conn.closed = False
+        mock_psycopg.connect.return_value = mock_conn
+        backend = PostgresEntityBackend(config)
+
+    assert isinstance(backend.embedding_model, EmbeddingDaemonClient)
+    assert backend.embedding_model.model_name == "custom-model"
+    assert backend.embedding_dim == 384
+    mock_transformer.assert_not_called()
+
+
+@pytest.mark.unit
+def test_iter_entities_uses_keyset_pagination(postgres_backend: PostgresEntityBackend, monkeypatch):
+    """Pages are fetched with ``id > last_id ORDER BY id`` rather than OFFSET, and an ID list is pushed down."""
+    monkeypatch.setattr(postgres_backend, "_table_exists", make_table_exists(True))
+    created_at = datetime.datetime.now(datetime.UTC)
+    pages = [
+        [RecordedEntity(id=str(i), type="fact", content=f"c{i}", created_at=created_at) for i in (1, 2)],
+        [RecordedEntity(id="5", type="fact", content="c5", created_at=created_at)],
+    ]
+
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.side_effect = pages
+    mock_cursor_context = MagicMock()
+    mock_cursor_context.__enter__ = Mock(return_value=mock_cursor)
+    mock_cursor_context.__exit__ = Mock(return_value=False)
+
+    with patch.object(postgres_backend.conn, "cursor", return_value=mock_cursor_context):
+        result = list(postgres_backend.iter_entities("test_namespace", filters={"id": ["1", "2", "5"]}, limit=10, page_size=2))
+
+    assert [[e.id for e in page] for page in result] == [["1", "2"], ["5"]]
+    params = [c.args[1] for c in mock_cursor.execute.call_args_list]
+    assert params == [[[1, 2, 5], 0, 2], [[1, 2, 5], 2, 2]]
+
+
+@pytest.mark.unit
+def test_get_entities_batch_uses_one_union_query(postgres_backend: PostgresEntityBackend):
+    """Existing namespaces are read with a single UNION ALL statement; missing ones are left out."""
+    created_at = int(datetime.datetime.now(datetime.UTC).timestamp())
+    columns = ["namespace_id", "id", "type", "content", "created_at", "metadata"]
+
+    mock_cursor = MagicMock()
+    mock_cursor.description = [Mock() for _ in columns]
+    for col, name in zip(mock_cursor.description, columns):
+        col.name = name
+    mock_cursor.fetchall.side_effect = [
+        [("ns_a",), ("ns_b",)],
+        [("a", 1, "fact", "c1", created_at, {}), ("b", 7, "fact", "c7", created_at, {}), ("a", 2, "fact", "c2", created_at, {})],
+    ]
+    mock_cursor_context = MagicMock()
+    mock_cursor_context.__enter__ = Mock(return_value=mock_cursor)
+    mock_cursor_context.__exit__ = Mock(return_value=False)
+
+    with patch.object(postgres_backend.conn, "cursor", return_value=mock_cursor_context):
+        batch = postgres_backend.get_entities_batch(["a", "missing", "b"], limit_per=10)
+
+    assert {namespace_id: [e.id for e in entities] for namespace_id, entities in batch.items()} == {"a": ["1", "2"], "b": ["7"]}
+    assert mock_cursor.execute.call_count == 2
+    union_stmt, union_params = mock_cursor.execute.call_args_list[1].args
+    assert isinstance(union_stmt, sql.Composed)
+    assert union_params == [10, 10]
+
+
+@pytest.mark.unit
+def test_read_conn_pools_connections_for_concurrent_reads():
+    """Reads reuse the main connection, open extras only while it is taken, and fail after pool_timeout when all are busy."""
+    import queue
+    import threading
+
+    backend = PostgresEntityBackend.__new__(PostgresEntityBackend)
+    backend._settings = PostgresDBSettings(read_pool_size=2, pool_timeout=0.01)
+    backend.conn = MagicMock(closed=False, broken=False)
+    backend._read_pool = queue.LifoQueue()
+    backend._read_pool.put(backend.conn)
+    backend._read_pool_opened = 1
+    backend._read_pool_lock = threading.Lock()
+    extra = MagicMock(closed=False, broken=False)
+
+    with patch.object(backend, "_connect", return_value=extra) as connect, patch("altk_evolve.backend.postgres.register_vector"):
+        with backend._read_conn() as first:
+            assert first is backend.conn
+            with backend._read_conn() as second:
+                assert second is extra
+                with pytest.raises(EvolveException, match="read connection"):
+                    with backend._read_conn():
+                        pass
+        with backend._read_conn() as again:
+            assert again is backend.conn
+
+    connect.assert_called_once()
+    assert backend._read_pool.qsize() == 2
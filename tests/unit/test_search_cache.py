@@ -0,0 +1,168 @@
+"""Tests for the semantic search cache and its wiring into search_entities."""
+
+import datetime
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from altk_evolve.backend.filesystem import FilesystemEntityBackend
+from altk_evolve.backend.search_cache import SemanticSearchCache
+from altk_evolve.config.cache import CacheSettings
+from altk_evolve.config.filesystem import FilesystemSettings
+from altk_evolve.schema.core import Entity, RecordedEntity
+
+
+def _entity(entity_id: str) -> RecordedEntity:
+    return RecordedEntity(id=entity_id, type="note", content=f"c{entity_id}", created_at=datetime.datetime.now(datetime.UTC))
+
+
+@pytest.mark.unit
+class TestSemanticSearchCache:
+    def test_exact_query_hit_returns_copies(self):
+        cache = SemanticSearchCache(size=8, threshold=0.95, ttl=60)
+        cache.put("ns", "hello", None, 5, [_entity("1")])
+
+        first = cache.get("ns", "hello", None, 5)
+        first[0].metadata["mutated"] = True
+
+        assert [e.id for e in cache.get("ns", "hello", None, 5)] == ["1"]
+        assert cache.get("ns", "hello", None, 5)[0].metadata == {}
+
+    def test_exact_match_ignores_case_and_whitespace(self):
+        cache = SemanticSearchCache(size=8, threshold=0.95, ttl=60)
+        cache.put("ns", "Fix the  login bug", None, 5, [_entity("1")])
+
+        assert [e.id for e in cache.get("ns", " fix the login BUG\n", None, 5)] == ["1"]
+        assert cache.get("ns", "fix the logout bug", None, 5) is None
+
+    def test_near_duplicate_embedding_hits_and_distant_misses(self):
+        cache = SemanticSearchCache(size=8, threshold=0.95, ttl=60)
+        cache.put("ns", "hello", None, 5, [_entity("1")], embedding=np.array([1.0, 0.0, 0.0]))
+
+        assert cache.get("ns", "hello there", None, 5, embedding=np.array([0.99, 0.05, 0.0])) is not None
+        assert cache.get("ns", "goodbye", None, 5, embedding=np.array([0.0, 1.0, 0.0])) is None
+
+    def test_key_includes_filters_and_limit(self):
+        cache = SemanticSearchCache(size=8, threshold=0.95, ttl=60)
+        cache.put("ns", "q", {"type": "note"}, 5, [_entity("1")])
+
+        assert cache.get("ns", "q", {"type": "note"}, 5) is not None
+        assert cache.get("ns", "q", {"type": "fact"}, 5) is None
+        assert cache.get("ns", "q", {"type": "note"}, 10) is None
+        assert cache.get("other", "q", {"type": "note"}, 5) is None
+
+    def test_lru_eviction_and_ttl_expiry(self, monkeypatch):
+        cache = SemanticSearchCache(size=2, threshold=0.95, ttl=60)
+        cache.put("ns", "a", None, 5, [])
+        cache.put("ns", "b", None, 5, [])
+        cache.get("ns", "a", None, 5)
+        cache.put("ns", "c", None, 5, [])
+
+        assert cache.get("ns", "b", None, 5) is None
+        assert cache.get("ns", "a", None, 5) == []
+
+        now = time.monotonic()
+        monkeypatch.setattr("altk_evolve.backend.search_cache.time.monotonic", lambda: now + 61)
+        assert cache.get("ns", "a", None, 5) is None
+
+    def test_invalidate_is_per_namespace(self):
+        cache = SemanticSearchCache(size=8, threshold=0.95, ttl=60)
+        cache.put("ns", "q", None, 5, [], embedding=np.ones(3))
+        cache.put("other", "q", None, 5, [])
+
+        cache.invalidate("ns")
+
+        assert cache.get("ns", "q", None, 5, embedding=np.ones(3)) is None
+        assert cache.get("other", "q", None, 5) == []
+
+
+class _EmbeddingFilesystemBackend(FilesystemEntityBackend):
+    """Filesystem backend with a toy query embedding, so search_entities goes through the cache."""
+
+    def __init__(self, data_dir: str, listings: bool = False):
+        super().__init__(FilesystemSettings(data_dir=data_dir))
+        # The cache is opt-in, so enable it explicitly.
+        self.__dict__["_search_cache"] = SemanticSearchCache(size=8, threshold=0.95, ttl=60, listings=listings)
+        self.impl_calls = 0
+        self.embed_calls = 0
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        self.embed_calls += 1
+        return np.array([query.count(letter) for letter in "aeiou"], dtype=np.float32) + 0.01
+
+    def _search_entities_impl(self, namespace_id, query=None, filters=None, limit=10):
+        self.impl_calls += 1
+        return super()._search_entities_impl(namespace_id, query, filters, limit)
+
+
+@pytest.mark.unit
+def test_search_entities_uses_cache_until_a_write(tmp_path: Path):
+    backend = _EmbeddingFilesystemBackend(str(tmp_path))
+    backend.create_namespace("ns")
+    backend.update_entities("ns", [Entity(content="alpha", type="note")], enable_conflict_resolution=False)
+    backend.impl_calls = 0
+
+    assert [e.content for e in backend.search_entities("ns", query="alpha")] == ["alpha"]
+    assert [e.content for e in backend.search_entities("ns", query="alpha")] == ["alpha"]
+    assert backend.impl_calls == 1
+    assert backend.embed_calls == 1
+
+    backend.update_entities("ns", [Entity(content="alpha two", type="note")], enable_conflict_resolution=False)
+
+    assert len(backend.search_entities("ns", query="alpha")) == 2
+    assert backend.impl_calls == 2
+    # The write emptied the search cache, but the query's embedding is reused.
+    assert backend.embed_calls == 1
+
+
+@pytest.mark.unit
+def test_cache_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("EVOLVE_SEMCACHE_SIZE", raising=False)
+    cache_settings = CacheSettings(_env_file=None)
+
+    assert not SemanticSearchCache(cache_settings.size, cache_settings.threshold, cache_settings.ttl).enabled
+
+
+@pytest.mark.unit
+def test_backends_without_query_embeddings_skip_the_cache(tmp_path: Path):
+    backend = FilesystemEntityBackend(FilesystemSettings(data_dir=str(tmp_path)))
+    backend.create_namespace("ns")
+    backend.update_entities("ns", [Entity(content="alpha", type="note")], enable_conflict_resolution=False)
+
+    backend.search_entities("ns", query="alpha")
+
+    assert backend.search_cache.get("ns", "alpha", None, 10) is None
+
+
+@pytest.mark.unit
+def test_listings_skip_the_cache_unless_enabled(tmp_path: Path):
+    backend = _EmbeddingFilesystemBackend(str(tmp_path))
+    backend.create_namespace("ns")
+    backend.update_entities("ns", [Entity(content="alpha", type="note")], enable_conflict_resolution=False)
+    backend.impl_calls = 0
+
+    backend.search_entities("ns", filters={"type": "note"}, limit=5)
+    backend.search_entities("ns", filters={"type": "note"}, limit=5)
+
+    assert backend.impl_calls == 2
+    assert backend.search_cache.get("ns", None, {"type": "note"}, 5) is None
+
+
+@pytest.mark.unit
+def test_listings_are_cached_until_a_write(tmp_path: Path):
+    backend = _EmbeddingFilesystemBackend(str(tmp_path), listings=True)
+    backend.create_namespace("ns")
+    backend.update_entities("ns", [Entity(content="alpha", type="note")], enable_conflict_resolution=False)
+    backend.impl_calls = 0
+
+    assert len(backend.search_entities("ns", filters={"type": "note"}, limit=5)) == 1
+    assert len(backend.search_entities("ns", filters={"type": "note"}, limit=5)) == 1
+    assert backend.impl_calls == 1
+    assert backend.embed_calls == 0
+
+    backend.update_entities("ns", [Entity(content="beta", type="note")], enable_conflict_resolution=False)
+
+    assert len(backend.search_entities("ns", filters={"type": "note"}, limit=5)) == 2
+    assert backend.impl_calls == 2
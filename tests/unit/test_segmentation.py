@@ -1,4 +1,5 @@
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -26,8 +27,8 @@ def _mock_completion(content: str) -> MagicMock:
 
 
 @patch("altk_evolve.llm.guidelines.segmentation.completion")
-@patch("altk_evolve.llm.guidelines.segmentation.get_supported_openai_params", return_value=[])
-@patch("altk_evolve.llm.guidelines.segmentation.supports_response_schema", return_value=False)
+@patch("litellm.get_supported_openai_params", return_value=[])
+@patch("litellm.supports_response_schema", return_value=False)
 def test_segment_trajectory_returns_subtasks(mock_schema, mock_params, mock_completion):
     mock_completion.return_value = _mock_completion(VALID_SEGMENTATION_JSON)
 
@@ -44,8 +45,8 @@ def test_segment_trajectory_returns_subtasks(mock_schema, mock_params, mock_comp
 
 
 @patch("altk_evolve.llm.guidelines.segmentation.completion")
-@patch("altk_evolve.llm.guidelines.segmentation.get_supported_openai_params", return_value=[])
-@patch("altk_evolve.llm.guidelines.segmentation.supports_response_schema", return_value=False)
+@patch("litellm.get_supported_openai_params", return_value=[])
+@patch("litellm.supports_response_schema", return_value=False)
 def test_segment_trajectory_propagates_non_parse_errors(mock_schema, mock_params, mock_completion):
     mock_completion.side_effect = Exception("LLM unavailable")
 
@@ -56,8 +57,8 @@ def test_segment_trajectory_propagates_non_parse_errors(mock_schema, mock_params
 
 
 @patch("altk_evolve.llm.guidelines.segmentation.completion")
-@patch("altk_evolve.llm.guidelines.segmentation.get_supported_openai_params", return_value=[])
-@patch("altk_evolve.llm.guidelines.segmentation.supports_response_schema", return_value=False)
+@patch("litellm.get_supported_openai_params", return_value=[])
+@patch("litellm.supports_response_schema", return_value=False)
 def test_segment_trajectory_retries_on_parse_failure(mock_schema, mock_params, mock_completion):
     bad = _mock_completion("not valid json at all")
     good = _mock_completion(VALID_SEGMENTATION_JSON)
@@ -72,8 +73,8 @@ def test_segment_trajectory_retries_on_parse_failure(mock_schema, mock_params, m
 
 
 @patch("altk_evolve.llm.guidelines.segmentation.completion")
-@patch("altk_evolve.llm.guidelines.segmentation.get_supported_openai_params", return_value=[])
-@patch("altk_evolve.llm.guidelines.segmentation.supports_response_schema", return_value=False)
+@patch("litellm.get_supported_openai_params", return_value=[])
+@patch("litellm.supports_response_schema", return_value=False)
 def test_segment_trajectory_returns_empty_after_max_retries(mock_schema, mock_params, mock_completion):
     mock_completion.return_value = _mock_completion("not valid json at all")
 
@@ -110,3 +111,74 @@ def test_subtask_segment_accepts_valid_range():
     )
     assert seg.start_step == 3
     assert seg.end_step == 7
+
+
+def test_generate_guidelines_runs_subtask_generations_concurrently():
+    from altk_evolve.llm.guidelines import guidelines
+    from altk_evolve.schema.guidelines import GuidelineGenerationResult
+
+    messages = [
+        {"role": "user", "content": "Do something"},
+        {"role": "assistant", "content": "Step 1 done"},
+        {"role": "assistant", "content": "Step 2 done"},
+    ]
+    subtasks = [
+        SubtaskSegment(generalized_description="First", start_step=1, end_step=1, purpose="a"),
+        SubtaskSegment(generalized_description="Second", start_step=2, end_step=2, purpose="b"),
+    ]
+    both_running = threading.Barrier(2, timeout=5)
+
+    def generate_for_segment(task_description, trajectory_slice, num_steps, constrained_decoding_supported):
+        # Only passes if both subtask generations are in flight at the same time.
+        both_running.wait()
+        return GuidelineGenerationResult(guidelines=[], task_description=task_description)
+
+    with (
+        patch("altk_evolve.llm.guidelines.segmentation.segment_trajectory", return_value=subtasks),
+        patch.object(guidelines, "_generate_guidelines_for_segment", side_effect=generate_for_segment),
+        patch("litellm.get_supported_openai_params", return_value=[]),
+        patch("litellm.supports_response_schema", return_value=False),
+        patch.object(guidelines.evolve_config, "segmentation_enabled", True),
+    ):
+        results = guidelines.generate_guidelines(messages)
+
+    assert [result.task_description for result in results] == ["First", "Second"]
+
+
+@patch("altk_evolve.llm.guidelines.segmentation.completion")
+def test_generate_guidelines_parses_trajectory_once_when_segmenting(mock_completion):
+    from altk_evolve.llm.guidelines import guidelines
+    from altk_evolve.schema.guidelines import GuidelineGenerationResult
+
+    mock_completion.return_value = _mock_completion(VALID_SEGMENTATION_JSON)
+    result = GuidelineGenerationResult(guidelines=[], task_description="Do something")
+
+    with (
+        patch.object(guidelines, "parse_openai_agents_trajectory", wraps=guidelines.parse_openai_agents_trajectory) as parse,
+        patch.object(guidelines, "_generate_guidelines_for_segment", return_value=result),
+        patch("litellm.get_supported_openai_params", return_value=[]),
+        patch("litellm.supports_response_schema", return_value=False),
+        patch.object(guidelines.evolve_config, "segmentation_enabled", True),
+    ):
+        guidelines.generate_guidelines(MESSAGES)
+
+    mock_completion.assert_called_once()
+    parse.assert_called_once_with(MESSAGES)
+
+
+def test_structured_output_support_probes_once_per_model():
+    from altk_evolve.utils.utils import structured_output_support
+
+    with (
+        patch("litellm.get_supported_openai_params", return_value=["response_format"]) as get_params,
+        patch("litellm.supports_response_schema", return_value=True) as supports_schema,
+    ):
+        for _ in range(3):
+            assert structured_output_support("some-model", None) == (True, True)
+
+        structured_output_support.cache_clear()
+        assert structured_output_support("some-model", None) == (True, True)
+
+    assert get_params.call_count == 2
+    get_params.assert_called_with(model="some-model", custom_llm_provider=None)
+    assert supports_schema.call_count == 2
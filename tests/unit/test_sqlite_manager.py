@@ -0,0 +1,105 @@
+"""Tests for SQLiteManager connection sharing."""
+
+import pytest
+
+from altk_evolve.db import sqlite_manager
+from altk_evolve.db.sqlite_manager import SQLiteManager
+from altk_evolve.schema.exceptions import NamespaceAlreadyExistsException
+
+
+@pytest.fixture(autouse=True)
+def fresh_connections():
+    sqlite_manager.close_shared_connections()
+    yield
+    sqlite_manager.close_shared_connections()
+
+
+@pytest.mark.unit
+def test_managers_share_one_connection_per_path(tmp_path):
+    db_path = str(tmp_path / "ns.sqlite.db")
+
+    with SQLiteManager(db_path) as first:
+        first.create_namespace("ns")
+        connection = first.connection
+    with SQLiteManager(db_path) as second:
+        assert second.connection is connection
+        assert second.get_namespace("ns") is not None
+
+    # Leaving the context releases the manager but keeps the shared handle open.
+    assert connection.execute("SELECT COUNT(*) FROM namespaces").fetchone() == (1,)
+
+
+@pytest.mark.unit
+def test_schema_is_created_once_per_connection(tmp_path, monkeypatch):
+    calls = []
+    original = SQLiteManager._create_namespace_table
+    monkeypatch.setattr(SQLiteManager, "_create_namespace_table", lambda self: calls.append(1) or original(self))
+    db_path = str(tmp_path / "ns.sqlite.db")
+
+    for _ in range(3):
+        with SQLiteManager(db_path) as manager:
+            manager.search_namespaces()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_deleted_database_file_is_reopened(tmp_path):
+    db_path = tmp_path / "ns.sqlite.db"
+    with SQLiteManager(str(db_path)) as manager:
+        manager.create_namespace("ns")
+    db_path.unlink()
+
+    with SQLiteManager(str(db_path)) as manager:
+        assert manager.search_namespaces() == []
+    assert db_path.exists()
+
+
+@pytest.mark.unit
+def test_in_memory_databases_are_not_shared():
+    with SQLiteManager(":memory:") as first:
+        first.create_namespace("ns")
+        with SQLiteManager(":memory:") as second:
+            assert second.connection is not first.connection
+            assert second.get_namespace("ns") is None
+
+
+@pytest.mark.unit
+def test_connection_uses_wal_and_autocommit(tmp_path):
+    with SQLiteManager(str(tmp_path / "ns.sqlite.db")) as manager:
+        assert manager.connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert manager.connection.execute("PRAGMA synchronous").fetchone() == (1,)  # NORMAL
+        manager.create_namespace("ns")
+        assert not manager.connection.in_transaction
+
+
+@pytest.mark.unit
+def test_reset_recreates_an_empty_table(tmp_path):
+    with SQLiteManager(str(tmp_path / "ns.sqlite.db")) as manager:
+        manager.create_namespace("ns")
+        manager.reset()
+        assert manager.search_namespaces() == []
+        manager.create_namespace("ns")
+        assert manager.get_namespace("ns") is not None
+
+
+@pytest.mark.unit
+def test_create_namespaces_inserts_batch_with_one_timestamp(tmp_path):
+    with SQLiteManager(str(tmp_path / "ns.sqlite.db")) as manager:
+        created = manager.create_namespaces(["a", "b", "c"])
+
+        assert [ns.id for ns in created] == ["a", "b", "c"]
+        assert len({ns.created_at for ns in created}) == 1
+        assert sorted(ns.id for ns in manager.search_namespaces()) == ["a", "b", "c"]
+
+
+@pytest.mark.unit
+def test_create_namespaces_is_all_or_nothing(tmp_path):
+    with SQLiteManager(str(tmp_path / "ns.sqlite.db")) as manager:
+        manager.create_namespace("b")
+
+        with pytest.raises(NamespaceAlreadyExistsException):
+            manager.create_namespaces(["a", "b"])
+
+        assert [ns.id for ns in manager.search_namespaces()] == ["b"]
+        assert not manager.connection.in_transaction